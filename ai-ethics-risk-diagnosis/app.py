@@ -1,9 +1,14 @@
 """
 AI 윤리성 리스크 진단 시스템 - 메인 실행 스크립트
 """
+import argparse
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime
+from typing import Dict, List
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -12,17 +17,27 @@ from src.config import (
     TARGET_SERVICES,
     GUIDELINE_PATHS,
     VECTOR_STORE_PATH,
-    OUTPUT_PATHS
+    OUTPUT_PATHS,
+    BATCH_MAX_WORKERS,
+    BATCH_EXECUTOR
 )
 from src.state import EthicsRiskState
 from src.utils import (
-    load_pdf_documents,
     VectorStoreManager,
     save_json,
-    generate_filename
+    generate_filename,
+    close_http_client
 )
 from src.tools import RAGRetriever
-from src.graph import create_workflow, print_workflow_structure
+from src.graph import (
+    create_workflow,
+    print_workflow_structure,
+    create_checkpointer,
+    generate_run_id,
+    run_config,
+    find_resume_config,
+    is_run_completed
+)
 
 
 def setup_vector_store() -> VectorStoreManager:
@@ -44,14 +59,10 @@ def setup_vector_store() -> VectorStoreManager:
         try:
             vsm.load_vector_store()
             print("✅ Vector store loaded successfully")
-            return vsm
         except Exception as e:
             print(f"⚠️ Could not load vector store: {e}")
             print("   Creating new vector store...")
     
-    # 새로운 Vector Store 생성
-    print("\n📚 Loading guideline documents...")
-    
     # 가이드라인 문서 확인
     available_guidelines = [path for path in GUIDELINE_PATHS if os.path.exists(path)]
     
@@ -61,19 +72,23 @@ def setup_vector_store() -> VectorStoreManager:
         print("   Expected files:")
         for path in GUIDELINE_PATHS:
             print(f"     - {path}")
-        print("\n   Continuing without RAG functionality...")
-        return vsm
-    
-    print(f"   Found {len(available_guidelines)} guideline documents")
+        
+        # 매니페스트가 없는 (이전 버전) Vector Store는 청크 출처를 알 수 없으므로 그대로 사용
+        if vsm.vector_store is None or not vsm.manifest.get("sources"):
+            if vsm.vector_store is None:
+                print("\n   Continuing without RAG functionality...")
+            return vsm
     
-    # 문서 로드 및 Vector Store 생성
-    documents = load_pdf_documents(available_guidelines)
+    # 추가/변경/삭제된 가이드라인 문서만 반영 (PDF 내용 해시 기준, 모두 삭제된 경우 포함)
+    print(f"\n📚 Syncing {len(available_guidelines)} guideline documents...")
+    changes = vsm.sync_documents(available_guidelines)
+    print(f"   ➕ Added: {changes['added']}, 🗑️  Removed: {changes['removed']}, "
+          f"✔️  Unchanged: {changes['unchanged']}")
     
-    if documents:
-        vsm.create_vector_store(documents)
+    if changes["added"] or changes["removed"]:
         vsm.save_vector_store()
-        print("\n✅ Vector store created and saved")
-    else:
+        print("\n✅ Vector store updated and saved")
+    elif vsm.vector_store is None:
         print("\n⚠️ No documents loaded for vector store")
     
     return vsm
@@ -107,25 +122,40 @@ def create_initial_state(service_name: str) -> EthicsRiskState:
     }
 
 
-def run_diagnosis(service_name: str, workflow_app):
+def run_diagnosis(service_name: str, workflow_app, run_id: str = None, resume: bool = False):
     """
     단일 서비스에 대한 윤리성 진단 실행
     
     Args:
-        service_name: 분석 대상 AI 서비스명
+        service_name: 분석 대상 AI 서비스명 (resume 시에는 체크포인트의 서비스명 사용)
         workflow_app: 컴파일된 워크플로우
+        run_id: 실행 ID (체크포인트 thread_id, 미지정 시 새로 생성)
+        resume: True면 run_id의 마지막 성공 노드 이후부터 재개
     """
+    if resume:
+        if is_run_completed(workflow_app, run_id):
+            print(f"\n✅ Run already completed: {run_id} (nothing to resume)")
+            return None
+        config = find_resume_config(workflow_app, run_id)
+        if config is None:
+            print(f"\n❌ No resumable checkpoint found for run: {run_id}")
+            return None
+        service_name = workflow_app.get_state(config).values["target_service"]
+        workflow_input = None  # 체크포인트 State에서 이어서 실행
+    else:
+        run_id = run_id or generate_run_id(service_name)
+        config = run_config(run_id)
+        workflow_input = create_initial_state(service_name)
+    
     print("\n" + "="*60)
-    print(f"🎯 DIAGNOSIS START: {service_name}")
+    print(f"🎯 DIAGNOSIS {'RESUME' if resume else 'START'}: {service_name}")
     print("="*60)
+    print(f"🆔 Run ID: {run_id}")
     print(f"⏰ Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # 초기 State 생성
-    initial_state = create_initial_state(service_name)
-    
     try:
-        # 워크플로우 실행
-        final_state = workflow_app.invoke(initial_state)
+        # 워크플로우 실행 (노드마다 체크포인트 저장)
+        final_state = workflow_app.invoke(workflow_input, config)
         
         # 결과 저장
         if final_state.get("final_report"):
@@ -147,6 +177,7 @@ def run_diagnosis(service_name: str, workflow_app):
             print(f"\n⚠️ Completed with errors:")
             for error in final_state["errors"]:
                 print(f"   - {error}")
+            print(f"   ↻ Resume with: python app.py --resume {run_id}")
         
         print(f"\n⏰ End Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
@@ -154,13 +185,261 @@ def run_diagnosis(service_name: str, workflow_app):
         
     except Exception as e:
         print(f"\n❌ Diagnosis failed: {str(e)}")
+        print(f"   ↻ Resume with: python app.py --resume {run_id}")
         import traceback
         traceback.print_exc()
         return None
 
 
+def load_vector_store() -> VectorStoreManager:
+    """
+    이미 만들어진 Vector Store를 읽기 전용으로 로드 (동기화/저장하지 않음)
+    
+    Returns:
+        VectorStoreManager 인스턴스 (저장된 Vector Store가 없으면 비어 있음)
+    """
+    vsm = VectorStoreManager()
+    if os.path.exists(VECTOR_STORE_PATH):
+        try:
+            vsm.load_vector_store()
+        except Exception as e:
+            print(f"⚠️ Could not load vector store: {e}")
+    return vsm
+
+
+def build_workflow_app(sync_vector_store: bool = True):
+    """
+    Vector Store 초기화 후 워크플로우 생성
+    
+    Args:
+        sync_vector_store: False면 가이드라인 동기화 없이 저장된 Vector Store만 로드
+            (프로세스 풀 워커용 - 동기화/저장은 부모 프로세스에서 한 번만 수행)
+    
+    Returns:
+        컴파일된 워크플로우
+    """
+    # 출력 디렉토리 생성
+    for path in OUTPUT_PATHS.values():
+        os.makedirs(path, exist_ok=True)
+    
+    # Vector Store 초기화
+    vsm = setup_vector_store() if sync_vector_store else load_vector_store()
+    rag_retriever = RAGRetriever(vsm)
+    
+    # 워크플로우 생성 (SQLite 체크포인터 연결)
+    print("\n🔄 Creating workflow...")
+    workflow_app = create_workflow(rag_retriever, checkpointer=create_checkpointer())
+    print("✅ Workflow created successfully")
+    
+    return workflow_app
+
+
+def load_service_list(path: str) -> List[str]:
+    """
+    배치 진단 대상 서비스 목록 로드
+    
+    Args:
+        path: 서비스 목록 파일
+            - .jsonl: 한 줄에 하나씩 문자열 또는 {"service": "..."} 객체
+            - 그 외: 한 줄에 서비스명 하나 (빈 줄과 # 주석은 무시)
+    
+    Returns:
+        서비스명 리스트 (중복 제거, 입력 순서 유지)
+    """
+    services = []
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            
+            if path.endswith(".jsonl"):
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    item = item.get("service") or item.get("target_service") or item.get("name")
+                if not isinstance(item, str) or not item.strip():
+                    raise ValueError(f"{path}:{line_no}: service name not found")
+                line = item.strip()
+            
+            if line not in services:
+                services.append(line)
+    
+    return services
+
+
+def summarize_result(service_name: str, run_id: str, final_state: Dict, elapsed: float) -> Dict:
+    """배치 결과 파일에 기록할 서비스별 요약 (실패 시 run_id로 --resume 가능)"""
+    final_state = final_state or {}
+    ethics_evaluation = final_state.get("ethics_evaluation") or {}
+    errors = final_state.get("errors") or ([] if final_state else ["Diagnosis failed"])
+    
+    return {
+        "service": service_name,
+        "run_id": run_id,
+        "success": bool(final_state) and not errors,
+        "overall_score": ethics_evaluation.get("overall_score"),
+        "overall_risk_level": ethics_evaluation.get("overall_risk_level"),
+        "errors": errors,
+        "elapsed_sec": round(elapsed, 2),
+        "finished_at": datetime.now().isoformat()
+    }
+
+
+# 프로세스 풀 워커별 워크플로우 (워커 프로세스마다 한 번 생성)
+_worker_app = None
+
+
+def _init_batch_worker():
+    """
+    프로세스 풀 워커 초기화 - 컴파일된 워크플로우는 pickle할 수 없으므로 워커에서 생성
+    
+    Vector Store는 부모 프로세스가 이미 동기화해 두었으므로 로드만 한다.
+    """
+    global _worker_app
+    _worker_app = build_workflow_app(sync_vector_store=False)
+
+
+def _run_batch_item(service_name: str, run_id: str, workflow_app=None) -> Dict:
+    """배치 단위 작업: 단일 서비스 진단 후 요약 반환 (run_id는 부모가 생성)"""
+    start = time.perf_counter()
+    final_state = run_diagnosis(service_name, workflow_app or _worker_app, run_id=run_id)
+    return summarize_result(service_name, run_id, final_state, time.perf_counter() - start)
+
+
+def run_batch(
+    services: List[str],
+    workers: int = BATCH_MAX_WORKERS,
+    executor: str = BATCH_EXECUTOR,
+    output_path: str = None
+) -> List[Dict]:
+    """
+    여러 서비스에 대한 비대화형 배치 진단
+    
+    Args:
+        services: 분석 대상 서비스명 리스트
+        workers: 동시 실행 수
+        executor: "thread" (워크플로우 공유) 또는 "process" (워커별 워크플로우)
+        output_path: 결과 JSONL 경로 (미지정 시 evaluations 디렉토리에 생성)
+    
+    Returns:
+        완료 순서대로의 서비스별 요약 리스트
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"Unknown executor: {executor} (use 'thread' or 'process')")
+    
+    os.makedirs(OUTPUT_PATHS["evaluations"], exist_ok=True)
+    output_path = output_path or os.path.join(
+        OUTPUT_PATHS["evaluations"],
+        f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    )
+    workers = max(1, min(workers, len(services)))
+    
+    print("\n" + "="*60)
+    print(f"🚀 BATCH DIAGNOSIS: {len(services)} services ({executor} pool × {workers})")
+    print("="*60)
+    
+    if executor == "thread":
+        workflow_app = build_workflow_app()
+        pool = ThreadPoolExecutor(max_workers=workers)
+        submit = lambda service, run_id: pool.submit(_run_batch_item, service, run_id, workflow_app)
+    else:
+        # 워커마다 같은 PDF를 임베딩/저장하지 않도록 부모에서 한 번만 동기화
+        setup_vector_store()
+        # 동기화에 쓴 커넥션 풀은 fork 전에 닫음 (워커는 각자 새 풀 생성)
+        close_http_client()
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker)
+        submit = lambda service, run_id: pool.submit(_run_batch_item, service, run_id)
+    
+    results = []
+    batch_start = time.perf_counter()
+    
+    with pool, open(output_path, 'a', encoding='utf-8') as out:
+        # 워커가 비정상 종료해도 --resume 할 수 있도록 run_id는 부모에서 생성해 보관
+        futures = {}
+        for service in services:
+            run_id = generate_run_id(service)
+            futures[submit(service, run_id)] = (service, run_id, time.perf_counter())
+        
+        # 완료되는 대로 결과 기록
+        for future in as_completed(futures):
+            service, run_id, submitted_at = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 워커 실패 시 소요 시간은 제출 시점부터 측정 (풀 대기 시간 포함)
+                result = summarize_result(service, run_id, None, time.perf_counter() - submitted_at)
+                result["errors"] = [f"Worker failed: {str(e)}"]
+            
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+            results.append(result)
+            
+            status = "✅" if result["success"] else "❌"
+            print(f"{status} [{len(results)}/{len(services)}] {service} "
+                  f"(score: {result['overall_score']}, {result['elapsed_sec']}s)")
+    
+    wall_time = time.perf_counter() - batch_start
+    print_batch_summary(results, wall_time, output_path)
+    
+    return results
+
+
+def print_batch_summary(results: List[Dict], wall_time: float, output_path: str):
+    """배치 처리량 요약 출력"""
+    succeeded = sum(1 for r in results if r["success"])
+    busy_time = sum(r["elapsed_sec"] for r in results)
+    
+    print("\n" + "="*60)
+    print("📊 BATCH SUMMARY")
+    print("="*60)
+    print(f"   Services: {len(results)} (✅ {succeeded} / ❌ {len(results) - succeeded})")
+    print(f"   Wall Time: {wall_time:.1f}s")
+    if results and wall_time > 0:
+        print(f"   Throughput: {len(results) / wall_time * 60:.2f} services/min")
+        print(f"   Avg Latency: {busy_time / len(results):.1f}s per service")
+        print(f"   Effective Parallelism: {busy_time / wall_time:.2f}x")
+    print(f"📁 Results: {output_path}")
+    print("="*60 + "\n")
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="AI Ethics Risk Diagnosis System")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="비대화형 배치 진단: 서비스 목록 파일 (.txt 한 줄에 하나 / .jsonl)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_MAX_WORKERS,
+        help=f"배치 동시 실행 수 (기본값: {BATCH_MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default=BATCH_EXECUTOR,
+        help=f"배치 실행 풀 종류 (기본값: {BATCH_EXECUTOR})"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="배치 결과 JSONL 경로"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="실패/중단된 진단을 마지막 성공 노드 이후부터 재개"
+    )
+    return parser.parse_args()
+
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    
     print("\n" + "="*60)
     print("🤖 AI ETHICS RISK DIAGNOSIS SYSTEM")
     print("="*60)
@@ -168,18 +447,21 @@ def main():
     print(f"Date: {datetime.now().strftime('%Y-%m-%d')}")
     print("="*60)
     
-    # 출력 디렉토리 생성
-    for path in OUTPUT_PATHS.values():
-        os.makedirs(path, exist_ok=True)
+    # 중단된 실행 재개
+    if args.resume:
+        run_diagnosis(None, build_workflow_app(), run_id=args.resume, resume=True)
+        return
     
-    # Vector Store 초기화
-    vsm = setup_vector_store()
-    rag_retriever = RAGRetriever(vsm)
+    # 비대화형 배치 모드
+    if args.batch:
+        services = load_service_list(args.batch)
+        if not services:
+            print(f"❌ No services found in {args.batch}")
+            return
+        run_batch(services, workers=args.workers, executor=args.executor, output_path=args.output)
+        return
     
-    # 워크플로우 생성
-    print("\n🔄 Creating workflow...")
-    workflow_app = create_workflow(rag_retriever)
-    print("✅ Workflow created successfully")
+    workflow_app = build_workflow_app()
     
     # 워크플로우 구조 출력
     print_workflow_structure()
@@ -245,4 +527,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        main()
+    finally:
+        # 단일/배치/재개 실행 모두 종료 시 공유 커넥션 풀 정리
+        close_http_client()
\ No newline at end of file
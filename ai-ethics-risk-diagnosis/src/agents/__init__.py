@@ -1,4 +1,5 @@
 from .service_analyzer import service_analyzer_node
-from .ethics_evaluator import ethics_evaluator_node
+from .ethics_evaluator import ethics_evaluator_node, ethics_criterion_node, ethics_aggregate_node
 from .improvement_proposer import improvement_proposer_node
-from .report_writer import report_writer_node
\ No newline at end of file
+from .report_writer import report_writer_node
+from .registry import AgentRegistry, build_agent_registry
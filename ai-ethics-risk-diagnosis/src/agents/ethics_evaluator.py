@@ -4,7 +4,7 @@
 import json
 from typing import Dict, List
 from langchain_openai import ChatOpenAI
-from src.state import EthicsRiskState
+from src.state import EthicsRiskState, CriterionState
 from src.tools import WebSearchTool, RAGRetriever
 from src.tools import calculate_risk_level, calculate_weighted_score
 from src.prompts import get_ethics_evaluation_prompt
@@ -14,17 +14,119 @@ from src.config import LLM_MODEL, LLM_TEMPERATURE, ETHICS_CRITERIA
 class EthicsEvaluatorAgent:
     """AI 윤리성 평가 에이전트"""
     
-    def __init__(self, rag_retriever: RAGRetriever):
-        self.llm = ChatOpenAI(
+    def __init__(
+        self,
+        rag_retriever: RAGRetriever,
+        llm: ChatOpenAI = None,
+        web_search: WebSearchTool = None
+    ):
+        self.llm = llm or ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE
         )
-        self.web_search = WebSearchTool()
+        self.web_search = web_search or WebSearchTool()
         self.rag_retriever = rag_retriever
     
+    def evaluate_criterion(self, criterion: str, service_name: str, service_overview: Dict):
+        """
+        단일 윤리 기준 평가 (가이드라인 검색 → 웹 검색 → LLM 평가)
+        
+        Args:
+            criterion: 윤리 기준 키
+            service_name: 분석 대상 서비스명
+            service_overview: 서비스 분석 결과
+        
+        Returns:
+            (평가 결과, 참조 가이드라인) 튜플
+        """
+        criterion_info = ETHICS_CRITERIA[criterion]
+        print(f"\n📊 Evaluating: {criterion_info['name']}")
+        
+        # 1. 가이드라인 검색
+        print(f"   📚 Retrieving guidelines for {criterion}...")
+        guidelines = self.rag_retriever.retrieve_for_criterion(
+            criterion,
+            service_context=service_overview.get('description', '')
+        )
+        
+        # 2. 웹 검색
+        print(f"   🌐 Searching ethics information...")
+        web_results = self.web_search.search_ethics_info(service_name, criterion)
+        
+        # 3. LLM 평가
+        print(f"   🤖 Analyzing with LLM...")
+        prompt = get_ethics_evaluation_prompt(
+            criterion=criterion,
+            criterion_info=criterion_info,
+            service_overview=service_overview,
+            guidelines=guidelines,
+            web_search_results=web_results
+        )
+        
+        response = self.llm.invoke(prompt)
+        eval_text = response.content
+        
+        # JSON 파싱
+        if "```json" in eval_text:
+            eval_text = eval_text.split("```json")[1].split("```")[0].strip()
+        elif "```" in eval_text:
+            eval_text = eval_text.split("```")[1].split("```")[0].strip()
+        
+        eval_result = json.loads(eval_text)
+        
+        # 리스크 레벨 계산 (점수 누락 시 기본값 5를 결과에도 기록해 종합 점수 계산과 일치시킴)
+        score = eval_result.get("score", 5)
+        eval_result["score"] = score
+        eval_result["risk_level"] = calculate_risk_level(score)
+        
+        print(f"   ✅ {criterion} Score: {score}/10 ({eval_result['risk_level']})")
+        
+        return eval_result, guidelines
+    
+    @staticmethod
+    def guideline_references(criterion: str, guidelines: List[Dict]) -> List[Dict]:
+        """참조 문서에 추가할 가이드라인 (각 기준당 1개만)"""
+        return [
+            {
+                "source": guide["source"],
+                "section": f"Related to {ETHICS_CRITERIA[criterion]['name']}",
+                "content": guide["content"][:200]
+            }
+            for guide in guidelines[:1]
+        ]
+    
+    def evaluate_branch(self, state: CriterionState) -> Dict:
+        """
+        기준별 병렬 브랜치 평가
+        
+        실패해도 예외를 올리지 않고 {"error": ...}를 평가 결과로 반환하며,
+        집계는 ethics_aggregate_node에서 수행한다.
+        
+        Args:
+            state: 기준 브랜치 입력 (서비스명, 서비스 개요, 기준)
+        
+        Returns:
+            ethics_evaluation / criterion_references 부분 업데이트
+        """
+        criterion = state["criterion"]
+        
+        try:
+            eval_result, guidelines = self.evaluate_criterion(
+                criterion, state["target_service"], state["service_overview"]
+            )
+        except Exception as e:
+            error_msg = f"Ethics evaluation failed for {criterion}: {str(e)}"
+            print(f"\n❌ {error_msg}")
+            return {"ethics_evaluation": {criterion: {"error": error_msg}}}
+        
+        return {
+            "ethics_evaluation": {criterion: eval_result},
+            "criterion_references": {criterion: self.guideline_references(criterion, guidelines)}
+        }
+    
     def evaluate(self, state: EthicsRiskState) -> EthicsRiskState:
         """
-        윤리성 리스크 평가 수행
+        윤리성 리스크 평가 수행 (기준 순차 실행)
         
         Args:
             state: 현재 상태
@@ -48,58 +150,16 @@ class EthicsEvaluatorAgent:
             criterion_scores = {}
             
             # 각 윤리 기준별 평가
-            for criterion, criterion_info in ETHICS_CRITERIA.items():
-                print(f"\n📊 Evaluating: {criterion_info['name']}")
-                
-                # 1. 가이드라인 검색
-                print(f"   📚 Retrieving guidelines for {criterion}...")
-                guidelines = self.rag_retriever.retrieve_for_criterion(
-                    criterion,
-                    service_context=service_overview.get('description', '')
-                )
-                
-                # 2. 웹 검색
-                print(f"   🌐 Searching ethics information...")
-                web_results = self.web_search.search_ethics_info(service_name, criterion)
-                
-                # 3. LLM 평가
-                print(f"   🤖 Analyzing with LLM...")
-                prompt = get_ethics_evaluation_prompt(
-                    criterion=criterion,
-                    criterion_info=criterion_info,
-                    service_overview=service_overview,
-                    guidelines=guidelines,
-                    web_search_results=web_results
+            for criterion in ETHICS_CRITERIA:
+                eval_result, guidelines = self.evaluate_criterion(
+                    criterion, service_name, service_overview
                 )
-                
-                response = self.llm.invoke(prompt)
-                eval_text = response.content
-                
-                # JSON 파싱
-                if "```json" in eval_text:
-                    eval_text = eval_text.split("```json")[1].split("```")[0].strip()
-                elif "```" in eval_text:
-                    eval_text = eval_text.split("```")[1].split("```")[0].strip()
-                
-                eval_result = json.loads(eval_text)
-                
-                # 리스크 레벨 계산
-                score = eval_result.get("score", 5)
-                eval_result["risk_level"] = calculate_risk_level(score)
-                
                 ethics_evaluation[criterion] = eval_result
-                criterion_scores[criterion] = score
-                
-                print(f"   ✅ Score: {score}/10 ({eval_result['risk_level']})")
+                criterion_scores[criterion] = eval_result["score"]
                 
                 # 참조 문서에 가이드라인 추가
                 if guidelines and state.get("references"):
-                    for guide in guidelines[:1]:  # 각 기준당 1개만
-                        state["references"].append({
-                            "source": guide["source"],
-                            "section": f"Related to {criterion_info['name']}",
-                            "content": guide["content"][:200]
-                        })
+                    state["references"].extend(self.guideline_references(criterion, guidelines))
             
             # 종합 점수 계산
             overall_score = calculate_weighted_score(criterion_scores)
@@ -130,7 +190,56 @@ class EthicsEvaluatorAgent:
         return state
 
 
-def ethics_evaluator_node(state: EthicsRiskState, rag_retriever: RAGRetriever) -> EthicsRiskState:
-    """윤리 평가 노드"""
-    agent = EthicsEvaluatorAgent(rag_retriever)
-    return agent.evaluate(state)
\ No newline at end of file
+def ethics_evaluator_node(
+    state: EthicsRiskState,
+    rag_retriever: RAGRetriever,
+    agent: EthicsEvaluatorAgent = None
+) -> EthicsRiskState:
+    """윤리 평가 노드 (agent 미지정 시 새로 생성)"""
+    agent = agent or EthicsEvaluatorAgent(rag_retriever)
+    return agent.evaluate(state)
+
+
+def ethics_criterion_node(state: CriterionState, agent: EthicsEvaluatorAgent) -> Dict:
+    """윤리 기준별 평가 노드 (기준 수만큼 Send로 병렬 실행)"""
+    return agent.evaluate_branch(state)
+
+
+def ethics_aggregate_node(state: EthicsRiskState) -> EthicsRiskState:
+    """
+    윤리 평가 집계 노드
+    
+    기준별 결과와 overall_score는 merge_ethics_evaluation 리듀서가 이미 병합했으므로,
+    여기서는 실패 여부 확인과 참조 문서/메시지 정리만 수행한다.
+    """
+    ethics_evaluation = state.get("ethics_evaluation") or {}
+    
+    failures = [
+        result["error"] for criterion, result in ethics_evaluation.items()
+        if criterion in ETHICS_CRITERIA and "error" in result
+    ]
+    if failures:
+        state["errors"].extend(failures)
+        state["current_step"] = "ethics_evaluation_failed"
+        return state
+    
+    # 참조 문서에 가이드라인 추가 (브랜치 완료 순서와 무관하게 기준 순서로)
+    criterion_references = state.get("criterion_references") or {}
+    if state.get("references"):
+        for criterion in ETHICS_CRITERIA:
+            state["references"].extend(criterion_references.get(criterion, []))
+    
+    overall_score = ethics_evaluation.get("overall_score")
+    
+    print(f"\n{'='*50}")
+    print(f"📈 Overall Score: {overall_score}/10")
+    print(f"⚠️  Overall Risk Level: {ethics_evaluation.get('overall_risk_level')}")
+    print(f"{'='*50}")
+    
+    state["current_step"] = "ethics_evaluation_completed"
+    state["messages"].append({
+        "role": "assistant",
+        "content": f"Ethics evaluation completed. Overall score: {overall_score}/10"
+    })
+    
+    return state
@@ -13,8 +13,8 @@ from src.config import LLM_MODEL, LLM_TEMPERATURE, ETHICS_CRITERIA
 class ImprovementProposerAgent:
     """개선안 제안 에이전트"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
+    def __init__(self, llm: ChatOpenAI = None):
+        self.llm = llm or ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE
         )
@@ -109,7 +109,7 @@ class ImprovementProposerAgent:
         return state
 
 
-def improvement_proposer_node(state: EthicsRiskState) -> EthicsRiskState:
-    """개선안 제안 노드"""
-    agent = ImprovementProposerAgent()
+def improvement_proposer_node(state: EthicsRiskState, agent: ImprovementProposerAgent = None) -> EthicsRiskState:
+    """개선안 제안 노드 (agent 미지정 시 새로 생성)"""
+    agent = agent or ImprovementProposerAgent()
     return agent.propose(state)
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+에이전트 레지스트리
+
+워크플로우 생성 시 에이전트를 한 번만 만들어 노드 호출 간 재사용한다.
+LLM 클라이언트는 임베딩 클라이언트(VectorStoreManager)와 같은 httpx 커넥션 풀을 공유한다.
+웹 검색은 WebSearchTool 인스턴스 하나를 공유하지만, TavilyClient는 내부에서
+requests를 직접 호출하므로 이 풀 밖에서 요청한다.
+"""
+from dataclasses import dataclass
+from langchain_openai import ChatOpenAI
+from src.tools import WebSearchTool, RAGRetriever
+from src.agents.service_analyzer import ServiceAnalyzerAgent
+from src.agents.ethics_evaluator import EthicsEvaluatorAgent
+from src.agents.improvement_proposer import ImprovementProposerAgent
+from src.agents.report_writer import ReportWriterAgent
+from src.utils.http_client import get_http_client
+from src.config import LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS
+
+
+@dataclass
+class AgentRegistry:
+    """워크플로우 노드가 사용하는 에이전트 묶음"""
+    
+    service_analyzer: ServiceAnalyzerAgent
+    ethics_evaluator: EthicsEvaluatorAgent
+    improvement_proposer: ImprovementProposerAgent
+    report_writer: ReportWriterAgent
+
+
+def build_agent_registry(rag_retriever: RAGRetriever) -> AgentRegistry:
+    """
+    에이전트 레지스트리 생성
+    
+    Args:
+        rag_retriever: RAG 검색기 인스턴스
+    
+    Returns:
+        공유 HTTP 클라이언트와 웹 검색 도구를 사용하는 AgentRegistry
+    """
+    http_client = get_http_client()
+    web_search = WebSearchTool()
+    
+    llm = ChatOpenAI(
+        model=LLM_MODEL,
+        temperature=LLM_TEMPERATURE,
+        http_client=http_client
+    )
+    report_llm = ChatOpenAI(
+        model=LLM_MODEL,
+        temperature=0.3,  # 보고서는 조금 더 창의적으로
+        max_tokens=LLM_MAX_TOKENS,
+        http_client=http_client
+    )
+    
+    return AgentRegistry(
+        service_analyzer=ServiceAnalyzerAgent(llm=llm, web_search=web_search),
+        ethics_evaluator=EthicsEvaluatorAgent(rag_retriever, llm=llm, web_search=web_search),
+        improvement_proposer=ImprovementProposerAgent(llm=llm),
+        report_writer=ReportWriterAgent(llm=report_llm)
+    )
@@ -11,8 +11,8 @@ from src.config import LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS
 class ReportWriterAgent:
     """보고서 작성 에이전트"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
+    def __init__(self, llm: ChatOpenAI = None):
+        self.llm = llm or ChatOpenAI(
             model=LLM_MODEL,
             temperature=0.3,  # 보고서는 조금 더 창의적으로
             max_tokens=LLM_MAX_TOKENS
@@ -99,7 +99,7 @@ class ReportWriterAgent:
         return state
 
 
-def report_writer_node(state: EthicsRiskState) -> EthicsRiskState:
-    """보고서 작성 노드"""
-    agent = ReportWriterAgent()
+def report_writer_node(state: EthicsRiskState, agent: ReportWriterAgent = None) -> EthicsRiskState:
+    """보고서 작성 노드 (agent 미지정 시 새로 생성)"""
+    agent = agent or ReportWriterAgent()
     return agent.write_report(state)
\ No newline at end of file
@@ -13,12 +13,12 @@ from src.config import LLM_MODEL, LLM_TEMPERATURE
 class ServiceAnalyzerAgent:
     """AI 서비스 분석 에이전트"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
+    def __init__(self, llm: ChatOpenAI = None, web_search: WebSearchTool = None):
+        self.llm = llm or ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE
         )
-        self.web_search = WebSearchTool()
+        self.web_search = web_search or WebSearchTool()
     
     def analyze(self, state: EthicsRiskState) -> EthicsRiskState:
         """
@@ -95,7 +95,7 @@ class ServiceAnalyzerAgent:
         return state
 
 
-def service_analyzer_node(state: EthicsRiskState) -> EthicsRiskState:
-    """서비스 분석 노드"""
-    agent = ServiceAnalyzerAgent()
+def service_analyzer_node(state: EthicsRiskState, agent: ServiceAnalyzerAgent = None) -> EthicsRiskState:
+    """서비스 분석 노드 (agent 미지정 시 새로 생성)"""
+    agent = agent or ServiceAnalyzerAgent()
     return agent.analyze(state)
\ No newline at end of file
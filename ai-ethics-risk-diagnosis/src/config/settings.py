@@ -16,6 +16,11 @@ LLM_MODEL = "gpt-4o-mini"
 LLM_TEMPERATURE = 0.1
 LLM_MAX_TOKENS = 4000
 
+# HTTP 커넥션 풀 설정 (에이전트 간 공유)
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_TIMEOUT = 60.0
+
 # Embedding 설정
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_CHUNK_SIZE = 1000
@@ -24,6 +29,7 @@ EMBEDDING_CHUNK_OVERLAP = 200
 # Vector Store 설정
 VECTOR_STORE_TYPE = "faiss"  # "faiss" or "chroma"
 VECTOR_STORE_PATH = "./data/vector_store"
+VECTOR_STORE_MANIFEST = "manifest.json"  # Vector Store 디렉토리 내 {PDF 해시: 청크 ID} 매니페스트
 
 # 분석 대상 AI 서비스 (최대 3개)
 TARGET_SERVICES = [
@@ -32,6 +38,14 @@ TARGET_SERVICES = [
     "Midjourney"
 ]
 
+# 체크포인트 설정 (실행 ID별 워크플로우 State 저장, --resume으로 재개)
+CHECKPOINT_DB_PATH = "./outputs/checkpoints/checkpoints.sqlite"
+CHECKPOINT_DB_TIMEOUT = 30.0  # 다른 프로세스가 쓰기 중일 때 대기 시간 (초)
+
+# 배치 진단 설정 (python app.py --batch)
+BATCH_MAX_WORKERS = 4
+BATCH_EXECUTOR = "thread"  # "thread" or "process"
+
 # 윤리 평가 기준
 ETHICS_CRITERIA = {
     "bias": {
@@ -1,2 +1,3 @@
 from .workflow import create_workflow, visualize_workflow, print_workflow_structure
-from .router import should_continue
\ No newline at end of file
+from .router import should_continue
+from .checkpointer import create_checkpointer, generate_run_id, run_config, find_resume_config, is_run_completed
@@ -0,0 +1,86 @@
+"""
+워크플로우 체크포인트 (SQLite) 및 실행 재개 유틸리티
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional
+from langgraph.checkpoint.sqlite import SqliteSaver
+from src.config import CHECKPOINT_DB_PATH, CHECKPOINT_DB_TIMEOUT, ETHICS_CRITERIA
+
+
+def create_checkpointer(db_path: str = CHECKPOINT_DB_PATH) -> SqliteSaver:
+    """
+    SQLite 체크포인터 생성
+    
+    배치 실행 시 여러 스레드가 같은 연결을 쓰므로 check_same_thread=False로 연다
+    (SqliteSaver가 내부 락으로 쓰기를 직렬화). 프로세스 풀 배치에서는 프로세스마다
+    같은 파일에 별도 연결을 열므로, WAL 모드와 잠금 대기 timeout으로
+    "database is locked" 오류를 피한다.
+    
+    Args:
+        db_path: 체크포인트 DB 경로
+    
+    Returns:
+        SqliteSaver 인스턴스
+    """
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=CHECKPOINT_DB_TIMEOUT)
+    conn.execute("PRAGMA journal_mode=WAL")
+    return SqliteSaver(conn)
+
+
+def generate_run_id(service_name: str) -> str:
+    """실행 ID 생성 (체크포인트 thread_id로 사용)"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    clean_name = service_name.replace(" ", "_").lower()
+    return f"{clean_name}_{timestamp}"
+
+
+def run_config(run_id: str) -> Dict:
+    """실행 ID에 해당하는 워크플로우 config"""
+    return {"configurable": {"thread_id": run_id}}
+
+
+def is_successful_state(values: Dict) -> bool:
+    """에러나 실패한 기준 평가가 없는 State인지 확인"""
+    if values.get("errors") or "failed" in values.get("current_step", ""):
+        return False
+    
+    ethics_evaluation = values.get("ethics_evaluation") or {}
+    return not any(
+        "error" in ethics_evaluation[criterion]
+        for criterion in ETHICS_CRITERIA
+        if criterion in ethics_evaluation
+    )
+
+
+def is_run_completed(workflow_app, run_id: str) -> bool:
+    """마지막 체크포인트가 남은 노드 없이 에러 없이 끝난 실행인지 확인"""
+    snapshot = workflow_app.get_state(run_config(run_id))
+    return bool(snapshot.values) and not snapshot.next and is_successful_state(snapshot.values)
+
+
+def find_resume_config(workflow_app, run_id: str) -> Optional[Dict]:
+    """
+    마지막으로 성공한 노드 직후의 체크포인트 찾기
+    
+    최신 체크포인트부터 거슬러 올라가며 실행할 노드가 남아 있고(next)
+    실패 흔적이 없는 첫 체크포인트를 반환한다 (입력 전 빈 체크포인트는 제외). 해당 config로 invoke(None, config)를
+    호출하면 그 지점에서 분기해 이어서 실행한다. 이미 성공적으로 완료된 실행은
+    다시 실행하지 않도록 None을 반환한다.
+    
+    Args:
+        workflow_app: 체크포인터가 연결된 컴파일된 워크플로우
+        run_id: 재개할 실행 ID
+    
+    Returns:
+        재개 지점 config (재개할 체크포인트가 없거나 이미 완료되었으면 None)
+    """
+    if is_run_completed(workflow_app, run_id):
+        return None
+    
+    for snapshot in workflow_app.get_state_history(run_config(run_id)):
+        if snapshot.next and snapshot.values and is_successful_state(snapshot.values):
+            return snapshot.config
+    return None
@@ -1,7 +1,11 @@
 """
 조건부 라우팅 로직
 """
+from typing import List, Union
+from langgraph.graph import END
+from langgraph.types import Send
 from src.state import EthicsRiskState
+from src.config import ETHICS_CRITERIA
 
 
 def should_continue(state: EthicsRiskState) -> str:
@@ -48,6 +52,26 @@ def check_service_analysis(state: EthicsRiskState) -> str:
     return should_continue(state)
 
 
+def fan_out_criteria(state: EthicsRiskState) -> Union[str, List[Send]]:
+    """
+    서비스 분석 후 윤리 기준별 평가 브랜치로 분기
+    
+    분석이 성공하면 기준 수만큼 ethics_criterion 노드를 Send로 병렬 실행하고,
+    실패하면 종료한다.
+    """
+    if should_continue(state) != "ethics_evaluation":
+        return END
+    
+    return [
+        Send("ethics_criterion", {
+            "target_service": state["target_service"],
+            "service_overview": state["service_overview"],
+            "criterion": criterion
+        })
+        for criterion in ETHICS_CRITERIA
+    ]
+
+
 def check_ethics_evaluation(state: EthicsRiskState) -> str:
     """윤리 평가 후 다음 단계 결정"""
     return should_continue(state)
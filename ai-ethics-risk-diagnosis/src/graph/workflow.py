@@ -1,76 +1,112 @@
 """
 LangGraph 워크플로우 정의
 """
-from typing import Dict
+import copy
+from typing import Callable, Dict
 from langgraph.graph import StateGraph, END
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from src.state import EthicsRiskState
 from src.agents import (
     service_analyzer_node,
-    ethics_evaluator_node,
+    ethics_criterion_node,
+    ethics_aggregate_node,
     improvement_proposer_node,
-    report_writer_node
+    report_writer_node,
+    AgentRegistry,
+    build_agent_registry
 )
 from src.graph.router import (
-    check_service_analysis,
+    fan_out_criteria,
     check_ethics_evaluation,
     check_improvement_proposals
 )
 from src.utils import VectorStoreManager
 
 
-def create_workflow(rag_retriever) -> StateGraph:
+def isolate_state(node: Callable) -> Callable:
+    """
+    노드에 State 복사본을 전달하는 래퍼
+    
+    에이전트는 state["errors"].append(...)처럼 State를 제자리 수정한 뒤 반환하는데,
+    그대로 두면 채널 값과 아직 직렬화되지 않은 체크포인트까지 함께 바뀐다.
+    """
+    return lambda state: node(copy.deepcopy(state))
+
+
+def create_workflow(
+    rag_retriever,
+    agents: AgentRegistry = None,
+    checkpointer: BaseCheckpointSaver = None
+) -> StateGraph:
     """
     AI 윤리성 리스크 진단 워크플로우 생성
     
     Args:
         rag_retriever: RAG 검색기 인스턴스
+        agents: 에이전트 레지스트리 (미지정 시 새로 생성)
+        checkpointer: 체크포인터 (지정 시 노드마다 State를 저장하며,
+            invoke 시 configurable.thread_id로 실행 ID를 넘겨야 함)
     
     Returns:
         컴파일된 StateGraph
     """
     
+    # 에이전트는 한 번만 생성해 모든 실행에서 재사용 (공유 HTTP 커넥션 풀)
+    agents = agents or build_agent_registry(rag_retriever)
+    
     # StateGraph 생성
     workflow = StateGraph(EthicsRiskState)
     
-    # 노드 추가
-    workflow.add_node("service_analysis", service_analyzer_node)
+    # 노드 추가 - 레지스트리의 에이전트를 람다로 바인딩
+    workflow.add_node(
+        "service_analysis",
+        isolate_state(lambda state: service_analyzer_node(state, agents.service_analyzer))
+    )
     
-    # ethics_evaluator는 rag_retriever가 필요하므로 람다로 래핑
+    # 윤리 평가는 기준별 브랜치(ethics_criterion)를 병렬 실행한 뒤 ethics_aggregate에서 집계
+    # (노드 이름은 State 키와 겹칠 수 없으므로 ethics_evaluation / improvement_proposals 대신 사용)
     workflow.add_node(
-        "ethics_evaluation", 
-        lambda state: ethics_evaluator_node(state, rag_retriever)
+        "ethics_criterion",
+        lambda state: ethics_criterion_node(state, agents.ethics_evaluator)
     )
+    workflow.add_node("ethics_aggregate", isolate_state(ethics_aggregate_node))
     
-    workflow.add_node("improvement_proposals", improvement_proposer_node)
-    workflow.add_node("report_generation", report_writer_node)
+    workflow.add_node(
+        "improvement_proposal",
+        isolate_state(lambda state: improvement_proposer_node(state, agents.improvement_proposer))
+    )
+    workflow.add_node(
+        "report_generation",
+        isolate_state(lambda state: report_writer_node(state, agents.report_writer))
+    )
     
     # 엣지 추가
     # 시작 -> 서비스 분석
     workflow.set_entry_point("service_analysis")
     
-    # 서비스 분석 -> 조건부 라우팅
+    # 서비스 분석 -> 기준별 평가 브랜치로 분기 (실패 시 종료)
     workflow.add_conditional_edges(
         "service_analysis",
-        check_service_analysis,
-        {
-            "ethics_evaluation": "ethics_evaluation",
-            "end": END
-        }
+        fan_out_criteria,
+        ["ethics_criterion", END]
     )
     
+    # 기준별 평가 -> 집계 (모든 브랜치가 끝난 뒤 한 번 실행)
+    workflow.add_edge("ethics_criterion", "ethics_aggregate")
+    
     # 윤리 평가 -> 조건부 라우팅
     workflow.add_conditional_edges(
-        "ethics_evaluation",
+        "ethics_aggregate",
         check_ethics_evaluation,
         {
-            "improvement_proposals": "improvement_proposals",
+            "improvement_proposals": "improvement_proposal",
             "end": END
         }
     )
     
     # 개선안 제안 -> 조건부 라우팅
     workflow.add_conditional_edges(
-        "improvement_proposals",
+        "improvement_proposal",
         check_improvement_proposals,
         {
             "report_generation": "report_generation",
@@ -82,7 +118,7 @@ def create_workflow(rag_retriever) -> StateGraph:
     workflow.add_edge("report_generation", END)
     
     # 워크플로우 컴파일
-    app = workflow.compile()
+    app = workflow.compile(checkpointer=checkpointer)
     
     return app
 
@@ -133,7 +169,7 @@ def print_workflow_structure():
       └─ LLM Analysis: Service overview
       ↓
     [2] Ethics Evaluation
-      ├─ For each criterion (bias, privacy, transparency, etc.):
+      ├─ For each criterion in parallel (bias, privacy, transparency, etc.):
       │   ├─ RAG Retrieval: Guideline documents
       │   ├─ Web Search: Ethics information
       │   └─ LLM Evaluation: Score & risk assessment
@@ -1 +1 @@
-from .graph_state import EthicsRiskState
\ No newline at end of file
+from .graph_state import EthicsRiskState, CriterionState, merge_dicts, merge_ethics_evaluation
\ No newline at end of file
@@ -3,6 +3,39 @@ LangGraph State 정의
 """
 from typing import TypedDict, List, Dict, Optional, Annotated
 from langgraph.graph.message import add_messages
+from src.config import ETHICS_CRITERIA
+from src.tools.scoring_utils import calculate_risk_level, calculate_weighted_score
+
+
+def merge_dicts(left: Optional[Dict], right: Optional[Dict]) -> Optional[Dict]:
+    """딕셔너리 병합 리듀서 (right가 None이면 기존 값 유지)"""
+    if right is None:
+        return left
+    return {**(left or {}), **right}
+
+
+def merge_ethics_evaluation(left: Optional[Dict], right: Optional[Dict]) -> Optional[Dict]:
+    """
+    윤리 평가 병합 리듀서
+    
+    기준별 병렬 브랜치가 반환한 {기준: 평가 결과}를 합치고,
+    병합된 기준 점수로 overall_score / overall_risk_level을 다시 계산한다.
+    """
+    merged = merge_dicts(left, right)
+    if not merged:
+        return merged
+    
+    criterion_scores = {
+        criterion: result["score"]
+        for criterion, result in merged.items()
+        if criterion in ETHICS_CRITERIA and isinstance(result, dict) and "score" in result
+    }
+    if criterion_scores:
+        overall_score = calculate_weighted_score(criterion_scores)
+        merged["overall_score"] = overall_score
+        merged["overall_risk_level"] = calculate_risk_level(overall_score)
+    
+    return merged
 
 
 class EthicsRiskState(TypedDict):
@@ -25,7 +58,7 @@ class EthicsRiskState(TypedDict):
     # }
     
     # 2. 윤리 리스크 평가 결과
-    ethics_evaluation: Optional[Dict]  # 윤리성 평가
+    ethics_evaluation: Annotated[Optional[Dict], merge_ethics_evaluation]  # 윤리성 평가
     # {
     #     "bias": {
     #         "score": 7.5,
@@ -41,6 +74,9 @@ class EthicsRiskState(TypedDict):
     #     "overall_risk_level": "low"
     # }
     
+    # 기준별 평가 브랜치가 참조한 가이드라인 ({기준: [가이드라인, ...]})
+    criterion_references: Annotated[Optional[Dict], merge_dicts]
+    
     # 3. 개선안 제안 결과
     improvement_proposals: Optional[List[Dict]]  # 개선 제안
     # [
@@ -70,4 +106,12 @@ class EthicsRiskState(TypedDict):
     
     # 워크플로우 제어
     current_step: str  # 현재 진행 단계
-    errors: List[str]  # 에러 로그
\ No newline at end of file
+    errors: List[str]  # 에러 로그
+
+
+class CriterionState(TypedDict):
+    """윤리 기준별 평가 브랜치 입력 (Send 페이로드)"""
+    
+    target_service: str
+    service_overview: Dict
+    criterion: str
@@ -10,6 +10,7 @@ class WebSearchTool:
     """웹 검색 도구 클래스"""
     
     def __init__(self):
+        # tavily-python은 세션/HTTP 클라이언트 주입을 지원하지 않아 공유 커넥션 풀을 쓰지 않음
         self.client = TavilyClient(api_key=TAVILY_API_KEY)
     
     def search(self, query: str, max_results: int = 5) -> List[Dict]:
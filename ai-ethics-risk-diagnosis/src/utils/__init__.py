@@ -1,3 +1,4 @@
-from .pdf_loader import load_pdf_documents
+from .pdf_loader import load_pdf_documents, load_pdf_chunks, file_content_hash
 from .vector_store import VectorStoreManager
-from .output_formatter import save_json, save_markdown, generate_filename
\ No newline at end of file
+from .output_formatter import save_json, save_markdown, generate_filename
+from .http_client import get_http_client, close_http_client
\ No newline at end of file
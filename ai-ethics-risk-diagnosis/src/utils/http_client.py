@@ -0,0 +1,55 @@
+"""
+공유 HTTP 커넥션 풀 유틸리티
+"""
+import os
+import threading
+import httpx
+from src.config import HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_TIMEOUT
+
+_client = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    프로세스 전역 keep-alive HTTP 커넥션 풀
+    
+    ChatOpenAI와 OpenAIEmbeddings가 같은 풀을 사용한다 (닫힌 뒤 호출하면 새로 생성).
+    fork된 자식 프로세스에서는 부모의 풀을 쓰지 않고 새로 만든다.
+    """
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=HTTP_TIMEOUT
+            )
+        return _client
+
+
+def close_http_client():
+    """공유 커넥션 풀 정리 (실행 종료 시 호출)"""
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _reset_after_fork():
+    """
+    fork된 자식 프로세스에서 부모의 풀 참조 제거
+    
+    부모의 keep-alive 소켓을 여러 프로세스가 함께 쓰면 요청이 섞이므로 자식은 새 풀을 만든다.
+    닫으면 부모와 공유하는 연결에 종료 신호를 보낼 수 있어 close()는 호출하지 않는다.
+    """
+    global _client, _lock
+    _client = None
+    _lock = threading.Lock()  # fork 시점에 다른 스레드가 잡고 있던 락 대체
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,41 +1,61 @@
 """
 PDF 문서 로딩 유틸리티
 """
+import hashlib
+import os
 from typing import List
 from langchain_community.document_loaders import PyPDFLoader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
+from src.config import EMBEDDING_CHUNK_SIZE, EMBEDDING_CHUNK_OVERLAP
 
 
-def load_pdf_documents(pdf_paths: List[str], chunk_size: int = 1000, chunk_overlap: int = 200) -> List[Document]:
+def file_content_hash(path: str) -> str:
+    """파일 내용의 SHA-256 해시 (파일명/경로가 바뀌어도 내용이 같으면 동일)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_id(content_hash: str, index: int) -> str:
+    """청크 ID (원본 PDF 내용 해시 + 청크 순번, 같은 내용이면 항상 같은 ID)"""
+    return f"{content_hash[:16]}_{index:05d}"
+
+
+def load_pdf_chunks(
+    pdf_path: str,
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    chunk_overlap: int = EMBEDDING_CHUNK_OVERLAP,
+    content_hash: str = None
+) -> List[Document]:
     """
-    PDF 문서들을 로드하고 청크로 분할
+    단일 PDF 문서를 로드하고 청크로 분할
+    
+    각 청크의 metadata에 source_file, content_hash, chunk_id를 기록한다.
     
     Args:
-        pdf_paths: PDF 파일 경로 리스트
+        pdf_path: PDF 파일 경로
         chunk_size: 청크 크기
         chunk_overlap: 청크 오버랩
+        content_hash: 미리 계산한 파일 해시 (미지정 시 계산)
     
     Returns:
-        Document 객체 리스트
+        Document 청크 리스트
     """
-    all_documents = []
+    content_hash = content_hash or file_content_hash(pdf_path)
     
-    for pdf_path in pdf_paths:
-        try:
-            # PDF 로드
-            loader = PyPDFLoader(pdf_path)
-            documents = loader.load()
-            
-            # 메타데이터 추가
-            for doc in documents:
-                doc.metadata["source_file"] = pdf_path.split("/")[-1]
-            
-            all_documents.extend(documents)
-            print(f"✅ Loaded: {pdf_path} ({len(documents)} pages)")
-            
-        except Exception as e:
-            print(f"❌ Error loading {pdf_path}: {e}")
+    # PDF 로드
+    loader = PyPDFLoader(pdf_path)
+    documents = loader.load()
+    
+    # 메타데이터 추가
+    for doc in documents:
+        doc.metadata["source_file"] = os.path.basename(pdf_path)
+        doc.metadata["content_hash"] = content_hash
+    
+    print(f"✅ Loaded: {pdf_path} ({len(documents)} pages)")
     
     # 텍스트 분할
     text_splitter = RecursiveCharacterTextSplitter(
@@ -45,7 +65,37 @@ def load_pdf_documents(pdf_paths: List[str], chunk_size: int = 1000, chunk_overl
         separators=["\n\n", "\n", ". ", " ", ""]
     )
     
-    chunks = text_splitter.split_documents(all_documents)
-    print(f"📄 Total chunks created: {len(chunks)}")
+    chunks = text_splitter.split_documents(documents)
+    for i, chunk in enumerate(chunks):
+        chunk.metadata["chunk_id"] = chunk_id(content_hash, i)
+    
+    return chunks
+
+
+def load_pdf_documents(
+    pdf_paths: List[str],
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    chunk_overlap: int = EMBEDDING_CHUNK_OVERLAP
+) -> List[Document]:
+    """
+    PDF 문서들을 로드하고 청크로 분할
+    
+    Args:
+        pdf_paths: PDF 파일 경로 리스트
+        chunk_size: 청크 크기
+        chunk_overlap: 청크 오버랩
+    
+    Returns:
+        Document 객체 리스트
+    """
+    all_chunks = []
+    
+    for pdf_path in pdf_paths:
+        try:
+            all_chunks.extend(load_pdf_chunks(pdf_path, chunk_size, chunk_overlap))
+        except Exception as e:
+            print(f"❌ Error loading {pdf_path}: {e}")
+    
+    print(f"📄 Total chunks created: {len(all_chunks)}")
     
-    return chunks
\ No newline at end of file
+    return all_chunks
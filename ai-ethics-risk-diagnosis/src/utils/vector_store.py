@@ -1,20 +1,32 @@
 """
 Vector Store 관리 유틸리티
 """
-from typing import List
+import json
+from typing import Dict, List
 from langchain.schema import Document
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
-from src.config import EMBEDDING_MODEL, VECTOR_STORE_PATH
+from src.config import (
+    EMBEDDING_MODEL,
+    EMBEDDING_CHUNK_SIZE,
+    EMBEDDING_CHUNK_OVERLAP,
+    VECTOR_STORE_PATH,
+    VECTOR_STORE_MANIFEST
+)
+from src.utils.pdf_loader import file_content_hash, load_pdf_chunks
+from src.utils.http_client import get_http_client
 import os
 
+MANIFEST_VERSION = 1
+
 
 class VectorStoreManager:
     """Vector Store 관리 클래스"""
     
     def __init__(self):
-        self.embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+        self.embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, http_client=get_http_client())
         self.vector_store = None
+        self.manifest = self._empty_manifest()
     
     def create_vector_store(self, documents: List[Document]) -> FAISS:
         """
@@ -27,15 +39,151 @@ class VectorStoreManager:
             FAISS vector store
         """
         print("🔄 Creating vector store...")
-        self.vector_store = FAISS.from_documents(documents, self.embeddings)
+        self.vector_store = FAISS.from_documents(
+            documents,
+            self.embeddings,
+            ids=self._document_ids(documents)
+        )
+        self.manifest = self._empty_manifest()
+        self._record_sources(documents)
         print("✅ Vector store created successfully")
         return self.vector_store
     
+    def add_documents(self, documents: List[Document]):
+        """
+        기존 Vector Store에 청크 추가 (없으면 새로 생성)
+        
+        같은 chunk_id가 이미 있으면 먼저 삭제한 뒤 추가한다.
+        """
+        if not documents:
+            return
+        if self.vector_store is None:
+            self.vector_store = FAISS.from_documents(
+                documents,
+                self.embeddings,
+                ids=self._document_ids(documents)
+            )
+        else:
+            ids = self._document_ids(documents)
+            self.delete_documents(ids or [])
+            self.vector_store.add_documents(documents, ids=ids)
+        self._record_sources(documents)
+    
+    def delete_documents(self, ids: List[str]):
+        """chunk_id 목록에 해당하는 청크 삭제 (인덱스에 없는 ID는 무시)"""
+        if not ids or self.vector_store is None:
+            return
+        stored = set(self.vector_store.index_to_docstore_id.values())
+        ids = [i for i in ids if i in stored]
+        if ids:
+            self.vector_store.delete(ids)
+    
+    def sync_documents(self, pdf_paths: List[str]) -> Dict[str, int]:
+        """
+        가이드라인 PDF 목록과 Vector Store를 증분 동기화
+        
+        매니페스트의 {PDF 내용 해시: 청크 ID}와 현재 파일 해시를 비교해
+        새로 추가/변경된 PDF만 임베딩하고, 삭제/변경 전 PDF의 청크는 인덱스에서 제거한다.
+        임베딩 모델이나 청크 설정이 바뀌었으면 전체를 다시 만든다.
+        
+        Args:
+            pdf_paths: 현재 가이드라인 PDF 경로 리스트
+        
+        Returns:
+            {"added": 추가된 PDF 수, "removed": 제거된 PDF 수, "unchanged": 유지된 PDF 수}
+        """
+        current = {}
+        for path in pdf_paths:
+            current.setdefault(file_content_hash(path), path)
+        
+        if self.vector_store is None or not self._manifest_matches_settings():
+            self.vector_store = None
+            self.manifest = self._empty_manifest()
+        
+        sources = self.manifest["sources"]
+        removed = [h for h in sources if h not in current]
+        added = [h for h in current if h not in sources]
+        
+        for content_hash in removed:
+            print(f"🗑️  Removing chunks: {sources[content_hash]['source_file']}")
+            self.delete_documents(sources.pop(content_hash)["chunk_ids"])
+        
+        for content_hash in added:
+            path = current[content_hash]
+            try:
+                chunks = load_pdf_chunks(path, content_hash=content_hash)
+            except Exception as e:
+                print(f"❌ Error loading {path}: {e}")
+                continue
+            if not chunks:
+                # 텍스트가 없는 PDF도 기록해 두어 매번 다시 파싱하지 않도록 함
+                print(f"⚠️ No text chunks: {path}")
+                sources[content_hash] = {
+                    "source_file": os.path.basename(path),
+                    "chunk_ids": []
+                }
+                continue
+            print(f"➕ Embedding {len(chunks)} chunks: {path}")
+            self.add_documents(chunks)
+        
+        return {
+            "added": sum(1 for h in added if h in sources),
+            "removed": len(removed),
+            "unchanged": len(current) - len(added)
+        }
+    
+    @staticmethod
+    def _empty_manifest() -> Dict:
+        return {
+            "version": MANIFEST_VERSION,
+            "embedding_model": EMBEDDING_MODEL,
+            "chunk_size": EMBEDDING_CHUNK_SIZE,
+            "chunk_overlap": EMBEDDING_CHUNK_OVERLAP,
+            "sources": {}  # {content_hash: {"source_file": ..., "chunk_ids": [...]}}
+        }
+    
+    def _manifest_matches_settings(self) -> bool:
+        """매니페스트가 현재 임베딩/청크 설정으로 만들어졌는지 확인"""
+        expected = self._empty_manifest()
+        return all(
+            self.manifest.get(key) == expected[key]
+            for key in ("version", "embedding_model", "chunk_size", "chunk_overlap")
+        )
+    
+    @staticmethod
+    def _document_ids(documents: List[Document]) -> List[str]:
+        """청크 ID 목록 (load_pdf_chunks로 만들지 않은 문서는 None → FAISS가 UUID 부여)"""
+        ids = [doc.metadata.get("chunk_id") for doc in documents]
+        return ids if all(ids) else None
+    
+    def _record_sources(self, documents: List[Document]):
+        """추가된 청크를 원본 PDF 해시별로 매니페스트에 기록"""
+        sources = self.manifest["sources"]
+        for doc in documents:
+            content_hash = doc.metadata.get("content_hash")
+            chunk = doc.metadata.get("chunk_id")
+            if not content_hash or not chunk:
+                continue
+            entry = sources.setdefault(content_hash, {
+                "source_file": doc.metadata.get("source_file", "Unknown"),
+                "chunk_ids": []
+            })
+            if chunk not in entry["chunk_ids"]:
+                entry["chunk_ids"].append(chunk)
+    
     def save_vector_store(self, path: str = VECTOR_STORE_PATH):
         """Vector Store 저장"""
         if self.vector_store:
             os.makedirs(os.path.dirname(path), exist_ok=True)
             self.vector_store.save_local(path)
+            
+            # 매니페스트 저장 (임시 파일 작성 후 교체)
+            manifest_path = os.path.join(path, VECTOR_STORE_MANIFEST)
+            tmp_path = f"{manifest_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, manifest_path)
+            
             print(f"💾 Vector store saved to: {path}")
     
     def load_vector_store(self, path: str = VECTOR_STORE_PATH) -> FAISS:
@@ -46,6 +194,15 @@ class VectorStoreManager:
                 self.embeddings,
                 allow_dangerous_deserialization=True
             )
+            
+            # 매니페스트가 없으면 (이전 버전에서 만든 Vector Store) 빈 매니페스트로 취급
+            manifest_path = os.path.join(path, VECTOR_STORE_MANIFEST)
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = {}
+            
             print(f"📂 Vector store loaded from: {path}")
             return self.vector_store
         else:
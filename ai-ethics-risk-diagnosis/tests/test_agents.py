@@ -1,9 +1,20 @@
 """
 에이전트 테스트
 """
+import json
+from types import SimpleNamespace
 import pytest
 from src.state import EthicsRiskState
-from src.agents import service_analyzer_node
+from src.agents import service_analyzer_node, AgentRegistry, build_agent_registry
+from src.agents import registry, service_analyzer, ethics_evaluator, improvement_proposer, report_writer
+from src.agents.service_analyzer import ServiceAnalyzerAgent
+from src.agents.ethics_evaluator import EthicsEvaluatorAgent
+from src.agents.improvement_proposer import ImprovementProposerAgent
+from src.agents.report_writer import ReportWriterAgent
+from src.config import ETHICS_CRITERIA
+from src.graph import create_workflow
+from src.tools import web_search
+from src.utils import http_client
 
 
 def test_service_analyzer_state_update():
@@ -53,4 +64,117 @@ def test_initial_state_structure():
     assert "messages" in state
     assert isinstance(state["messages"], list)
     assert state["current_step"] == "initialized"
-    assert isinstance(state["errors"], list)
\ No newline at end of file
+    assert isinstance(state["errors"], list)
+
+
+class ConstructionCounter:
+    """ChatOpenAI / TavilyClient 대체 - 생성될 때마다 인자를 기록"""
+    
+    created = []
+    
+    def __init__(self, **kwargs):
+        ConstructionCounter.created.append((type(self).__name__, kwargs))
+
+
+class FakeChatOpenAI(ConstructionCounter):
+    pass
+
+
+class FakeTavilyClient(ConstructionCounter):
+    pass
+
+
+@pytest.fixture
+def client_constructors(monkeypatch):
+    """모든 모듈의 ChatOpenAI / TavilyClient 생성을 기록하도록 대체"""
+    ConstructionCounter.created = []
+    for module in (registry, service_analyzer, ethics_evaluator, improvement_proposer, report_writer):
+        monkeypatch.setattr(module, "ChatOpenAI", FakeChatOpenAI)
+    monkeypatch.setattr(web_search, "TavilyClient", FakeTavilyClient)
+    return ConstructionCounter.created
+
+
+class FakeLLM:
+    """고정 응답을 반환하고 호출 수를 세는 LLM"""
+    
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.calls = 0
+    
+    def invoke(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(content=self.reply)
+
+
+class FakeWebSearch:
+    def search_service_info(self, service_name):
+        return [{"title": f"{service_name} 소개", "url": "https://example.com", "content": "서비스 설명"}]
+    
+    def search_ethics_info(self, service_name, criterion):
+        return [{"title": criterion, "url": "https://example.com", "content": "윤리 정보"}]
+
+
+class FakeRetriever:
+    def retrieve_for_criterion(self, criterion, service_context=""):
+        return [{"source": "EU AI Act", "page": 1, "content": f"{criterion} 가이드라인"}]
+
+
+def _initial_state(service_name):
+    return {
+        "target_service": service_name,
+        "messages": [],
+        "service_overview": None,
+        "ethics_evaluation": None,
+        "improvement_proposals": None,
+        "final_report": None,
+        "references": [],
+        "current_step": "initialized",
+        "errors": []
+    }
+
+
+def test_build_agent_registry_shares_clients(client_constructors):
+    """레지스트리가 LLM 두 개와 웹 검색 클라이언트 하나만 만들고 공유 HTTP 풀을 쓰는지 테스트"""
+    
+    agents = build_agent_registry(FakeRetriever())
+    
+    llm_kwargs = [kwargs for name, kwargs in client_constructors if name == "FakeChatOpenAI"]
+    assert len(llm_kwargs) == 2
+    assert all(kwargs["http_client"] is http_client.get_http_client() for kwargs in llm_kwargs)
+    assert [name for name, _ in client_constructors].count("FakeTavilyClient") == 1
+    assert agents.service_analyzer.web_search is agents.ethics_evaluator.web_search
+    assert agents.service_analyzer.llm is agents.ethics_evaluator.llm is agents.improvement_proposer.llm
+
+
+def test_workflow_nodes_reuse_registry_agents(client_constructors, monkeypatch):
+    """워크플로우 노드가 호출마다 클라이언트를 새로 만들지 않고 레지스트리 에이전트를 재사용하는지 테스트"""
+    
+    # Given: 가짜 LLM/검색을 주입한 레지스트리
+    monkeypatch.setattr(report_writer, "save_markdown", lambda content, filename: filename)
+    web = FakeWebSearch()
+    llms = {
+        "service": FakeLLM(json.dumps({"name": "TestService", "description": "설명", "key_features": []})),
+        "ethics": FakeLLM(json.dumps({"score": 4, "findings": ["발견사항"]})),
+        "proposal": FakeLLM(json.dumps(
+            {"criterion": "bias", "priority": "high", "recommendation": "개선안"}
+        )),
+        "report": FakeLLM("# 보고서")
+    }
+    agents = AgentRegistry(
+        service_analyzer=ServiceAnalyzerAgent(llm=llms["service"], web_search=web),
+        ethics_evaluator=EthicsEvaluatorAgent(FakeRetriever(), llm=llms["ethics"], web_search=web),
+        improvement_proposer=ImprovementProposerAgent(llm=llms["proposal"]),
+        report_writer=ReportWriterAgent(llm=llms["report"])
+    )
+    workflow_app = create_workflow(FakeRetriever(), agents=agents)
+    
+    # When: 두 서비스 진단
+    results = [workflow_app.invoke(_initial_state(name)) for name in ("ServiceA", "ServiceB")]
+    
+    # Then: 새 클라이언트 생성 없이 같은 에이전트로 모든 노드 실행
+    assert client_constructors == []
+    assert all(result["final_report"] == "# 보고서" for result in results)
+    assert all(not result["errors"] for result in results)
+    assert llms["service"].calls == 2
+    assert llms["ethics"].calls == 2 * len(ETHICS_CRITERIA)
+    assert llms["report"].calls == 2
@@ -1,8 +1,21 @@
 """
 도구 함수 테스트
 """
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
 import pytest
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from src.tools import calculate_risk_level, calculate_weighted_score
+from src.state import merge_dicts, merge_ethics_evaluation
+from src.graph.checkpointer import find_resume_config, is_successful_state
+from src.utils import http_client, vector_store
+from src.utils.pdf_loader import chunk_id
+import app
+from app import load_service_list
 
 
 def test_calculate_risk_level():
@@ -36,4 +49,284 @@ def test_calculate_weighted_score_empty():
     """빈 점수 딕셔너리 처리 테스트"""
     
     result = calculate_weighted_score({})
-    assert result == 0.0
\ No newline at end of file
+    assert result == 0.0
+
+
+def test_merge_dicts():
+    """딕셔너리 병합 리듀서 테스트"""
+    
+    assert merge_dicts(None, {"bias": ["a"]}) == {"bias": ["a"]}
+    assert merge_dicts({"bias": ["a"]}, {"privacy": ["b"]}) == {"bias": ["a"], "privacy": ["b"]}
+    assert merge_dicts({"bias": ["a"]}, {"bias": ["c"]}) == {"bias": ["c"]}
+    assert merge_dicts({"bias": ["a"]}, None) == {"bias": ["a"]}
+
+
+def test_merge_ethics_evaluation():
+    """기준별 병렬 평가 병합 및 종합 점수 재계산 테스트"""
+    
+    merged = None
+    for branch in (
+        {"bias": {"score": 8.0}},
+        {"privacy": {"score": 4.0}},
+        {"safety": {"error": "LLM 호출 실패"}},  # 점수가 없는 기준은 종합 점수에서 제외
+    ):
+        merged = merge_ethics_evaluation(merged, branch)
+    
+    expected = calculate_weighted_score({"bias": 8.0, "privacy": 4.0})
+    assert set(merged) >= {"bias", "privacy", "safety"}
+    assert merged["overall_score"] == expected
+    assert merged["overall_risk_level"] == calculate_risk_level(expected)
+
+
+def test_merge_ethics_evaluation_without_scores():
+    """점수가 없으면 종합 점수를 계산하지 않는지 테스트"""
+    
+    assert merge_ethics_evaluation(None, None) is None
+    assert merge_ethics_evaluation({}, {"safety": {"error": "실패"}}) == {"safety": {"error": "실패"}}
+
+
+def test_load_service_list_txt(tmp_path):
+    """텍스트 서비스 목록 파싱 테스트 (빈 줄/주석 무시, 중복 제거)"""
+    
+    path = tmp_path / "services.txt"
+    path.write_text("ChatGPT\n\n# 주석\n  GitHub Copilot  \nChatGPT\n", encoding="utf-8")
+    
+    assert load_service_list(str(path)) == ["ChatGPT", "GitHub Copilot"]
+
+
+def test_load_service_list_jsonl(tmp_path):
+    """JSONL 서비스 목록 파싱 테스트 (문자열 또는 service/target_service/name 객체)"""
+    
+    path = tmp_path / "services.jsonl"
+    lines = [{"service": "ChatGPT"}, "Midjourney", {"target_service": "Claude"}, {"name": "ChatGPT"}]
+    path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+    
+    assert load_service_list(str(path)) == ["ChatGPT", "Midjourney", "Claude"]
+
+
+def test_load_service_list_jsonl_missing_service(tmp_path):
+    """서비스명이 없는 JSONL 줄은 에러 발생 테스트"""
+    
+    path = tmp_path / "services.jsonl"
+    path.write_text('{"service": "ChatGPT"}\n{"workers": 4}\n', encoding="utf-8")
+    
+    with pytest.raises(ValueError, match=":2:"):
+        load_service_list(str(path))
+
+
+def test_run_batch_failure_keeps_run_id(tmp_path, monkeypatch):
+    """워커 실패 시에도 결과에 재개 가능한 run_id와 소요 시간이 남는지 테스트"""
+    
+    started = {}
+    
+    def fake_run_diagnosis(service_name, workflow_app, run_id=None, resume=False):
+        started[service_name] = run_id
+        if service_name == "Midjourney":
+            raise RuntimeError("worker crashed")
+        return {
+            "ethics_evaluation": {"overall_score": 7.0, "overall_risk_level": "low_risk"},
+            "errors": []
+        }
+    
+    monkeypatch.setattr(app, "build_workflow_app", lambda **kwargs: object())
+    monkeypatch.setattr(app, "run_diagnosis", fake_run_diagnosis)
+    output_path = tmp_path / "batch.jsonl"
+    
+    results = app.run_batch(
+        ["ChatGPT", "Midjourney"], workers=2, executor="thread", output_path=str(output_path)
+    )
+    by_service = {r["service"]: r for r in results}
+    
+    failed = by_service["Midjourney"]
+    assert not failed["success"]
+    assert failed["run_id"] == started["Midjourney"]
+    assert failed["run_id"].startswith("midjourney_")
+    assert failed["errors"] == ["Worker failed: worker crashed"]
+    assert failed["elapsed_sec"] >= 0
+    assert by_service["ChatGPT"]["run_id"] == started["ChatGPT"]
+    
+    recorded = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert {r["run_id"] for r in recorded} == set(started.values())
+
+def _uses_client(client_id):
+    """워커 프로세스의 공유 커넥션 풀이 부모의 것(client_id)인지 확인"""
+    return id(http_client.get_http_client()) == client_id
+
+
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="fork 미지원 플랫폼")
+def test_forked_worker_builds_own_http_client():
+    """프로세스 풀 워커가 부모의 keep-alive 커넥션 풀을 재사용하지 않는지 테스트"""
+    
+    parent = http_client.get_http_client()
+    try:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            assert pool.submit(_uses_client, id(parent)).result() is False
+        assert http_client.get_http_client() is parent
+    finally:
+        http_client.close_http_client()
+
+class FakeCheckpointedApp:
+    """최신 순 체크포인트 스냅샷을 돌려주는 테스트용 워크플로우"""
+    
+    def __init__(self, history):
+        self.history = history
+    
+    def get_state(self, config):
+        return self.history[0] if self.history else SimpleNamespace(next=(), values={}, config=config)
+    
+    def get_state_history(self, config):
+        return iter(self.history)
+
+
+def _snapshot(step, next_nodes, **values):
+    return SimpleNamespace(
+        next=next_nodes,
+        values={"current_step": step, "errors": [], **values} if step else {},
+        config={"configurable": {"thread_id": "run", "checkpoint_id": step or "input"}}
+    )
+
+
+def test_is_successful_state():
+    """에러/실패 단계/기준 평가 에러가 있는 State 판별 테스트"""
+    
+    assert is_successful_state({"current_step": "ethics_evaluation_completed", "errors": []})
+    assert not is_successful_state({"current_step": "report_generation_failed"})
+    assert not is_successful_state({"current_step": "report_generation", "errors": ["timeout"]})
+    assert not is_successful_state({"ethics_evaluation": {"bias": {"error": "LLM 호출 실패"}}})
+    assert is_successful_state({"ethics_evaluation": {"overall_score": 7.0, "bias": {"score": 7.0}}})
+
+
+def test_find_resume_config_after_last_successful_node():
+    """마지막으로 성공한 노드 직후 체크포인트 선택 테스트"""
+    
+    history = [
+        _snapshot("report_generation_failed", (), errors=["report 실패"]),
+        _snapshot("improvement_proposals_completed", ("report_generation",)),
+        _snapshot("ethics_evaluation_completed", ("improvement_proposal",)),
+        _snapshot(None, ("__start__",)),
+    ]
+    
+    config = find_resume_config(FakeCheckpointedApp(history), "run")
+    assert config["configurable"]["checkpoint_id"] == "improvement_proposals_completed"
+
+
+def test_find_resume_config_skips_failed_criteria():
+    """기준 평가 에러가 남은 체크포인트는 건너뛰는지 테스트"""
+    
+    history = [
+        _snapshot("ethics_evaluation_completed", ("improvement_proposal",),
+                  ethics_evaluation={"bias": {"error": "LLM 호출 실패"}}),
+        _snapshot("service_analysis_completed", ("ethics_criterion",)),
+        _snapshot(None, ("__start__",)),
+    ]
+    
+    config = find_resume_config(FakeCheckpointedApp(history), "run")
+    assert config["configurable"]["checkpoint_id"] == "service_analysis_completed"
+
+
+def test_find_resume_config_completed_or_unknown_run():
+    """완료된 실행이나 없는 실행은 재개하지 않는지 테스트"""
+    
+    completed = [
+        _snapshot("report_completed", ()),
+        _snapshot("improvement_proposals_completed", ("report_generation",)),
+    ]
+    
+    assert find_resume_config(FakeCheckpointedApp(completed), "run") is None
+    assert find_resume_config(FakeCheckpointedApp([]), "unknown") is None
+
+
+@pytest.fixture
+def pdf_files(monkeypatch):
+    """
+    PDF 로딩/임베딩을 대체하는 fixture
+    
+    {경로: (내용 해시, [청크 텍스트, ...])}를 수정해 PDF 추가/변경/삭제를 표현하고,
+    load_pdf_chunks 호출 경로를 loaded에 기록한다.
+    """
+    files = {}
+    loaded = []
+    
+    def fake_load_pdf_chunks(path, content_hash=None):
+        loaded.append(path)
+        content_hash, texts = files[path]
+        return [
+            Document(
+                page_content=text,
+                metadata={
+                    "source_file": path,
+                    "content_hash": content_hash,
+                    "chunk_id": chunk_id(content_hash, i)
+                }
+            )
+            for i, text in enumerate(texts)
+        ]
+    
+    monkeypatch.setattr(
+        vector_store, "OpenAIEmbeddings", lambda **kwargs: DeterministicFakeEmbedding(size=8)
+    )
+    monkeypatch.setattr(vector_store, "file_content_hash", lambda path: files[path][0])
+    monkeypatch.setattr(vector_store, "load_pdf_chunks", fake_load_pdf_chunks)
+    return SimpleNamespace(files=files, loaded=loaded)
+
+
+def _indexed_ids(manager):
+    return set(manager.vector_store.index_to_docstore_id.values())
+
+
+def test_sync_documents_add_change_remove(pdf_files):
+    """Vector Store 증분 동기화 테스트 (추가/변경/삭제된 PDF만 반영)"""
+    
+    pdf_files.files.update({
+        "eu_ai_act.pdf": ("hash-eu", ["위험 기반 접근", "고위험 AI 의무"]),
+        "unesco.pdf": ("hash-unesco-v1", ["인권 존중"]),
+    })
+    manager = vector_store.VectorStoreManager()
+    
+    stats = manager.sync_documents(["eu_ai_act.pdf", "unesco.pdf"])
+    assert stats == {"added": 2, "removed": 0, "unchanged": 0}
+    assert manager.vector_store.index.ntotal == 3
+    assert manager.manifest["sources"]["hash-eu"]["chunk_ids"] == [
+        chunk_id("hash-eu", 0),
+        chunk_id("hash-eu", 1)
+    ]
+    
+    # 변경 없음: 다시 파싱/임베딩하지 않음
+    pdf_files.loaded.clear()
+    stats = manager.sync_documents(["eu_ai_act.pdf", "unesco.pdf"])
+    assert stats == {"added": 0, "removed": 0, "unchanged": 2}
+    assert pdf_files.loaded == []
+    
+    # 내용 변경: 이전 버전 청크 제거 후 새 청크 추가
+    pdf_files.files["unesco.pdf"] = ("hash-unesco-v2", ["인권 존중", "투명성"])
+    stats = manager.sync_documents(["eu_ai_act.pdf", "unesco.pdf"])
+    assert stats == {"added": 1, "removed": 1, "unchanged": 1}
+    assert pdf_files.loaded == ["unesco.pdf"]
+    assert set(manager.manifest["sources"]) == {"hash-eu", "hash-unesco-v2"}
+    assert chunk_id("hash-unesco-v1", 0) not in _indexed_ids(manager)
+    assert manager.vector_store.index.ntotal == 4
+    
+    # 전체 삭제: 인덱스와 매니페스트 모두 비움
+    stats = manager.sync_documents([])
+    assert stats == {"added": 0, "removed": 2, "unchanged": 0}
+    assert manager.manifest["sources"] == {}
+    assert manager.vector_store.index.ntotal == 0
+
+
+def test_sync_documents_records_empty_pdf(pdf_files):
+    """텍스트가 없는 PDF도 매니페스트에 기록해 다시 파싱하지 않는지 테스트"""
+    
+    pdf_files.files.update({
+        "guideline.pdf": ("hash-guideline", ["책임성"]),
+        "scanned.pdf": ("hash-scanned", []),
+    })
+    manager = vector_store.VectorStoreManager()
+    
+    stats = manager.sync_documents(["guideline.pdf", "scanned.pdf"])
+    assert stats["added"] == 2
+    assert manager.manifest["sources"]["hash-scanned"] == {"source_file": "scanned.pdf", "chunk_ids": []}
+    
+    pdf_files.loaded.clear()
+    manager.sync_documents(["guideline.pdf", "scanned.pdf"])
+    assert pdf_files.loaded == []
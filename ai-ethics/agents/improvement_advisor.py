@@ -2,19 +2,29 @@ from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from typing import Dict, List
 import json
-from config.settings import LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY
+from config.settings import (
+    LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY, COMPARISON_DETAIL_MAX_SERVICES
+)
+from tools.llm_cache import create_cached_llm, is_json_reply
 from tools.evaluation_tools import EvaluationTools
-from prompts.improvement import IMPROVEMENT_SUGGESTION_PROMPT, COMPARISON_PROMPT
+from tools.comparison_engine import summarize_comparison
+from tools.prompt_packer import render_prompt
+from prompts.improvement import (
+    IMPROVEMENT_SUGGESTION_PROMPT, IMPROVEMENT_SUGGESTION_DYNAMIC_FIELDS,
+    COMPARISON_PROMPT, COMPARISON_DYNAMIC_FIELDS
+)
+
+RANKING_PRINT_LIMIT = 10  # 콘솔에 출력하는 순위 수
 
 class ImprovementAdvisor:
     """개선안 제안 에이전트 - 윤리성 강화 위한 구체적 개선 방향 제안"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
+        self.llm = create_cached_llm(ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE,
             openai_api_key=OPENAI_API_KEY
-        )
+        ))
         self.eval_tools = EvaluationTools()
     
     def suggest_improvements(
@@ -60,7 +70,9 @@ class ImprovementAdvisor:
     ) -> List[Dict]:
         """LLM을 통한 개선안 생성"""
         
-        prompt = IMPROVEMENT_SUGGESTION_PROMPT.format(
+        prompt = render_prompt(
+            IMPROVEMENT_SUGGESTION_PROMPT,
+            IMPROVEMENT_SUGGESTION_DYNAMIC_FIELDS,
             service_name=service_name,
             risk_assessment=json.dumps(risk_assessment, ensure_ascii=False, indent=2),
             priority_areas=json.dumps(priority_areas, ensure_ascii=False, indent=2)
@@ -72,7 +84,7 @@ class ImprovementAdvisor:
         ]
         
         try:
-            response = self.llm.invoke(messages)
+            response = self.llm.invoke(messages, validate=is_json_reply)
             
             content = response.content.strip()
             if content.startswith("```json"):
@@ -95,32 +107,52 @@ class ImprovementAdvisor:
     ) -> str:
         """여러 서비스 비교 분석"""
         
-        if len(services_data) < 2:
-            return ""
-        
-        print(f"\n{'='*60}")
-        print(f"📊 서비스 비교 분석")
-        print(f"{'='*60}\n")
-        
-        services_list = ", ".join(services_data.keys())
-        
         # 리스크 평가 결과 추출
         all_assessments = {
             name: data['risk_assessment']
             for name, data in services_data.items()
         }
         
+        return self.compare_assessments(all_assessments)
+    
+    def compare_assessments(self, all_assessments: Dict[str, Dict]) -> str:
+        """
+        리스크 평가 결과 비교 분석 (서비스 수 제한 없음)
+        
+        저장된 과거 평가(load_saved_assessments)도 그대로 전달해 비교할 수 있다.
+        """
+        
+        if len(all_assessments) < 2:
+            return ""
+        
+        print(f"\n{'='*60}")
+        print(f"📊 서비스 비교 분석 ({len(all_assessments)}개)")
+        print(f"{'='*60}\n")
+        
         # 평가 도구로 비교
         comparison_data = self.eval_tools.compare_services(all_assessments)
+        rankings = comparison_data['service_rankings']
         
         print(f"  📋 종합 순위:")
-        for i, rank in enumerate(comparison_data['service_rankings'], 1):
+        for i, rank in enumerate(rankings[:RANKING_PRINT_LIMIT], 1):
             print(f"     {i}위: {rank['service']} - {rank['overall_score']}/5 ({rank['risk_level']})")
+        if len(rankings) > RANKING_PRINT_LIMIT:
+            print(f"     ... 외 {len(rankings) - RANKING_PRINT_LIMIT}개")
+        
+        # 서비스가 많으면 전체 평가 대신 요약 통계만 LLM에 전달
+        if len(all_assessments) <= COMPARISON_DETAIL_MAX_SERVICES:
+            services_list = ", ".join(all_assessments.keys())
+            assessments_payload = all_assessments
+        else:
+            services_list = f"{len(all_assessments)}개 서비스 (상/하위 서비스와 차원별 통계 요약)"
+            assessments_payload = summarize_comparison(comparison_data)
         
         # LLM 비교 분석
-        prompt = COMPARISON_PROMPT.format(
+        prompt = render_prompt(
+            COMPARISON_PROMPT,
+            COMPARISON_DYNAMIC_FIELDS,
             services_list=services_list,
-            all_assessments=json.dumps(all_assessments, ensure_ascii=False, indent=2)
+            all_assessments=json.dumps(assessments_payload, ensure_ascii=False, indent=2)
         )
         
         messages = [
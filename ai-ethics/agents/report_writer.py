@@ -2,11 +2,17 @@
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
-import json
 import os
-from config.settings import LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY
+from config.settings import (
+    LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY, REPORT_MAX_WORKERS,
+    REPORT_SUMMARY_PROMPT_BUDGET, REPORT_MAIN_PROMPT_BUDGET
+)
+from tools.llm_cache import create_cached_llm
+from tools.prompt_packer import PromptSection, PackedPrompt, pack_sections, render_prompt
+from utils.task_graph import run_task_graph
+from utils.events import EventCallback, emit
 
 try:
     from prompts.report_generation import (
@@ -23,15 +29,57 @@ except ImportError:
     EnhancedPDFReportGenerator = None
 
 
+# 사용자 메시지 템플릿 - 데이터 섹션은 PROMPT_PREFIX_CACHING 설정 시 작성 요구사항 뒤로 이동
+SUMMARY_USER_TEMPLATE = """다음 AI 서비스들의 평가 결과를 바탕으로 Executive Summary를 한국어로 작성해주세요.
+
+## 평가 대상
+서비스: {services}
+평균 점수: {total_score}/5
+
+## 각 서비스의 상세 평가
+{risk_assessments}
+
+## Executive Summary 작성 요구사항
+1. 평가 개요 (150자) - 평가 목적, 대상, 기준
+2. 주요 발견사항 (300-400자) - 5개 이상의 핵심 포인트
+3. 평가 결과 (200-250자) - 종합 리스크, 강점, 약점
+4. 최우선 권고 (150-200자) - 즉시 개선 필요 3가지
+
+한국어로 명확하고 전문적으로 작성해주세요."""
+
+MAIN_REPORT_USER_TEMPLATE = """다음 데이터를 바탕으로 한국어 보고서를 작성해주세요.
+
+## 분석 서비스
+{services}
+
+## 서비스 분석
+{service_analyses}
+
+## 리스크 평가
+{risk_assessments}
+
+## 개선 권고
+{improvement_suggestions}
+
+## 작성 구조
+다음 구조로 작성해주세요:
+1. 평가 방법론 - 각 차원을 한국어로 설명
+2. 서비스별 상세 평가 - 각 서비스마다 종합평가 및 차원별 분석 (한국어)
+3. 비교 분석 - 서비스 간 비교 (해당시)
+4. 종합 권고사항 - 단기/중기/장기 조치 (한국어)
+
+중요: 모든 내용을 한국어로 작성하고, 영어 텍스트가 있으면 한국어로 변환하세요."""
+
+
 class ReportWriter:
     """리포트 작성 에이전트 - 한국어 보고서 생성"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(
+        self.llm = create_cached_llm(ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE,
             openai_api_key=OPENAI_API_KEY
-        )
+        ))
         
         if EnhancedPDFReportGenerator:
             self.pdf_generator = EnhancedPDFReportGenerator()
@@ -45,81 +93,121 @@ class ReportWriter:
         risk_assessments: Dict[str, Dict],
         improvement_suggestions: Dict[str, List[Dict]],
         comparison_analysis: str,
-        output_dir: str = "outputs"
+        output_dir: str = "outputs",
+        on_event: Optional[EventCallback] = None
     ) -> Dict[str, str]:
-        """최종 보고서 생성"""
+        """
+        최종 보고서 생성
+        
+        on_event가 주어지면 요약 완료(report_summary)와 본문 토큰(report_token)
+        이벤트를 생성 즉시 전달하여 UI에서 보고서를 실시간으로 표시할 수 있음
+        """
         
         print(f"\n{'='*60}")
         print(f"📝 최종 보고서 작성 (한국어)")
         print(f"{'='*60}\n")
         
-        # 1. 참고문헌 수집
-        all_references = []
-        for analysis in service_analyses.values():
-            all_references.extend(analysis.get('references', []))
-        
-        # 2. Executive Summary 생성
-        print(f"  📋 Executive Summary 작성 중...")
-        summary = self._generate_summary(
-            services=services,
-            risk_assessments=risk_assessments
-        )
-        
-        # 3. 메인 보고서 생성
-        print(f"  ✍️  본문 작성 중...")
-        main_report = self._generate_main_report(
-            services=services,
-            service_analyses=service_analyses,
-            risk_assessments=risk_assessments,
-            improvement_suggestions=improvement_suggestions
-        )
+        # 보고서 작업 그래프: 요약 / 본문 / PDF는 서로 독립적이므로 동시 실행하고,
+        # 최종 조합만 요약과 본문 완료 후 수행 (PDF 생성기는 detailed_data만 사용)
+        tasks = {
+            'summary': (
+                lambda: self._generate_summary(
+                    services=services,
+                    risk_assessments=risk_assessments,
+                    on_event=on_event
+                ),
+                []
+            ),
+            'main_report': (
+                lambda: self._generate_main_report(
+                    services=services,
+                    service_analyses=service_analyses,
+                    risk_assessments=risk_assessments,
+                    improvement_suggestions=improvement_suggestions,
+                    on_event=on_event
+                ),
+                []
+            ),
+            'markdown': (
+                lambda summary, main_report: self._assemble_final_report(
+                    summary=summary,
+                    main_report=main_report,
+                    services=services
+                ),
+                ['summary', 'main_report']
+            ),
+            'pdf_path': (
+                lambda: self._generate_pdf(
+                    services=services,
+                    service_analyses=service_analyses,
+                    risk_assessments=risk_assessments,
+                    improvement_suggestions=improvement_suggestions,
+                    output_dir=output_dir
+                ),
+                []
+            )
+        }
         
-        # 4. 최종 조합
-        markdown_report = self._assemble_final_report(
-            summary=summary,
-            main_report=main_report,
-            services=services
-        )
+        results = run_task_graph(tasks, max_workers=REPORT_MAX_WORKERS)
         
         print(f"\n  ✅ 한국어 마크다운 보고서 작성 완료!")
         
-        # 5. PDF 생성
-        pdf_path = None
-        if self.pdf_generator:
-            print(f"  📄 PDF 보고서 생성 중...")
-            try:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                pdf_path = os.path.join(output_dir, f"ethics_report_{timestamp}.pdf")
-                os.makedirs(output_dir, exist_ok=True)
-                
-                detailed_data = {
-                    'service_analyses': service_analyses,
-                    'risk_assessments': risk_assessments,
-                    'improvement_suggestions': improvement_suggestions
-                }
-                
-                self.pdf_generator.generate_report(
-                    output_path=pdf_path,
-                    services=services,
-                    detailed_data=detailed_data,
-                    report_text=markdown_report
-                )
-                
-                print(f"  ✅ PDF 보고서 생성 완료!")
-            except Exception as e:
-                print(f"  ⚠️  PDF 생성 오류: {e}")
-                pdf_path = None
-        
         return {
-            'markdown': markdown_report,
-            'pdf_path': pdf_path
+            'markdown': results['markdown'],
+            'pdf_path': results['pdf_path']
         }
     
-    def _generate_summary(self, services: List[str], risk_assessments: Dict) -> str:
+    def _generate_pdf(
+        self,
+        services: List[str],
+        service_analyses: Dict,
+        risk_assessments: Dict,
+        improvement_suggestions: Dict,
+        output_dir: str
+    ):
+        """PDF 보고서 생성 (실패 시 None 반환)"""
+        if not self.pdf_generator:
+            return None
+        
+        print(f"  📄 PDF 보고서 생성 중...")
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            pdf_path = os.path.join(output_dir, f"ethics_report_{timestamp}.pdf")
+            os.makedirs(output_dir, exist_ok=True)
+            
+            detailed_data = {
+                'service_analyses': service_analyses,
+                'risk_assessments': risk_assessments,
+                'improvement_suggestions': improvement_suggestions
+            }
+            
+            self.pdf_generator.generate_report(
+                output_path=pdf_path,
+                services=services,
+                detailed_data=detailed_data
+            )
+            
+            print(f"  ✅ PDF 보고서 생성 완료!")
+            return pdf_path
+        except Exception as e:
+            print(f"  ⚠️  PDF 생성 오류: {e}")
+            return None
+    
+    def _generate_summary(
+        self,
+        services: List[str],
+        risk_assessments: Dict,
+        on_event: Optional[EventCallback] = None
+    ) -> str:
         """Executive Summary 생성 (한국어)"""
+        print(f"  📋 Executive Summary 작성 중...")
         try:
             total_score = sum([v['overall_score'] for v in risk_assessments.values()]) / len(services)
             
+            packed = self._pack("Executive Summary", [
+                PromptSection("risk_assessments", risk_assessments)
+            ], REPORT_SUMMARY_PROMPT_BUDGET)
+            
             system_msg = """당신은 전문 AI 윤리 리포트 작성자입니다.
 다음 요구사항을 반드시 지켜주세요:
 1. 모든 내용을 한국어로 작성하세요
@@ -127,21 +215,13 @@ class ReportWriter:
 3. 명확하고 전문적인 한국어 사용
 4. 구체적인 수치와 근거 포함"""
             
-            user_msg = f"""다음 AI 서비스들의 평가 결과를 바탕으로 Executive Summary를 한국어로 작성해주세요.
-
-서비스: {', '.join(services)}
-평균 점수: {total_score:.1f}/5
-
-각 서비스의 상세 평가:
-{json.dumps(risk_assessments, ensure_ascii=False, indent=2)}
-
-Executive Summary 작성 요구사항:
-1. 평가 개요 (150자) - 평가 목적, 대상, 기준
-2. 주요 발견사항 (300-400자) - 5개 이상의 핵심 포인트
-3. 평가 결과 (200-250자) - 종합 리스크, 강점, 약점
-4. 최우선 권고 (150-200자) - 즉시 개선 필요 3가지
-
-한국어로 명확하고 전문적으로 작성해주세요."""
+            user_msg = render_prompt(
+                SUMMARY_USER_TEMPLATE,
+                ("services", "total_score", "risk_assessments"),
+                services=', '.join(services),
+                total_score=f"{total_score:.1f}",
+                risk_assessments=packed['risk_assessments']
+            )
             
             messages = [
                 SystemMessage(content=system_msg),
@@ -149,6 +229,7 @@ Executive Summary 작성 요구사항:
             ]
             
             response = self.llm.invoke(messages)
+            emit(on_event, "report_summary", "Executive Summary 작성 완료", text=response.content)
             return response.content
         
         except Exception as e:
@@ -160,10 +241,19 @@ Executive Summary 작성 요구사항:
         services: List[str],
         service_analyses: Dict,
         risk_assessments: Dict,
-        improvement_suggestions: Dict
+        improvement_suggestions: Dict,
+        on_event: Optional[EventCallback] = None
     ) -> str:
-        """메인 보고서 생성 (한국어)"""
+        """메인 보고서 생성 (한국어, on_event 지정 시 토큰 스트리밍)"""
+        print(f"  ✍️  본문 작성 중...")
         try:
+            # 예산 초과 시 서비스 분석 → 개선 권고 순으로 축소 (리스크 평가 우선 유지)
+            packed = self._pack("본문", [
+                PromptSection("risk_assessments", risk_assessments, priority=0),
+                PromptSection("improvement_suggestions", improvement_suggestions, priority=1, min_tokens=500),
+                PromptSection("service_analyses", service_analyses, priority=2, min_tokens=500)
+            ], REPORT_MAIN_PROMPT_BUDGET)
+            
             system_msg = """당신은 전문 AI 윤리 평가 리포트 작성자입니다.
 요구사항:
 1. 모든 내용을 한국어로 작성하세요
@@ -172,39 +262,43 @@ Executive Summary 작성 요구사항:
 4. 구체적인 근거와 데이터를 포함하세요
 5. 영어 텍스트가 나오면 한국어로 변환하세요"""
             
-            user_msg = f"""다음 데이터를 바탕으로 한국어 보고서를 작성해주세요.
-
-분석 서비스: {', '.join(services)}
-
-서비스 분석:
-{json.dumps(service_analyses, ensure_ascii=False, indent=2)}
-
-리스크 평가:
-{json.dumps(risk_assessments, ensure_ascii=False, indent=2)}
-
-개선 권고:
-{json.dumps(improvement_suggestions, ensure_ascii=False, indent=2)}
-
-다음 구조로 작성해주세요:
-1. 평가 방법론 - 각 차원을 한국어로 설명
-2. 서비스별 상세 평가 - 각 서비스마다 종합평가 및 차원별 분석 (한국어)
-3. 비교 분석 - 서비스 간 비교 (해당시)
-4. 종합 권고사항 - 단기/중기/장기 조치 (한국어)
-
-중요: 모든 내용을 한국어로 작성하고, 영어 텍스트가 있으면 한국어로 변환하세요."""
+            user_msg = render_prompt(
+                MAIN_REPORT_USER_TEMPLATE,
+                ("services", "service_analyses", "risk_assessments", "improvement_suggestions"),
+                services=', '.join(services),
+                **packed.sections
+            )
             
             messages = [
                 SystemMessage(content=system_msg),
                 HumanMessage(content=user_msg)
             ]
             
-            response = self.llm.invoke(messages)
-            return response.content
+            if on_event is None:
+                response = self.llm.invoke(messages)
+                return response.content
+            
+            parts = []
+            for chunk in self.llm.stream(messages):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    emit(on_event, "report_token", text=chunk.content)
+            return "".join(parts)
         
         except Exception as e:
             print(f"메인 보고서 생성 오류: {e}")
             return "# 보고서\n\n보고서 생성에 실패했습니다."
     
+    @staticmethod
+    def _pack(label: str, sections: List[PromptSection], budget: int) -> PackedPrompt:
+        """데이터 섹션을 토큰 예산에 맞춰 패킹하고 사용량 출력"""
+        packed = pack_sections(sections, budget)
+        message = f"     → {label} 입력 데이터: {packed.total_tokens} 토큰"
+        if packed.truncated:
+            message += f" (원본 {packed.original_tokens}, 축소: {', '.join(packed.truncated)})"
+        print(message)
+        return packed
+    
     def _assemble_final_report(
         self,
         summary: str,
@@ -1,55 +1,82 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
 import json
-from config.settings import LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY, ETHICS_GUIDELINES
+from config.settings import (
+    LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY, ETHICS_GUIDELINES,
+    RISK_ASSESSMENT_MAX_WORKERS, RISK_ASSESSMENT_PROMPT_BUDGET
+)
+from tools.llm_cache import create_cached_llm, strip_code_fence
 from tools.rag_tools import RAGTools
 from tools.search_tools import SearchTools
 from tools.evaluation_tools import EvaluationTools
-from prompts.risk_assessment import RISK_ASSESSMENT_PROMPT
+from tools.prompt_packer import PromptSection, pack_sections, render_prompt
+from prompts.risk_assessment import RISK_ASSESSMENT_PROMPT, RISK_ASSESSMENT_DYNAMIC_FIELDS
 
 class RiskAssessor:
     """윤리 리스크 진단 에이전트 - 편향성, 프라이버시, 투명성 등 평가"""
     
-    def __init__(self, rag_tools: RAGTools):
-        self.llm = ChatOpenAI(
+    def __init__(
+        self,
+        rag_tools: RAGTools,
+        search_tools: Optional[SearchTools] = None,
+        max_workers: Optional[int] = None
+    ):
+        self.llm = create_cached_llm(ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE,
             openai_api_key=OPENAI_API_KEY
-        )
+        ))
         self.rag_tools = rag_tools
-        self.search_tools = SearchTools()
+        self.search_tools = search_tools or SearchTools()
         self.eval_tools = EvaluationTools()
-        self.criteria = self.eval_tools.load_ethics_criteria()
+        self.max_workers = max_workers or RISK_ASSESSMENT_MAX_WORKERS
+    
+    @property
+    def criteria(self) -> Mapping[str, Mapping]:
+        """현재 평가 기준 (설정 파일 변경 시 자동 반영)"""
+        return self.eval_tools.load_ethics_criteria()
+    
+    @property
+    def query_types(self) -> List[str]:
+        """리스크 평가에 필요한 검색 질의 유형 (차원별 1회)"""
+        return list(self.criteria.keys())
     
     def assess_risks(
         self, 
         service_name: str, 
-        service_analysis: Dict
+        service_analysis: Dict,
+        search_plan=None
     ) -> Dict:
-        """서비스의 윤리 리스크 종합 평가"""
+        """서비스의 윤리 리스크 종합 평가 (search_plan이 주어지면 공유 검색 결과 사용)"""
         
         print(f"\n{'='*60}")
         print(f"⚖️  [{service_name}] 윤리 리스크 진단 시작")
         print(f"{'='*60}\n")
         
         risk_assessment = {}
+        criteria = self.criteria  # 한 번의 평가 동안 같은 기준 사용
         
-        # 각 윤리 차원별로 평가
-        for dimension, config in self.criteria.items():
-            print(f"  📊 {config['name']} 평가 중...")
-            
-            assessment = self._assess_dimension(
-                service_name=service_name,
-                service_analysis=service_analysis,
-                dimension=dimension,
-                dimension_config=config
-            )
-            
+        # 자동 체크리스트는 서비스당 한 번의 스캔으로 전 차원 평가
+        checklist_results = self.eval_tools.evaluate_all_checklists(service_analysis)
+        
+        # 서비스 분석은 references 제거 + compact 직렬화를 서비스당 한 번만 수행
+        analysis_section = self._analysis_section(service_analysis)
+        
+        # 각 윤리 차원별로 평가 (동시 실행, 결과는 기준 순서대로 수집)
+        assessments = self._assess_all_dimensions(
+            service_name, service_analysis, search_plan, checklist_results, criteria,
+            analysis_section
+        )
+        
+        for dimension, config in criteria.items():
+            assessment = assessments[dimension]
             risk_assessment[dimension] = assessment
             
             # 체크리스트 결과 표시
             auto_check = assessment.get('automated_checks', {})
+            print(f"  📊 {config['name']} 평가 완료")
             print(f"     → LLM 점수: {assessment['score']}/5 ({assessment['risk_level']})")
             print(f"     → 자동체크: {auto_check.get('passed_checks', 0)}/{auto_check.get('total_checks', 0)} 통과")
         
@@ -66,28 +93,68 @@ class RiskAssessor:
         
         return risk_assessment
     
+    def _assess_all_dimensions(
+        self,
+        service_name: str,
+        service_analysis: Dict,
+        search_plan=None,
+        checklist_results: Optional[Dict[str, Dict]] = None,
+        criteria: Optional[Mapping[str, Mapping]] = None,
+        analysis_section: Optional[PromptSection] = None
+    ) -> Dict[str, Dict]:
+        """모든 차원 평가 - max_workers 한도 내에서 동시 실행"""
+        checklist_results = checklist_results or {}
+        analysis_section = analysis_section or self._analysis_section(service_analysis)
+        
+        def assess(item):
+            dimension, config = item
+            return self._assess_dimension(
+                service_name=service_name,
+                service_analysis=service_analysis,
+                dimension=dimension,
+                dimension_config=config,
+                search_plan=search_plan,
+                checklist_result=checklist_results.get(dimension),
+                analysis_section=analysis_section
+            )
+        
+        items = list((criteria or self.criteria).items())
+        workers = max(1, min(self.max_workers, len(items)))
+        
+        if workers == 1:
+            results = [assess(item) for item in items]
+        else:
+            print(f"  ⚡ {len(items)}개 차원 동시 평가 중 (최대 {workers}개)...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map은 입력 순서대로 결과를 반환하므로 overall_score 계산 순서가 유지됨
+                results = list(executor.map(assess, items))
+        
+        return {dimension: result for (dimension, _), result in zip(items, results)}
+    
     def _assess_dimension(
         self,
         service_name: str,
         service_analysis: Dict,
         dimension: str,
-        dimension_config: Dict
+        dimension_config: Mapping,
+        search_plan=None,
+        checklist_result: Optional[Dict] = None,
+        analysis_section: Optional[PromptSection] = None
     ) -> Dict:
         """특정 윤리 차원에 대한 평가"""
         
-        # 1. 자동 체크리스트 평가
-        checklist_result = self.eval_tools.automated_checklist_evaluation(
-            service_analysis, dimension
-        )
+        # 1. 자동 체크리스트 평가 (assess_risks에서 미리 계산한 결과가 없을 때만)
+        if checklist_result is None:
+            checklist_result = self.eval_tools.automated_checklist_evaluation(
+                service_analysis, dimension
+            )
         
-        # 2. RAG로 가이드라인 컨텍스트 가져오기
-        guideline_context = self.rag_tools.get_guideline_context(
-            dimension=dimension,
-            guidelines=ETHICS_GUIDELINES
-        )
+        # 2. 사전 생성된 가이드라인 컨텍스트 조회 (토큰 수 포함)
+        guideline_context = self.rag_tools.get_context_entry(dimension, ETHICS_GUIDELINES)
         
         # 3. 웹 검색으로 추가 정보 수집
-        search_results = self.search_tools.search_service_info(
+        search = search_plan or self.search_tools
+        search_results = search.search_service_info(
             service_name=service_name,
             query_type=dimension
         )
@@ -100,14 +167,29 @@ class RiskAssessor:
         # 4. 평가 기준 생성
         evaluation_criteria = self._format_evaluation_criteria(dimension_config)
         
-        # 5. LLM 평가
-        prompt = RISK_ASSESSMENT_PROMPT.format(
+        # 5. 토큰 예산에 맞춰 데이터 섹션 패킹 (가이드라인 > 서비스 분석 > 검색 정보 순으로 유지)
+        packed = pack_sections([
+            PromptSection.precounted(
+                "guideline_context", guideline_context.text, guideline_context.token_count,
+                priority=0, min_tokens=guideline_context.token_count // 2
+            ),
+            analysis_section or self._analysis_section(service_analysis),
+            PromptSection("search_context", search_context, priority=2)
+        ], RISK_ASSESSMENT_PROMPT_BUDGET)
+        
+        if packed.truncated:
+            print(f"     ✂️  [{dimension}] 프롬프트 축소: {packed.original_tokens} → {packed.total_tokens} 토큰 ({', '.join(packed.truncated)})")
+        
+        # 6. LLM 평가 (차원별 정적 내용이 앞, 서비스 데이터가 뒤)
+        prompt = render_prompt(
+            RISK_ASSESSMENT_PROMPT,
+            RISK_ASSESSMENT_DYNAMIC_FIELDS,
             service_name=service_name,
-            service_analysis=json.dumps(service_analysis, ensure_ascii=False, indent=2),
+            service_analysis=packed["service_analysis"],
             dimension=dimension,
             dimension_description=dimension_config['description'],
-            guideline_context=guideline_context,
-            search_context=search_context,
+            guideline_context=packed["guideline_context"],
+            search_context=packed["search_context"],
             evaluation_criteria=evaluation_criteria
         )
         
@@ -117,8 +199,7 @@ class RiskAssessor:
         ]
         
         try:
-            response = self.llm.invoke(messages)
-            assessment = self._parse_and_validate_assessment(response.content)
+            assessment = self._request_assessment(messages)
             
             # 리스크 레벨 계산
             assessment['risk_level'] = self.eval_tools.get_risk_level(assessment['score'])
@@ -135,7 +216,34 @@ class RiskAssessor:
             print(f"    ⚠️  평가 오류: {e}")
             return self._get_default_assessment(dimension, checklist_result)
     
-    def _format_evaluation_criteria(self, config: Dict) -> str:
+    def _request_assessment(self, messages: List) -> Dict:
+        """
+        LLM 평가 요청
+        
+        검증을 통과한 응답만 캐시에 저장하며, 파싱에 실패하면 캐시를 건너뛰고 한 번 더 요청한다.
+        """
+        response = self.llm.invoke(messages, validate=self._is_valid_assessment)
+        try:
+            return self._parse_and_validate_assessment(response.content)
+        except (ValueError, TypeError) as e:
+            print(f"    ⚠️  평가 응답 파싱 실패, 재요청: {e}")
+        
+        response = self.llm.invoke(messages, use_cache=False)
+        return self._parse_and_validate_assessment(response.content)
+    
+    def _is_valid_assessment(self, content: str) -> bool:
+        """캐시 저장 가능한 평가 응답인지 확인"""
+        try:
+            self._parse_assessment(content)
+            return True
+        except (ValueError, TypeError):
+            return False
+    
+    @staticmethod
+    def _analysis_section(service_analysis: Dict) -> PromptSection:
+        return PromptSection("service_analysis", service_analysis, priority=1, min_tokens=300)
+    
+    def _format_evaluation_criteria(self, config: Mapping) -> str:
         """평가 기준 포맷팅"""
         criteria_text = f"{config['name']}\n\n평가 항목:\n"
         
@@ -144,19 +252,13 @@ class RiskAssessor:
         
         return criteria_text
     
-    def _parse_and_validate_assessment(self, content: str) -> Dict:
-        """평가 결과 파싱 및 검증"""
+    def _parse_assessment(self, content: str) -> Dict:
+        """평가 결과 파싱 및 필수 필드/점수 검증 (실패 시 ValueError)"""
         
         # JSON 추출
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-        
-        assessment = json.loads(content.strip())
+        assessment = json.loads(strip_code_fence(content))
+        if not isinstance(assessment, dict):
+            raise ValueError("평가 결과가 JSON 객체가 아님")
         
         # 필수 필드 검증
         required = ['score', 'description', 'evidence', 'guideline_compliance', 'reasoning']
@@ -171,6 +273,13 @@ class RiskAssessor:
         
         assessment['score'] = int(round(score))
         
+        return assessment
+    
+    def _parse_and_validate_assessment(self, content: str) -> Dict:
+        """평가 결과 파싱 및 검증"""
+        
+        assessment = self._parse_assessment(content)
+        
         # 품질 검증
         if len(assessment['evidence']) < 2:
             print("    ⚠️  증거 부족")
@@ -1,47 +1,56 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
 from config.settings import LLM_MODEL, LLM_TEMPERATURE, OPENAI_API_KEY
+from tools.llm_cache import create_cached_llm, is_json_reply
 from tools.search_tools import SearchTools
-from prompts.service_analysis import SERVICE_ANALYSIS_PROMPT
+from tools.prompt_packer import render_prompt
+from prompts.service_analysis import SERVICE_ANALYSIS_PROMPT, SERVICE_ANALYSIS_DYNAMIC_FIELDS
 
 class ServiceAnalyzer:
     """서비스 분석 에이전트 - AI 서비스 개요 파악"""
     
-    def __init__(self):
-        self.llm = ChatOpenAI(
+    # 서비스 분석에 필요한 검색 질의 유형 (검색 계획 수립 시 사용)
+    QUERY_TYPES = ["overview", "fairness", "privacy"]
+    
+    def __init__(self, search_tools: Optional[SearchTools] = None):
+        self.llm = create_cached_llm(ChatOpenAI(
             model=LLM_MODEL,
             temperature=LLM_TEMPERATURE,
             openai_api_key=OPENAI_API_KEY
-        )
-        self.search_tools = SearchTools()
+        ))
+        self.search_tools = search_tools or SearchTools()
     
-    def analyze_service(self, service_name: str) -> Dict:
+    def analyze_service(self, service_name: str, search_plan=None) -> Dict:
         """
         AI 서비스 종합 분석
         - 대상 기능 정리
         - 주요 특징 파악
         - 윤리 관련 정보 수집
+        
+        search_plan이 주어지면 실행 단위로 공유되는 검색 결과를 사용
         """
         
+        search = search_plan or self.search_tools
+        
         print(f"\n{'='*60}")
         print(f"🔍 [{service_name}] 서비스 분석 시작")
         print(f"{'='*60}\n")
         
         # 1. 웹 검색으로 정보 수집
         print(f"  📡 정보 수집 중...")
-        overview_results = self.search_tools.search_service_info(
+        overview_results = search.search_service_info(
             service_name=service_name,
             query_type="overview"
         )
         
-        ethics_results = self.search_tools.search_service_info(
+        ethics_results = search.search_service_info(
             service_name=service_name,
             query_type="fairness"
         )
         
-        privacy_results = self.search_tools.search_service_info(
+        privacy_results = search.search_service_info(
             service_name=service_name,
             query_type="privacy"
         )
@@ -54,7 +63,9 @@ class ServiceAnalyzer:
         overview_info = self._format_search_results(overview_results)
         ethics_info = self._format_search_results(ethics_results + privacy_results)
         
-        prompt = SERVICE_ANALYSIS_PROMPT.format(
+        prompt = render_prompt(
+            SERVICE_ANALYSIS_PROMPT,
+            SERVICE_ANALYSIS_DYNAMIC_FIELDS,
             service_name=service_name,
             overview_info=overview_info,
             ethics_info=ethics_info
@@ -66,7 +77,7 @@ class ServiceAnalyzer:
         ]
         
         try:
-            response = self.llm.invoke(messages)
+            response = self.llm.invoke(messages, validate=is_json_reply)
             analysis = self._parse_analysis(response.content)
             
             # 참고 문헌 추가
@@ -1,15 +1,21 @@
 import os
-from typing import List
+import threading
+from typing import Dict, List, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-from config.settings import MAX_SERVICES
+from config.settings import ETHICS_GUIDELINES, MAX_SERVICES, SERVICE_PIPELINE_MAX_WORKERS
+from tools.llm_cache import LLMUsageTracker, get_usage_tracker
 from tools.rag_tools import RAGTools
+from tools.search_tools import SearchTools
+from tools.search_planner import SearchPlan
 from agents.service_analyzer import ServiceAnalyzer
 from agents.risk_assessor import RiskAssessor
 from agents.improvement_advisor import ImprovementAdvisor
 from agents.report_writer import ReportWriter
 from utils.state import AssessmentState
 from utils.helpers import save_json, print_section
+from utils.events import EventCallback, emit
 
 
 class AIEthicsAssessmentSystem:
@@ -29,11 +35,13 @@ class AIEthicsAssessmentSystem:
         # 도구 초기화
         print("  🔧 도구 초기화 중...")
         self.rag_tools = RAGTools()
+        self.rag_tools.build_context_table(ETHICS_GUIDELINES)  # 차원별 가이드라인 컨텍스트 사전 생성
+        self.search_tools = SearchTools()
         
-        # 에이전트 초기화
+        # 에이전트 초기화 (검색 도구 및 캐시 공유)
         print("  🤖 에이전트 초기화 중...")
-        self.service_analyzer = ServiceAnalyzer()
-        self.risk_assessor = RiskAssessor(self.rag_tools)
+        self.service_analyzer = ServiceAnalyzer(self.search_tools)
+        self.risk_assessor = RiskAssessor(self.rag_tools, self.search_tools)
         self.improvement_advisor = ImprovementAdvisor()
         self.report_writer = ReportWriter()
         
@@ -42,7 +50,8 @@ class AIEthicsAssessmentSystem:
     def analyze_services(
         self, 
         service_names: List[str],
-        output_dir: str = "outputs"
+        output_dir: str = "outputs",
+        on_event: Optional[EventCallback] = None
     ) -> dict:
         """
         여러 AI 서비스 분석 및 보고서 생성
@@ -50,9 +59,10 @@ class AIEthicsAssessmentSystem:
         Args:
             service_names: 분석할 서비스 목록 (최대 3개)
             output_dir: 출력 디렉토리
+            on_event: 진행 이벤트 콜백 (단계 진행 및 보고서 스트리밍)
         
         Returns:
-            결과 딕셔너리 (markdown, pdf_path 포함)
+            결과 딕셔너리 (markdown, pdf_path, 저장된 파일 경로 포함)
         """
         
         # 검증
@@ -65,74 +75,112 @@ class AIEthicsAssessmentSystem:
         # 상태 초기화
         state = AssessmentState(service_names=service_names)
         state.metadata['start_time'] = datetime.now().isoformat()
+        usage_before = get_usage_tracker().stats()
         
         print_section(f"분석 시작: {', '.join(service_names)}", char="#")
         
         # 단계별 처리
         try:
-            # 1. 서비스 분석
-            self._analyze_all_services(state)
-            
-            # 2. 리스크 평가
-            self._assess_all_risks(state)
-            
-            # 3. 개선안 제안
-            self._suggest_all_improvements(state)
+            # 1~3. 서비스별 파이프라인 (분석 → 평가 → 개선안) 동시 실행
+            emit(on_event, "stage", "서비스 분석 / 리스크 평가 / 개선안 제안", step=1, total_steps=4)
+            with SearchPlan(self.search_tools) as search_plan:
+                self._plan_searches(search_plan, service_names)
+                self._run_service_pipelines(state, search_plan, on_event)
+                state.metadata['search_plan'] = search_plan.stats()
             
             # 4. 비교 분석 (2개 이상)
             if len(service_names) >= 2:
+                emit(on_event, "stage", "서비스 비교 분석", step=2, total_steps=4)
                 self._compare_services(state)
             
             # 5. 최종 보고서 생성 (마크다운 + PDF)
-            report_result = self._generate_final_report(state, output_dir)
+            emit(on_event, "stage", "최종 보고서 작성", step=3, total_steps=4)
+            report_result = self._generate_final_report(state, output_dir, on_event)
             
             # 6. 결과 저장
-            self._save_results(state, output_dir, report_result)
+            emit(on_event, "stage", "결과 저장", step=4, total_steps=4)
+            saved_paths = self._save_results(state, output_dir, report_result)
             
             state.metadata['end_time'] = datetime.now().isoformat()
+            # 동시에 실행 중인 다른 분석의 호출도 포함될 수 있음 (프로세스 전역 집계 기준)
+            llm_usage = LLMUsageTracker.diff(usage_before, get_usage_tracker().stats())
+            state.metadata['llm_usage'] = llm_usage
             
             print_section("분석 완료!", char="#")
             print(f"  📊 상태 요약:")
             for key, value in state.get_summary().items():
                 print(f"     - {key}: {value}")
+            print(
+                f"  🧮 LLM 호출 {llm_usage['calls']}회: 입력 {llm_usage['prompt_tokens']} 토큰 "
+                f"(프롬프트 캐시 {llm_usage['cached_prompt_tokens']}, {llm_usage['cached_ratio']:.0%}), "
+                f"평균 {llm_usage['avg_latency_sec']}초"
+            )
             
             return {
                 'markdown_report': report_result['markdown'],
                 'pdf_path': report_result.get('pdf_path'),
-                'output_dir': output_dir
+                'output_dir': output_dir,
+                **saved_paths
             }
             
         except Exception as e:
             print(f"\n❌ 오류 발생: {e}")
             raise
     
-    def _analyze_all_services(self, state: AssessmentState):
-        """모든 서비스 분석"""
-        print_section("1단계: 서비스 분석", char="=")
+    def _plan_searches(self, search_plan: SearchPlan, service_names: List[str]):
+        """에이전트들이 필요로 하는 검색 질의를 모아 중복 없이 미리 실행"""
+        query_types = self.service_analyzer.QUERY_TYPES + self.risk_assessor.query_types
+        search_plan.prefetch(service_names, query_types)
         
-        for service_name in state.service_names:
-            analysis = self.service_analyzer.analyze_service(service_name)
-            state.add_service_analysis(service_name, analysis)
-    
-    def _assess_all_risks(self, state: AssessmentState):
-        """모든 서비스 리스크 평가"""
-        print_section("2단계: 윤리 리스크 평가", char="=")
-        
-        for service_name in state.service_names:
-            analysis = state.service_analyses[service_name]
-            assessment = self.risk_assessor.assess_risks(service_name, analysis)
-            state.add_risk_assessment(service_name, assessment)
+        unique = len(dict.fromkeys(query_types)) * len(service_names)
+        print(f"  🔎 검색 계획: 고유 질의 {unique}건 (요청 {len(query_types) * len(service_names)}건)")
     
-    def _suggest_all_improvements(self, state: AssessmentState):
-        """모든 서비스 개선안 제안"""
-        print_section("3단계: 개선안 제안", char="=")
-        
-        for service_name in state.service_names:
-            assessment = state.risk_assessments[service_name]
-            improvements = self.improvement_advisor.suggest_improvements(
-                service_name, assessment
+    def _run_service_pipelines(
+        self,
+        state: AssessmentState,
+        search_plan: SearchPlan = None,
+        on_event: Optional[EventCallback] = None
+    ):
+        """서비스별 파이프라인 실행 - 각 서비스가 독립적으로 분석→평가→개선안 단계를 진행"""
+        print_section("1~3단계: 서비스 분석 / 리스크 평가 / 개선안 제안", char="=")
+        
+        workers = max(1, min(SERVICE_PIPELINE_MAX_WORKERS, len(state.service_names)))
+        
+        def run(service_name):
+            result = self._run_service_pipeline(service_name, search_plan)
+            emit(
+                on_event, "service_done", f"{service_name} 분석 완료",
+                service=service_name,
+                overall_score=result['assessment'].get('overall_score')
             )
-            state.add_improvements(service_name, improvements)
+            return result
+        
+        if workers == 1:
+            results = [run(name) for name in state.service_names]
+        else:
+            print(f"  ⚡ {len(state.service_names)}개 서비스 동시 진행 (최대 {workers}개)\n")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(run, state.service_names))
+        
+        # 결과는 입력 순서대로 상태에 반영 (보고서/JSON 순서 유지)
+        for service_name, result in zip(state.service_names, results):
+            state.add_service_analysis(service_name, result['analysis'])
+            state.add_risk_assessment(service_name, result['assessment'])
+            state.add_improvements(service_name, result['improvements'])
+    
+    def _run_service_pipeline(self, service_name: str, search_plan: SearchPlan = None) -> Dict:
+        """단일 서비스 파이프라인: 서비스 분석 → 리스크 평가 → 개선안 제안"""
+        analysis = self.service_analyzer.analyze_service(service_name, search_plan)
+        assessment = self.risk_assessor.assess_risks(service_name, analysis, search_plan)
+        improvements = self.improvement_advisor.suggest_improvements(
+            service_name, assessment
+        )
+        
+        return {
+            'analysis': analysis,
+            'assessment': assessment,
+            'improvements': improvements
+        }
     
     def _compare_services(self, state: AssessmentState):
         """서비스 비교 분석"""
@@ -150,7 +198,12 @@ class AIEthicsAssessmentSystem:
         comparison = self.improvement_advisor.compare_services(services_data)
         state.comparison_analysis = comparison
     
-    def _generate_final_report(self, state: AssessmentState, output_dir: str) -> dict:
+    def _generate_final_report(
+        self,
+        state: AssessmentState,
+        output_dir: str,
+        on_event: Optional[EventCallback] = None
+    ) -> dict:
         """최종 보고서 생성 (마크다운 + PDF)"""
         print_section("5단계: 최종 보고서 작성 (마크다운 + PDF)", char="=")
         
@@ -160,13 +213,14 @@ class AIEthicsAssessmentSystem:
             risk_assessments=state.risk_assessments,
             improvement_suggestions=state.improvement_suggestions,
             comparison_analysis=state.comparison_analysis,
-            output_dir=output_dir
+            output_dir=output_dir,
+            on_event=on_event
         )
         
         return report_result
     
-    def _save_results(self, state: AssessmentState, output_dir: str, report_result: dict):
-        """결과 저장"""
+    def _save_results(self, state: AssessmentState, output_dir: str, report_result: dict) -> dict:
+        """결과 저장 (저장된 파일 경로 반환)"""
         print_section("6단계: 결과 저장", char="=")
         
         # 출력 디렉토리 생성
@@ -201,6 +255,55 @@ class AIEthicsAssessmentSystem:
         summary_path = os.path.join(output_dir, f"{base_name}_summary.json")
         save_json(state.get_summary(), summary_path)
         print(f"  📊 요약: {summary_path}")
+        
+        return {
+            'report_path': report_path,
+            'data_path': data_path,
+            'summary_path': summary_path
+        }
+
+
+# ============================================
+# 프로세스 전역 공유 시스템
+# ============================================
+# 실행별 상태(AssessmentState, SearchPlan)는 analyze_services 안에서만 생성되고,
+# 에이전트가 공유하는 캐시는 내부에서 잠금을 사용하므로 여러 세션/스레드가
+# 하나의 시스템 인스턴스를 동시에 사용할 수 있다.
+_shared_system = None
+_shared_system_lock = threading.Lock()
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+
+
+def get_shared_system() -> AIEthicsAssessmentSystem:
+    """공유 시스템 반환 (아직 없으면 생성, 초기화 중이면 완료될 때까지 대기)"""
+    global _shared_system
+    
+    with _shared_system_lock:
+        if _shared_system is None:
+            _shared_system = AIEthicsAssessmentSystem()
+        return _shared_system
+
+
+def is_shared_system_ready() -> bool:
+    """공유 시스템 초기화 완료 여부"""
+    return _shared_system is not None
+
+
+def warm_up_shared_system() -> threading.Thread:
+    """백그라운드 스레드에서 공유 시스템을 미리 초기화 (여러 번 호출해도 1회만 실행)"""
+    global _warmup_thread
+    
+    # 초기화 중에도 즉시 반환되도록 시스템 생성용 잠금과 분리
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=get_shared_system,
+                name="ethics-system-warmup",
+                daemon=True
+            )
+            _warmup_thread.start()
+        return _warmup_thread
 
 
 # ============================================
@@ -11,13 +11,70 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 LLM_MODEL = "gpt-4o"
 LLM_TEMPERATURE = 0.3
 
+# LLM Response Cache Settings
+LLM_CACHE_ENABLED = True
+LLM_CACHE_DIR = "outputs/cache/llm"
+LLM_CACHE_MEMORY_ENTRIES = 256
+LLM_CACHE_DISK_MAX_ENTRIES = 5000  # 초과 시 가장 오래 사용되지 않은 응답부터 삭제
+LLM_CACHE_TTL = 30 * 24 * 3600  # 디스크 캐시 유효 기간 (초)
+
+# Prompt Packing Settings (데이터 섹션 합계 토큰 예산, 초과 시 우선순위 낮은 섹션부터 생략)
+PROMPT_DROP_FIELDS = ["references", "raw_content"]  # 프롬프트에서 제외할 대용량 필드
+RISK_ASSESSMENT_PROMPT_BUDGET = 3000  # 차원별 평가 (서비스 분석/가이드라인/검색 정보)
+REPORT_SUMMARY_PROMPT_BUDGET = 4000  # Executive Summary (전체 리스크 평가)
+REPORT_MAIN_PROMPT_BUDGET = 12000  # 보고서 본문 (분석/평가/개선안)
+PROMPT_PREFIX_CACHING = True  # 정적 내용(지시문/기준/가이드라인/응답 형식)을 앞에, 서비스 데이터를 뒤에 배치
+
 # Service Limits
 MAX_SERVICES = 3
 
+# Comparison Settings (비교 분석은 MAX_SERVICES 제한 없이 저장된 평가 결과도 비교 가능)
+COMPARISON_PERCENTILES = [25, 50, 75]  # 차원별 통계에 포함할 백분위수
+COMPARISON_DETAIL_MAX_SERVICES = 3  # 초과 시 LLM에는 전체 평가 대신 요약 통계만 전달
+
+# Concurrency Settings
+RISK_ASSESSMENT_MAX_WORKERS = 5  # 차원별 동시 평가 수 (1이면 순차 실행)
+SERVICE_PIPELINE_MAX_WORKERS = 3  # 서비스별 파이프라인 동시 실행 수 (1이면 순차 실행)
+SEARCH_PLAN_MAX_WORKERS = 8  # 실행 단위 검색 계획의 동시 검색 수
+REPORT_MAX_WORKERS = 3  # 보고서 작업(요약/본문/PDF) 동시 실행 수
+
+# Background Job Settings (Streamlit)
+JOB_MAX_WORKERS = 2  # 동시에 실행되는 분석 작업 수
+JOB_OUTPUT_DIR = "outputs/streamlit_temp"  # 작업별 결과는 JOB_OUTPUT_DIR/<run_id>에 저장
+JOB_REGISTRY_MAX = 50  # 레지스트리에 보관하는 작업 수 (초과 시 오래된 완료 작업부터 제거)
+
+# Search Cache Settings
+SEARCH_CACHE_ENABLED = True
+SEARCH_CACHE_PATH = "outputs/cache/search_cache.sqlite3"
+SEARCH_CACHE_MAX_ENTRIES = 2000
+SEARCH_CACHE_TTL = {  # 질의 유형별 캐시 유효 기간 (초)
+    "overview": 7 * 24 * 3600,
+    "fairness": 24 * 3600,
+    "privacy": 24 * 3600,
+    "transparency": 24 * 3600,
+    "accountability": 24 * 3600,
+    "safety": 12 * 3600,
+    "guideline": 30 * 24 * 3600,
+    "default": 24 * 3600
+}
+
+# PDF Artifact Cache Settings
+PDF_CACHE_DIR = "outputs/cache/pdf"
+PDF_CACHE_MAX_ENTRIES = 50
+PDF_SECTION_WORKERS = 1  # 2 이상이면 섹션별 병렬 렌더링 후 병합 (pypdf 필요)
+
+# Guideline Search Index (BM25, 원본 가이드라인/평가 기준이 바뀌면 자동 재생성)
+GUIDELINE_INDEX_PATH = "outputs/cache/guideline_index.json"
+BM25_K1 = 1.5
+BM25_B = 0.75
+
 # Ethics Guidelines
 ETHICS_GUIDELINES = ["EU AI Act", "UNESCO AI Ethics", "OECD AI Principles"]
 
-# Ethics Dimensions
+# Ethics Criteria (가중치 등 평가 기준은 이 파일에서 수정, 변경 시 자동 재로드)
+ETHICS_CRITERIA_PATH = os.path.join(os.path.dirname(__file__), "ethics_criteria.json")
+
+# Ethics Dimensions (ETHICS_CRITERIA_PATH 파일이 없을 때 사용하는 기본값)
 ETHICS_DIMENSIONS = {
     "fairness": {
         "name": "공정성 및 편향성",
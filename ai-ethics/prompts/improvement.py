@@ -49,6 +49,9 @@ IMPROVEMENT_SUGGESTION_PROMPT = """
 ]
 """
 
+# 서비스/실행마다 달라지는 필드 (프롬프트 캐싱 시 템플릿 뒤쪽에 배치)
+IMPROVEMENT_SUGGESTION_DYNAMIC_FIELDS = ("service_name", "risk_assessment", "priority_areas")
+
 COMPARISON_PROMPT = """
 다음 여러 AI 서비스들의 윤리 리스크 평가 결과를 비교 분석하세요.
 
@@ -70,3 +73,5 @@ COMPARISON_PROMPT = """
 
 객관적이고 근거 기반으로 작성하며, 편향되지 않은 균형잡힌 시각을 유지하세요.
 """
+
+COMPARISON_DYNAMIC_FIELDS = ("services_list", "all_assessments")
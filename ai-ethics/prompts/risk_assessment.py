@@ -58,6 +58,9 @@ RISK_ASSESSMENT_PROMPT = """
 }}
 """
 
+# 서비스/실행마다 달라지는 필드 (프롬프트 캐싱 시 템플릿 뒤쪽에 배치)
+RISK_ASSESSMENT_DYNAMIC_FIELDS = ("service_name", "service_analysis", "search_context")
+
 
 # ============================================
 # prompts/service_analysis.py
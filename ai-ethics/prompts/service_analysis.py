@@ -88,6 +88,9 @@ SERVICE_ANALYSIS_PROMPT = """
 }}
 """
 
+# 서비스/실행마다 달라지는 필드 (프롬프트 캐싱 시 템플릿 뒤쪽에 배치)
+SERVICE_ANALYSIS_DYNAMIC_FIELDS = ("service_name", "overview_info", "ethics_info")
+
 
 # prompts/risk_assessment.py - 강화된 리스크 평가 프롬프트
 
@@ -17,7 +17,8 @@ sys.path.insert(0, project_root)
 # AIEthicsAssessmentSystem import
 SYSTEM_AVAILABLE = False
 try:
-    from app import AIEthicsAssessmentSystem
+    from app import get_shared_system, is_shared_system_ready, warm_up_shared_system
+    from utils.jobs import JobManager
     SYSTEM_AVAILABLE = True
     st.write("✅ AIEthicsAssessmentSystem 로드 성공")
 except ImportError as e:
@@ -231,6 +232,33 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_job_manager():
+    """프로세스 전역 분석 작업 실행기 (모든 세션이 공유)"""
+    return JobManager()
+
+
+@st.cache_resource
+def get_pdf_cache():
+    """프로세스 전역 PDF 산출물 캐시"""
+    from tools.pdf_cache import PDFArtifactCache
+    return PDFArtifactCache()
+
+
+def run_shared_analysis(service_names, output_dir, on_event):
+    """작업 스레드에서 공유 시스템으로 분석 실행 (초기화 중이면 완료까지 대기)"""
+    return get_shared_system().analyze_services(
+        service_names=service_names,
+        output_dir=output_dir,
+        on_event=on_event
+    )
+
+
+if SYSTEM_AVAILABLE:
+    # 서버 시작 시 백그라운드에서 시스템 초기화 (프로세스당 1회)
+    warm_up_shared_system()
+
+
 class EthicsDashboard:
     def __init__(self):
         self.dimensions = {
@@ -242,10 +270,6 @@ class EthicsDashboard:
         }
         
         self.initialize_session_state()
-        
-        if SYSTEM_AVAILABLE and 'system' not in st.session_state:
-            with st.spinner("시스템 초기화 중..."):
-                st.session_state.system = AIEthicsAssessmentSystem()
     
     def initialize_session_state(self):
         defaults = {
@@ -253,33 +277,33 @@ class EthicsDashboard:
             'results': None,
             'progress_logs': [],
             'pdf_generated': False,
-            'pdf_content': None
+            'pdf_path': None,
+            'run_id': None
         }
         
         for key, value in defaults.items():
             if key not in st.session_state:
                 st.session_state[key] = value
     
-    def generate_pdf_report(self, results: Dict) -> bytes:
+    def generate_pdf_report(self, results: Dict) -> str:
+        """PDF 생성 후 캐시된 파일 경로 반환 (동일 내용이면 재생성 없이 캐시 사용)"""
         try:
             from tools.report_pdf_enhanced import EnhancedPDFReportGenerator
-            import tempfile
             
-            pdf_gen = EnhancedPDFReportGenerator()
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                pdf_gen.generate_report(
-                    output_path=tmp.name,
+            def render(output_path: str):
+                EnhancedPDFReportGenerator().generate_report(
+                    output_path=output_path,
                     services=results['services'],
                     detailed_data=results['detailed_data'],
                     report_text=results['report']
                 )
-                
-                with open(tmp.name, 'rb') as f:
-                    pdf_bytes = f.read()
-                
-                os.unlink(tmp.name)
-                return pdf_bytes
+            
+            return get_pdf_cache().get_or_render(
+                services=results['services'],
+                detailed_data=results['detailed_data'],
+                report_text=results['report'],
+                render=render
+            )
         
         except Exception as e:
             st.error(f"PDF 생성 오류: {e}")
@@ -307,6 +331,9 @@ class EthicsDashboard:
             
             st.markdown("---")
             
+            if SYSTEM_AVAILABLE and not is_shared_system_ready():
+                st.caption("⏳ 분석 시스템 준비 중... (분석을 시작하면 준비 완료 후 자동 실행)")
+            
             st.markdown("### 평가 설정")
             st.info("""**적용 가이드라인**
 - EU AI Act
@@ -320,7 +347,9 @@ class EthicsDashboard:
                         use_container_width=True):
                 self.start_analysis(services)
         
-        if not st.session_state.analysis_done:
+        if st.session_state.run_id:
+            self.render_job_progress()
+        elif not st.session_state.analysis_done:
             self.render_welcome_page()
         else:
             self.render_results_page()
@@ -346,6 +375,17 @@ AI 서비스의 윤리적 리스크를 5개 차원에서 종합적으로 평가
     def start_analysis(self, services: List[str]):
         st.session_state.progress_logs = []
         
+        if SYSTEM_AVAILABLE:
+            # 백그라운드 작업으로 등록하고 실행 ID로 진행 상황/결과를 조회
+            st.session_state.run_id = get_job_manager().submit(
+                services, run_shared_analysis
+            )
+            st.session_state.analysis_done = False
+            st.session_state.pdf_generated = False
+            st.session_state.pdf_path = None
+            st.rerun()
+            return  # 진행 상황은 rerun 후 작업 상태 페이지에서 표시
+        
         progress_container = st.container()
         
         with progress_container:
@@ -355,37 +395,7 @@ AI 서비스의 윤리적 리스크를 5개 차원에서 종합적으로 평가
             progress_bar = st.progress(0)
         
         try:
-            if SYSTEM_AVAILABLE:
-                status_text.info("AI 윤리성 분석 시스템을 실행합니다...")
-                
-                output_dir = "outputs/streamlit_temp"
-                os.makedirs(output_dir, exist_ok=True)
-                
-                report = st.session_state.system.analyze_services(
-                    service_names=services,
-                    output_dir=output_dir
-                )
-                
-                latest_files = sorted([f for f in os.listdir(output_dir) 
-                                     if f.endswith('_data.json')])
-                if latest_files:
-                    with open(os.path.join(output_dir, latest_files[-1]), 
-                             'r', encoding='utf-8') as f:
-                        detailed_data = json.load(f)
-                    
-                    st.session_state.results = {
-                        'services': services,
-                        'report': report['markdown_report'],
-                        'detailed_data': detailed_data,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-                    progress_bar.progress(1.0)
-                    status_text.success("분석 완료!")
-                    st.session_state.analysis_done = True
-                    st.rerun()
-            else:
-                self.run_demo_analysis(services, progress_area, progress_bar, status_text)
+            self.run_demo_analysis(services, progress_area, progress_bar, status_text)
         
         except Exception as e:
             st.error(f"분석 중 오류: {e}")
@@ -393,6 +403,54 @@ AI 서비스의 윤리적 리스크를 5개 차원에서 종합적으로 평가
             with st.expander("오류 상세"):
                 st.code(traceback.format_exc())
     
+    def render_job_progress(self):
+        """실행 중인 작업의 진행 이벤트와 스트리밍 보고서를 폴링하여 표시"""
+        import time
+        
+        job = get_job_manager().get(st.session_state.run_id)
+        if job is None:
+            st.session_state.run_id = None
+            st.warning("분석 작업 정보를 찾을 수 없습니다. 다시 실행해 주세요.")
+            return
+        
+        snapshot = job.snapshot()
+        
+        st.markdown("### 분석 진행 중...")
+        st.caption(f"실행 ID: {snapshot['run_id']} · 대상: {', '.join(snapshot['services'])}")
+        
+        events = snapshot['events']
+        for i, event in enumerate(events):
+            done = event.type == "service_done" or i < len(events) - 1
+            status_class = "complete" if done else "active"
+            icon = "✅" if done else "⏳"
+            st.markdown(
+                f'<div class="progress-step {status_class}">{icon} {event.message}</div>',
+                unsafe_allow_html=True
+            )
+        
+        stages = [e for e in events if e.type == "stage"]
+        progress = 0.0
+        if stages:
+            progress = (stages[-1].data['step'] - 1) / stages[-1].data['total_steps']
+        st.progress(1.0 if snapshot['status'] == "done" else progress)
+        
+        if snapshot['summary_text'] or snapshot['report_text']:
+            st.markdown(snapshot['summary_text'] + "\n\n" + snapshot['report_text'])
+        
+        if snapshot['status'] == "done":
+            st.session_state.results = job.result
+            st.session_state.analysis_done = True
+            st.session_state.run_id = None
+            st.rerun()
+        elif snapshot['status'] == "failed":
+            st.session_state.run_id = None
+            st.error("분석 중 오류가 발생했습니다.")
+            with st.expander("오류 상세"):
+                st.code(snapshot['error'])
+        else:
+            time.sleep(1.0)
+            st.rerun()
+    
     def run_demo_analysis(self, services, progress_area, progress_bar, status_text):
         import time
         
@@ -541,16 +599,18 @@ AI 서비스의 윤리적 리스크를 5개 차원에서 종합적으로 평가
         with col2:
             if st.button("📄 PDF 생성", use_container_width=True):
                 with st.spinner("PDF 생성 중..."):
-                    pdf_bytes = self.generate_pdf_report(results)
-                    if pdf_bytes:
+                    pdf_path = self.generate_pdf_report(results)
+                    if pdf_path:
                         st.session_state.pdf_generated = True
-                        st.session_state.pdf_content = pdf_bytes
+                        st.session_state.pdf_path = pdf_path
         
-        if st.session_state.pdf_generated and st.session_state.pdf_content:
-            with col3:
+        pdf_path = st.session_state.pdf_path
+        if st.session_state.pdf_generated and pdf_path and os.path.exists(pdf_path):
+            with col3, open(pdf_path, 'rb') as pdf_file:
+                # 세션에는 경로만 보관하고, 다운로드는 캐시 파일에서 직접 전달
                 st.download_button(
                     "⬇️ 다운로드",
-                    st.session_state.pdf_content,
+                    pdf_file,
                     file_name=f"ethics_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
                     mime="application/pdf",
                     use_container_width=True
@@ -0,0 +1,379 @@
+"""
+에이전트 워크플로우 테스트
+"""
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from agents.report_writer import ReportWriter
+from agents.risk_assessor import RiskAssessor
+import app
+from app import AIEthicsAssessmentSystem
+from tools.evaluation_tools import EvaluationTools
+from tools.llm_cache import CachedChatModel, LLMResponseCache, LLMUsageTracker, MemoryLRUBackend
+from tools.rag_tools import RAGTools
+from utils import tokens
+from utils.events import emit
+from utils.graph import EthicsAssessmentGraph
+from utils.helpers import save_json
+from utils.jobs import JobManager
+from utils.state import AssessmentState
+
+
+class StubRAGTools:
+    def load_guidelines(self):
+        return True
+
+    def build_context_table(self, guidelines):
+        pass
+
+
+class StubServiceAnalyzer:
+    """모든 서비스 브랜치가 동시에 도착해야 통과하는 분석기 (순차 실행이면 Barrier 시간 초과)"""
+
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def analyze_service(self, service_name, search_plan=None):
+        self.barrier.wait()
+        return {"service_name": service_name}
+
+
+class StubRiskAssessor:
+    def assess_risks(self, service_name, service_analysis, search_plan=None):
+        return {"overall_score": len(service_name), "analyzed": service_analysis["service_name"]}
+
+
+class SlowFirstRiskAssessor:
+    """앞선 서비스일수록 늦게 끝나는 평가기 (완료 순서를 입력 역순으로 만듦)"""
+
+    def __init__(self, services):
+        self.delays = {name: 0.05 * (len(services) - i) for i, name in enumerate(services)}
+        self.finished = []
+
+    def assess_risks(self, service_name, service_analysis, search_plan=None):
+        time.sleep(self.delays[service_name])
+        self.finished.append(service_name)
+        return {"overall_score": len(service_name)}
+
+
+class StubImprovementAdvisor:
+    def suggest_improvements(self, service_name, risk_assessment):
+        return [{"service": service_name}]
+
+    def compare_services(self, services_data):
+        return "비교: " + ", ".join(services_data)
+
+
+class StubReportWriter:
+    def __init__(self):
+        self.calls = []
+
+    def generate_report(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"summary": f"{len(kwargs['services'])}개 서비스 보고서"}
+
+
+def _stub_graph(parties: int = 1) -> EthicsAssessmentGraph:
+    """에이전트를 스텁으로 바꾼 워크플로우 그래프 (LLM/검색 호출 없음)"""
+    graph = EthicsAssessmentGraph.__new__(EthicsAssessmentGraph)
+    graph.rag_tools = StubRAGTools()
+    graph.service_analyzer = StubServiceAnalyzer(parties)
+    graph.risk_assessor = StubRiskAssessor()
+    graph.improvement_advisor = StubImprovementAdvisor()
+    graph.report_writer = StubReportWriter()
+    graph.service_graph = graph._build_service_graph()
+    graph.graph = graph._build_graph()
+    return graph
+
+
+def test_graph_fans_out_services_and_merges_results():
+    """서비스별 브랜치 병렬 실행 및 리듀서 병합 테스트"""
+    services = ["ChatGPT", "Claude", "Gemini"]
+    graph = _stub_graph(parties=len(services))
+
+    result = graph.graph.invoke({"service_names": services, "guidelines": ["EU AI Act"]})
+
+    assert set(result["service_analysis"]) == set(services)
+    assert result["risk_assessment"]["Claude"] == {"overall_score": 6, "analyzed": "Claude"}
+    assert result["improvement_suggestions"]["Gemini"] == [{"service": "Gemini"}]
+    assert result["comparison_analysis"] == "비교: ChatGPT, Claude, Gemini"
+    assert result["final_report"] == {"summary": "3개 서비스 보고서"}
+
+    # 브랜치 완료 순서와 무관하게 보고서에는 입력 순서로 전달
+    call = graph.report_writer.calls[0]
+    assert list(call["risk_assessments"]) == services
+    assert list(call["improvement_suggestions"]) == services
+
+
+def test_graph_without_services_still_reports():
+    """서비스가 없어도 비교/보고서 노드까지 실행되는지 테스트"""
+    graph = _stub_graph()
+
+    result = graph.graph.invoke({"service_names": [], "guidelines": ["EU AI Act"]})
+
+    assert result["final_report"] == {"summary": "0개 서비스 보고서"}
+    assert result["comparison_analysis"] == ""
+    assert graph.report_writer.calls[0]["risk_assessments"] == {}
+
+
+def _wait_finished(manager: JobManager, run_id: str, timeout: float = 5.0):
+    deadline = time.time() + timeout
+    while not manager.get(run_id).finished:
+        assert time.time() < deadline, "작업이 제한 시간 내에 끝나지 않음"
+        time.sleep(0.01)
+    return manager.get(run_id)
+
+
+def test_job_manager_runs_job_in_own_output_dir(tmp_path):
+    """작업별 출력 디렉토리 분리 및 완료 상태 전환 테스트"""
+    def target(service_names, output_dir, on_event):
+        os.makedirs(output_dir, exist_ok=True)
+        emit(on_event, "stage", "분석 중")
+        emit(on_event, "report_token", text="본문")
+        data_path = os.path.join(output_dir, "data.json")
+        save_json({"services": service_names}, data_path)
+        return {"markdown_report": "# 보고서", "data_path": data_path}
+
+    manager = JobManager(max_workers=2, base_output_dir=str(tmp_path))
+    first = manager.submit(["ChatGPT"], target)
+    second = manager.submit(["Claude"], target)
+
+    for run_id, service in ((first, "ChatGPT"), (second, "Claude")):
+        job = _wait_finished(manager, run_id)
+        snapshot = job.snapshot()
+        assert snapshot["status"] == "done"
+        assert snapshot["report_text"] == "본문"
+        assert [event.type for event in snapshot["events"]] == ["stage"]
+        assert job.result["detailed_data"] == {"services": [service]}
+        assert job.output_dir == os.path.join(str(tmp_path), run_id)
+        assert job.finished_at is not None
+
+    assert manager.active_count() == 0
+
+
+def test_job_manager_records_failure(tmp_path):
+    """분석 실패 시 오류와 종료 시각이 함께 기록되는지 테스트"""
+    def target(service_names, output_dir, on_event):
+        raise RuntimeError("검색 실패")
+
+    manager = JobManager(max_workers=1, base_output_dir=str(tmp_path))
+    job = _wait_finished(manager, manager.submit(["ChatGPT"], target))
+
+    assert job.snapshot()["status"] == "failed"
+    assert "검색 실패" in job.snapshot()["error"]
+    assert job.result is None
+    assert job.finished_at is not None
+
+
+def test_service_pipelines_run_concurrently_in_input_order():
+    """서비스 파이프라인 동시 실행 및 입력 순서 결과 반영 테스트"""
+    services = ["ChatGPT", "Claude", "Gemini"]
+    system = AIEthicsAssessmentSystem.__new__(AIEthicsAssessmentSystem)
+    system.service_analyzer = StubServiceAnalyzer(len(services))
+    system.risk_assessor = SlowFirstRiskAssessor(services)
+    system.improvement_advisor = StubImprovementAdvisor()
+    state = AssessmentState(service_names=services)
+    events = []
+
+    system._run_service_pipelines(state, on_event=events.append)
+
+    # 완료 순서는 입력 역순이지만 상태에는 입력 순서로 반영
+    assert system.risk_assessor.finished == list(reversed(services))
+    assert list(state.service_analyses) == services
+    assert list(state.risk_assessments) == services
+    assert list(state.improvement_suggestions) == services
+    assert state.risk_assessments["Gemini"] == {"overall_score": 6}
+    assert sorted(event.data["service"] for event in events) == sorted(services)
+    assert {event.type for event in events} == {"service_done"}
+
+
+class DimensionLLM:
+    """
+    차원별 평가 요청이 모두 동시에 도착해야 응답하는 LLM
+
+    기준 순서상 앞선 차원일수록 늦게 응답하고, 차원마다 다른 점수를 돌려준다.
+    """
+
+    def __init__(self, dimensions):
+        self.dimensions = list(dimensions)
+        self.barrier = threading.Barrier(len(self.dimensions), timeout=5)
+        self.answered = []
+
+    def invoke(self, messages, validate=None, use_cache=True):
+        dimension = re.search(r"평가 차원: (\w+)", messages[-1].content).group(1)
+        self.barrier.wait()
+        index = self.dimensions.index(dimension)
+        time.sleep(0.02 * (len(self.dimensions) - index))
+        self.answered.append(dimension)
+        return AIMessage(content=json.dumps({
+            "score": index % 5 + 1,
+            "description": f"{dimension} 평가",
+            "evidence": ["근거 1", "근거 2"],
+            "guideline_compliance": {},
+            "reasoning": "테스트"
+        }))
+
+
+class EmptySearchTools:
+    def search_service_info(self, service_name, query_type):
+        return []
+
+
+def test_risk_assessor_evaluates_dimensions_concurrently(monkeypatch):
+    """차원별 동시 평가 및 기준 순서대로 결과 수집 테스트"""
+    monkeypatch.setattr(tokens, "tiktoken", None)  # 인코딩 다운로드 없이 추정치 사용
+    eval_tools = EvaluationTools()
+    dimensions = list(eval_tools.load_ethics_criteria())
+
+    assessor = RiskAssessor.__new__(RiskAssessor)
+    assessor.llm = DimensionLLM(dimensions)
+    assessor.rag_tools = RAGTools()
+    assessor.search_tools = EmptySearchTools()
+    assessor.eval_tools = eval_tools
+    assessor.max_workers = len(dimensions)
+
+    result = assessor.assess_risks("ChatGPT", {"service_name": "ChatGPT", "features": ["대화"]})
+
+    # 응답은 기준 역순으로 도착하지만 결과는 기준 순서로 수집
+    assert assessor.llm.answered == list(reversed(dimensions))
+    assert list(result)[:len(dimensions)] == dimensions
+    for index, dimension in enumerate(dimensions):
+        assert result[dimension]["score"] == index % 5 + 1
+        assert result[dimension]["description"] == f"{dimension} 평가"
+    assert result["overall_score"] == eval_tools.calculate_overall_score(
+        {dimension: result[dimension]["score"] for dimension in dimensions}
+    )
+
+
+class FakeReportLLM:
+    def invoke(self, messages):
+        if "Executive Summary" in messages[-1].content:
+            return AIMessage(content="# Executive Summary\n\n요약")
+        return AIMessage(content="# 본문")
+
+
+class FailingPDFGenerator:
+    def generate_report(self, output_path, services, detailed_data):
+        raise OSError("디스크 가득 참")
+
+
+def test_report_writer_keeps_markdown_when_pdf_fails(tmp_path, monkeypatch):
+    """PDF 작업 실패가 마크다운 보고서 조합을 막지 않는지 테스트"""
+    monkeypatch.setattr(tokens, "tiktoken", None)
+    writer = ReportWriter.__new__(ReportWriter)
+    writer.llm = FakeReportLLM()
+    writer.pdf_generator = FailingPDFGenerator()
+
+    result = writer.generate_report(
+        services=["ChatGPT"],
+        service_analyses={"ChatGPT": {"service_name": "ChatGPT"}},
+        risk_assessments={"ChatGPT": {"overall_score": 3.5}},
+        improvement_suggestions={"ChatGPT": []},
+        comparison_analysis="",
+        output_dir=str(tmp_path)
+    )
+
+    assert result["pdf_path"] is None
+    markdown = result["markdown"]
+    assert markdown.index("# Executive Summary") < markdown.index("# 본문")
+
+
+class StreamingReportLLM:
+    """요약은 한 번에, 본문은 청크 단위로 반환하는 ChatModel"""
+
+    model_name = "fake-model"
+    temperature = 0.1
+
+    def __init__(self, body_chunks):
+        self.body_chunks = list(body_chunks)
+        self.stream_calls = 0
+
+    def invoke(self, messages, **kwargs):
+        return AIMessage(content="# Executive Summary\n\n요약")
+
+    def stream(self, messages, **kwargs):
+        self.stream_calls += 1
+        for text in self.body_chunks:
+            yield AIMessageChunk(content=text)
+
+
+def test_report_writer_streams_body_events(tmp_path, monkeypatch):
+    """요약 완료/본문 토큰 이벤트 스트림 테스트 (캐시 적중 시 단일 청크로 재생)"""
+    monkeypatch.setattr(tokens, "tiktoken", None)
+    llm = StreamingReportLLM(["# 본문", "\n\n서비스별 ", "평가"])
+    writer = ReportWriter.__new__(ReportWriter)
+    writer.llm = CachedChatModel(
+        llm,
+        cache=LLMResponseCache([MemoryLRUBackend(max_entries=10)]),
+        usage_tracker=LLMUsageTracker()
+    )
+    writer.pdf_generator = None
+
+    def generate(events):
+        return writer.generate_report(
+            services=["ChatGPT"],
+            service_analyses={"ChatGPT": {"service_name": "ChatGPT"}},
+            risk_assessments={"ChatGPT": {"overall_score": 3.5}},
+            improvement_suggestions={"ChatGPT": []},
+            comparison_analysis="",
+            output_dir=str(tmp_path),
+            on_event=events.append
+        )
+
+    first_events, cached_events = [], []
+    first = generate(first_events)
+    cached = generate(cached_events)
+
+    tokens_first = [e.data["text"] for e in first_events if e.type == "report_token"]
+    assert tokens_first == ["# 본문", "\n\n서비스별 ", "평가"]
+    assert [e.data["text"] for e in first_events if e.type == "report_summary"] == ["# Executive Summary\n\n요약"]
+    assert "# 본문\n\n서비스별 평가" in first["markdown"]
+
+    # 두 번째 실행은 캐시된 본문을 한 청크로 전달
+    assert llm.stream_calls == 1
+    assert [e.data["text"] for e in cached_events if e.type == "report_token"] == ["".join(tokens_first)]
+    assert cached["markdown"] == first["markdown"]
+
+
+def test_emit_ignores_callback_errors():
+    """이벤트 콜백 오류가 분석을 중단시키지 않는지 테스트"""
+    def broken(event):
+        raise RuntimeError("UI 종료")
+
+    emit(broken, "stage", "분석 중")
+    emit(None, "stage", "콜백 없음")
+
+
+def test_shared_system_is_built_once_across_sessions(monkeypatch):
+    """세션/스레드가 여러 개여도 공유 시스템은 백그라운드에서 한 번만 생성되는지 테스트"""
+    release = threading.Event()
+    built = []
+
+    class SlowSystem:
+        def __init__(self):
+            release.wait(5)
+            built.append(self)
+
+    monkeypatch.setattr(app, "AIEthicsAssessmentSystem", SlowSystem)
+    monkeypatch.setattr(app, "_shared_system", None)
+    monkeypatch.setattr(app, "_warmup_thread", None)
+
+    thread = app.warm_up_shared_system()
+    assert app.warm_up_shared_system() is thread
+    assert not app.is_shared_system_ready()  # 초기화 중에도 즉시 반환
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(app.get_shared_system) for _ in range(3)]
+        release.set()
+        systems = [future.result() for future in futures]
+    thread.join(5)
+
+    assert len(built) == 1
+    assert all(system is built[0] for system in systems)
+    assert app.is_shared_system_ready()
@@ -0,0 +1,684 @@
+"""
+도구 함수 테스트
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from reportlab.lib.styles import ParagraphStyle
+
+from config.settings import ETHICS_DIMENSIONS
+from prompts.risk_assessment import RISK_ASSESSMENT_DYNAMIC_FIELDS, RISK_ASSESSMENT_PROMPT
+from tools import prompt_packer, search_cache
+from tools.comparison_engine import ComparisonEngine
+from tools.criteria_registry import CriteriaRegistry, compile_criteria
+from tools.guideline_index import GuidelineChunk, GuidelineIndex, tokenize
+from tools.keyword_matcher import KeywordAutomaton
+from tools.llm_cache import (
+    CachedChatModel,
+    DiskBackend,
+    LLMResponseCache,
+    LLMUsageTracker,
+    MemoryLRUBackend,
+    is_json_reply
+)
+from tools.pdf_cache import PDFArtifactCache
+from tools.pdf_styles import get_style_sheet
+from tools.prompt_packer import TRUNCATION_MARKER, PromptSection, pack_sections, render_prompt
+from tools.rag_tools import NO_CONTEXT, RAGTools
+from tools.report_pdf_enhanced import EnhancedPDFReportGenerator
+from tools.search_cache import SearchCache
+from tools.search_planner import SearchPlan
+from utils import tokens
+from utils.task_graph import run_task_graph
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """time.time()을 고정된 값으로 대체 (now[0]을 바꿔 시간 경과 표현)"""
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_search_cache_key_normalizes_query():
+    """검색 캐시 키 정규화 테스트 (대소문자/공백 무시, 옵션은 구분)"""
+    key = SearchCache.make_key("ChatGPT  privacy", 5, "advanced")
+
+    assert key == SearchCache.make_key("chatgpt privacy ", 5, "advanced")
+    assert key != SearchCache.make_key("chatgpt privacy", 3, "advanced")
+    assert key != SearchCache.make_key("chatgpt privacy", 5, "basic")
+
+
+def test_search_cache_ttl_expiry(tmp_path, clock):
+    """질의 유형별 TTL 만료 테스트"""
+    cache = SearchCache(
+        db_path=str(tmp_path / "search.sqlite"),
+        max_entries=10,
+        ttl={"news": 60, "default": 3600}
+    )
+    cache.set("news", "news", [{"title": "a"}])
+    cache.set("other", "overview", [{"title": "b"}])
+
+    clock[0] += 120
+    assert cache.get("news") is None
+    assert cache.get("other") == [{"title": "b"}]
+    assert cache.stats()["entries"] == 1
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_search_cache_lru_eviction(tmp_path, clock):
+    """용량 초과 시 가장 오래 사용되지 않은 항목 제거 테스트"""
+    cache = SearchCache(db_path=str(tmp_path / "search.sqlite"), max_entries=2, ttl={"default": 3600})
+
+    cache.set("a", "default", [1])
+    clock[0] += 1
+    cache.set("b", "default", [2])
+    clock[0] += 1
+    assert cache.get("a") == [1]  # a를 최근 사용으로 갱신
+    clock[0] += 1
+    cache.set("c", "default", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+    assert cache.stats()["entries"] == 2
+
+
+class CountingSearchTools:
+    """호출 횟수를 (서비스, 질의 유형)별로 세는 검색 도구"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def search_service_info(self, service_name, query_type="overview"):
+        with self._lock:
+            self.calls.append((service_name, query_type))
+        return [{"title": f"{service_name} {query_type}", "content": ""}]
+
+
+def test_search_plan_runs_each_query_once():
+    """에이전트 간 중복 질의를 한 번만 실행하고 결과를 나누어 주는지 테스트"""
+    search_tools = CountingSearchTools()
+    services = ["ChatGPT", "Claude"]
+
+    with SearchPlan(search_tools, max_workers=4) as plan:
+        plan.prefetch(services, ["overview", "privacy", "overview", "fairness"])
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda args: plan.search_service_info(*args),
+                [(service, "privacy") for service in services] * 3
+            ))
+        results[0].append({"title": "호출자 수정"})  # 호출자별 사본이므로 다른 결과에 영향 없음
+        extra = plan.search_service_info("ChatGPT", "safety")  # 계획에 없던 질의
+        stats = plan.stats()
+
+    assert sorted(search_tools.calls) == sorted(
+        [(service, query) for service in services for query in ("overview", "privacy", "fairness")]
+        + [("ChatGPT", "safety")]
+    )
+    assert results[2] == [{"title": "ChatGPT privacy", "content": ""}]
+    assert extra == [{"title": "ChatGPT safety", "content": ""}]
+    assert stats == {"requested": 7, "unique_queries": 7}
+
+
+def test_llm_cache_key_includes_model_settings():
+    """LLM 캐시 키 테스트 (모델/temperature/설정/메시지가 다르면 다른 키)"""
+    messages = [SystemMessage(content="system"), HumanMessage(content="평가해줘")]
+    key = LLMResponseCache.make_key("gpt-4o-mini", 0.1, messages, {"max_tokens": 1000})
+
+    assert key == LLMResponseCache.make_key(
+        "gpt-4o-mini", 0.1, messages, {"max_tokens": 1000, "seed": None}
+    )
+    assert key != LLMResponseCache.make_key("gpt-4o", 0.1, messages, {"max_tokens": 1000})
+    assert key != LLMResponseCache.make_key("gpt-4o-mini", 0.7, messages, {"max_tokens": 1000})
+    assert key != LLMResponseCache.make_key("gpt-4o-mini", 0.1, messages, {"max_tokens": 2000})
+    assert key != LLMResponseCache.make_key(
+        "gpt-4o-mini", 0.1, messages[1:], {"max_tokens": 1000}
+    )
+
+
+def test_llm_cache_promotes_disk_hit_to_memory(tmp_path):
+    """디스크 백엔드 적중 시 메모리 백엔드로 승격 테스트"""
+    memory = MemoryLRUBackend(max_entries=10)
+    disk = DiskBackend(cache_dir=str(tmp_path / "llm"), max_entries=10, ttl=3600)
+    cache = LLMResponseCache([memory, disk])
+
+    disk.set("key", "cached reply")
+    assert memory.get("key") is None
+
+    assert cache.get("key") == "cached reply"
+    assert memory.get("key") == "cached reply"
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_llm_disk_cache_size_limit(tmp_path):
+    """디스크 캐시 최대 항목 수 제한 테스트"""
+    disk = DiskBackend(cache_dir=str(tmp_path / "llm"), max_entries=3, ttl=3600)
+    for i in range(6):
+        disk.set(f"{i:02d}key", f"reply {i}")
+
+    assert len(disk._entries()) == 3
+
+
+class FakeChatModel:
+    """정해진 응답을 순서대로 반환하는 테스트용 ChatModel"""
+
+    def __init__(self, replies):
+        self.model_name = "fake-model"
+        self.temperature = 0.1
+        self.replies = list(replies)
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        return AIMessage(content=self.replies.pop(0))
+
+
+def test_cached_chat_model_stores_only_valid_replies():
+    """validate를 통과한 응답만 캐시에 저장 테스트"""
+    cache = LLMResponseCache([MemoryLRUBackend(max_entries=10)])
+    llm = FakeChatModel(["not json", '{"score": 3}', '{"score": 4}'])
+    model = CachedChatModel(llm, cache=cache)
+    messages = [HumanMessage(content="평가해줘")]
+
+    assert model.invoke(messages, validate=is_json_reply).content == "not json"
+    assert model.invoke(messages, validate=is_json_reply).content == '{"score": 3}'
+    assert model.invoke(messages, validate=is_json_reply).content == '{"score": 3}'
+    assert llm.calls == 2
+
+    # use_cache=False는 캐시를 건너뛰고 다시 요청
+    assert model.invoke(messages, use_cache=False).content == '{"score": 4}'
+    assert llm.calls == 3
+
+
+class UsageChatModel:
+    """토큰 사용량 메타데이터가 포함된 응답을 반환하는 ChatModel"""
+
+    model_name = "fake-model"
+    temperature = 0.1
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+
+    def invoke(self, messages, **kwargs):
+        return self.replies.pop(0)
+
+
+def test_cached_chat_model_records_prompt_cache_usage():
+    """실제 호출의 입력/캐시/출력 토큰만 집계하는지 테스트 (응답 캐시 적중은 제외)"""
+    tracker = LLMUsageTracker()
+    llm = UsageChatModel([
+        AIMessage(content="첫 응답", usage_metadata={
+            "input_tokens": 1000, "output_tokens": 50, "total_tokens": 1050,
+            "input_token_details": {"cache_read": 0}
+        }),
+        # usage_metadata가 없는 버전은 OpenAI token_usage 사용
+        AIMessage(content="두 번째 응답", response_metadata={"token_usage": {
+            "prompt_tokens": 1000, "completion_tokens": 30,
+            "prompt_tokens_details": {"cached_tokens": 768}
+        }})
+    ])
+    model = CachedChatModel(llm, cache=LLMResponseCache([MemoryLRUBackend(max_entries=10)]), usage_tracker=tracker)
+
+    before = tracker.stats()
+    model.invoke([HumanMessage(content="서비스 A")])
+    model.invoke([HumanMessage(content="서비스 A")])  # 응답 캐시 적중
+    model.invoke([HumanMessage(content="서비스 B")])
+    usage = LLMUsageTracker.diff(before, tracker.stats())
+
+    assert usage["calls"] == 2
+    assert usage["prompt_tokens"] == 2000
+    assert usage["cached_prompt_tokens"] == 768
+    assert usage["cached_ratio"] == 0.384
+    assert usage["completion_tokens"] == 80
+
+
+def _render_risk_prompt(service_name):
+    return render_prompt(
+        RISK_ASSESSMENT_PROMPT,
+        RISK_ASSESSMENT_DYNAMIC_FIELDS,
+        service_name=service_name,
+        service_analysis=f"{service_name} 분석",
+        dimension="privacy",
+        dimension_description="개인정보 보호",
+        guideline_context="### EU AI Act\nGDPR 준수",
+        search_context=f"{service_name} 검색 결과",
+        evaluation_criteria="프라이버시 보호"
+    )
+
+
+def test_render_prompt_puts_static_sections_first(monkeypatch):
+    """서비스별 필드가 들어간 섹션이 뒤로 가서 정적 접두부가 서비스 간 동일한지 테스트"""
+    monkeypatch.setattr(prompt_packer, "PROMPT_PREFIX_CACHING", True)
+    first, second = _render_risk_prompt("ChatGPT"), _render_risk_prompt("Claude")
+
+    prefix = os.path.commonprefix([first, second])
+    for static in ("## 평가 기준", "## 참고 가이드라인", "GDPR 준수", "## 응답 형식", '"score"'):
+        assert static in prefix
+    assert "ChatGPT" not in prefix
+    assert first.index("## 서비스 정보") < first.index("## 서비스 분석 결과") < first.index("## 추가 검색 정보")
+    assert first.index("## 응답 형식") < first.index("## 서비스 정보")
+
+    # 비활성화 시 원래 템플릿 순서 유지
+    monkeypatch.setattr(prompt_packer, "PROMPT_PREFIX_CACHING", False)
+    original = _render_risk_prompt("ChatGPT")
+    assert original.index("## 서비스 정보") < original.index("## 평가 기준") < original.index("## 응답 형식")
+    assert sorted(original.split()) == sorted(first.split())
+
+
+def test_keyword_automaton_matches_substring_semantics():
+    """Aho-Corasick 매처가 `keyword in text`와 같은 결과를 내는지 테스트"""
+    keywords = ["개인정보", "정보", "편향", "he", "she", "hers", "his", "차별 금지"]
+    automaton = KeywordAutomaton(keywords)
+
+    text = "ushers는 개인정보 보호와 차별 금지를 강조한다"
+    assert automaton.find_all(text) == {k for k in keywords if k in text}
+    assert automaton.find_all("") == set()
+
+
+def test_keyword_automaton_random_texts():
+    """임의 문자열에서 단순 부분 문자열 검사와 결과 비교 테스트"""
+    rng = random.Random(0)
+    alphabet = "abc가나"
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(30)]
+    automaton = KeywordAutomaton(keywords + [""])
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert automaton.find_all(text) == {k for k in keywords if k in text}
+
+
+def _criteria_config(**dimensions):
+    return {
+        "risk_dimensions": {
+            name: {"name": name, "description": f"{name} 설명", "weight": weight}
+            for name, weight in dimensions.items()
+        }
+    }
+
+
+def test_compile_criteria():
+    """평가 기준 컴파일 테스트 (순서/가중치 벡터 유지)"""
+    compiled = compile_criteria(_criteria_config(fairness=0.6, privacy=0.4))
+
+    assert compiled.dimensions == ("fairness", "privacy")
+    assert compiled.weights == (0.6, 0.4)
+    assert compiled.index["privacy"] == 1
+    assert compiled.criteria["fairness"]["evaluation_points"] == ()
+
+
+@pytest.mark.parametrize("raw", [
+    {},
+    {"risk_dimensions": {"fairness": "bad"}},
+    {"risk_dimensions": {"fairness": {"name": "공정성"}}},
+    _criteria_config(fairness=-1),
+    _criteria_config(fairness=True),
+    _criteria_config(fairness=0, privacy=0),
+])
+def test_compile_criteria_rejects_invalid(raw):
+    """잘못된 평가 기준 설정 검증 테스트"""
+    with pytest.raises(ValueError):
+        compile_criteria(raw)
+
+
+def test_criteria_registry_keeps_last_good_criteria(tmp_path):
+    """수정된 파일이 잘못된 경우 마지막으로 성공한 기준 유지 테스트"""
+    path = tmp_path / "ethics_criteria.json"
+    path.write_text(json.dumps(_criteria_config(fairness=1.0)), encoding="utf-8")
+    os.utime(path, (100, 100))
+    registry = CriteriaRegistry(path=str(path))
+
+    assert registry.get().dimensions == ("fairness",)
+
+    path.write_text("{broken", encoding="utf-8")
+    os.utime(path, (200, 200))
+    assert registry.get().dimensions == ("fairness",)
+
+    path.write_text(json.dumps(_criteria_config(fairness=0.5, privacy=0.5)), encoding="utf-8")
+    os.utime(path, (300, 300))
+    assert registry.get().dimensions == ("fairness", "privacy")
+
+
+def test_criteria_registry_fails_without_valid_file(tmp_path):
+    """최초 로드 시 잘못된 파일은 에러 발생 테스트"""
+    path = tmp_path / "ethics_criteria.json"
+    path.write_text(json.dumps({"risk_dimensions": {}}), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        CriteriaRegistry(path=str(path)).get()
+
+
+def test_comparison_engine_ranking():
+    """전체 점수 순위 테스트 (동점은 입력 순서 유지)"""
+    assessments = {
+        "A": {"overall_score": 6.0, "fairness": {"score": 6}},
+        "B": {"overall_score": 8.5, "fairness": {"score": 9}},
+        "C": {"overall_score": 6.0, "fairness": {"score": 3}},
+    }
+    comparison = ComparisonEngine(percentiles=[50]).compare(assessments, ["fairness"])
+
+    assert [r["service"] for r in comparison["service_rankings"]] == ["B", "A", "C"]
+    assert comparison["service_rankings"][0]["overall_score"] == 8.5
+
+    fairness = comparison["dimension_comparison"]["fairness"]
+    assert fairness["best"] == {"service": "B", "score": 9}
+    assert fairness["worst"] == {"service": "C", "score": 3}
+    assert fairness["average"] == 6.0
+    assert fairness["percentiles"] == {"p50": 6.0}
+    assert comparison["statistics"]["service_count"] == 3
+
+
+def test_comparison_engine_skips_missing_scores():
+    """평가되지 않은 차원(NaN) 처리 테스트"""
+    assessments = {
+        "A": {"overall_score": 5, "fairness": {"score": 4}},
+        "B": {"overall_score": 7, "fairness": {"score": 8}, "privacy": {"score": 7}},
+    }
+    comparison = ComparisonEngine().compare(assessments, ["fairness", "privacy", "safety"])
+    dimensions = comparison["dimension_comparison"]
+
+    assert "safety" not in dimensions
+    assert dimensions["privacy"]["scores"] == {"B": 7}
+    assert dimensions["privacy"]["best"]["service"] == "B"
+    assert dimensions["privacy"]["worst"]["service"] == "B"
+    assert dimensions["privacy"]["average"] == 7.0
+    assert dimensions["privacy"]["z_scores"] == {"B": 0.0}
+    assert dimensions["fairness"]["z_scores"] == {"A": -1.0, "B": 1.0}
+    json.dumps(comparison)  # NumPy 값 없이 직렬화 가능해야 함
+
+
+def test_comparison_engine_empty():
+    """평가 결과가 없을 때 빈 비교 결과 테스트"""
+    comparison = ComparisonEngine().compare({}, ["fairness"])
+    assert comparison["service_rankings"] == []
+    assert comparison["dimension_comparison"] == {}
+
+
+def test_tokenize_hangul_bigrams():
+    """한글 음절 bigram / 영문 단어 토큰화 테스트"""
+    assert tokenize("개인정보를 AI Act") == ["ai", "act", "개인", "인정", "정보", "보를"]
+    assert tokenize("및 EU") == ["eu", "및"]
+
+
+def _guideline_chunks():
+    return [
+        GuidelineChunk("c0", "privacy", "EU AI Act", "개인정보 처리 시 동의를 받아야 한다", "guidelines_db"),
+        GuidelineChunk("c1", "fairness", "UNESCO", "알고리즘 편향과 차별을 점검해야 한다", "guidelines_db"),
+        GuidelineChunk("c2", "privacy", "OECD", "데이터 최소화 원칙을 따른다", "guidelines_db"),
+    ]
+
+
+def test_guideline_index_bm25_ranking():
+    """BM25 검색 순위 테스트 (조사가 붙은 어절도 부분 일치)"""
+    index = GuidelineIndex(_guideline_chunks())
+
+    results = index.search("개인정보의 동의", top_k=2)
+    assert results[0]["chunk_id"] == "c0"
+    assert results[0]["score"] > 0
+
+    assert [r["chunk_id"] for r in index.search("편향 차별")] == ["c1"]
+    assert index.search("편향", dimension="privacy") == []
+    assert index.search("blockchain") == []
+
+
+def test_guideline_index_save_and_load(tmp_path):
+    """인덱스 저장/로드 및 fingerprint 불일치 시 재생성 테스트"""
+    chunks = _guideline_chunks()
+    path = str(tmp_path / "guideline_index.json")
+    index = GuidelineIndex(chunks)
+    index.save(path)
+
+    loaded = GuidelineIndex.load(path, index.fingerprint)
+    assert loaded is not None
+    assert loaded.search("데이터 최소화") == index.search("데이터 최소화")
+    assert GuidelineIndex.load(path, "other") is None
+
+
+def _prompt_sections():
+    return [
+        PromptSection.precounted("service", "서비스 " * 50, tokens=50, priority=0, min_tokens=50),
+        PromptSection.precounted("guidelines", "가이드라인 " * 40, tokens=40, priority=1, min_tokens=10),
+        PromptSection.precounted("search", "검색 결과 " * 30, tokens=30, priority=2),
+    ]
+
+
+def test_pack_sections_within_budget():
+    """예산 이내이거나 예산이 없으면 자르지 않음 테스트"""
+    sections = _prompt_sections()
+
+    for budget in (None, 120):
+        packed = pack_sections(sections, budget)
+        assert packed.truncated == []
+        assert packed.total_tokens == packed.original_tokens == 120
+        assert packed["search"] == sections[2].text
+
+
+def test_pack_sections_truncates_lowest_priority_first(monkeypatch):
+    """우선순위가 낮은 섹션부터 min_tokens까지 자르는지 테스트"""
+    monkeypatch.setattr(tokens, "tiktoken", None)  # 인코딩 다운로드 없이 추정치로 자름
+    sections = _prompt_sections()
+
+    packed = pack_sections(sections, 100)
+    assert packed.truncated == ["search"]
+    assert packed.total_tokens == 100
+    assert packed["search"].endswith(TRUNCATION_MARKER)
+    assert packed["guidelines"] == sections[1].text
+
+    packed = pack_sections(sections, 40)
+    assert packed.truncated == ["search", "guidelines"]
+    assert packed.total_tokens == 60  # 모든 섹션이 min_tokens까지 줄어든 상태
+    assert packed["service"] == sections[0].text
+    assert packed["guidelines"].endswith(TRUNCATION_MARKER)
+
+
+def test_guideline_context_table_built_once(monkeypatch):
+    """가이드라인 이름 정규화/중복 제거 및 차원별 컨텍스트 테이블 재사용 테스트"""
+    monkeypatch.setattr(tokens, "tiktoken", None)
+    rag_tools = RAGTools()
+    guidelines = ["EU AI Act", "UNESCO AI Ethics", "OECD AI Principles", "UNESCO", "Unknown"]
+
+    table = rag_tools.build_context_table(guidelines)
+    assert rag_tools.build_context_table(list(guidelines)) is table
+    assert set(table) == set(rag_tools.guidelines_db)
+
+    entry = rag_tools.get_context_entry("privacy", guidelines)
+    assert entry.guidelines == ("EU AI Act", "UNESCO", "OECD")
+    assert entry.text.startswith("### EU AI Act\n개인정보 보호는")
+    assert "\n                " not in entry.text  # 들여쓰기 제거
+    assert entry.token_count == tokens.count_tokens(entry.text)
+    assert rag_tools.get_guideline_context("privacy", guidelines) == entry.text
+
+    assert rag_tools.get_context_entry("unknown_dimension", guidelines).text == NO_CONTEXT
+    assert rag_tools.get_context_entry("privacy", ["Unknown"]).text == NO_CONTEXT
+
+
+def test_precounted_guideline_context_kept_within_budget(monkeypatch):
+    """예산 초과 시 사전 계산된 가이드라인 컨텍스트보다 검색 정보를 먼저 자르는지 테스트"""
+    monkeypatch.setattr(tokens, "tiktoken", None)
+    entry = RAGTools().get_context_entry("fairness", ["EU AI Act", "OECD AI Principles"])
+    search = PromptSection("search_context", "검색 결과 " * 200, priority=2)
+
+    packed = pack_sections([
+        PromptSection.precounted(
+            "guideline_context", entry.text, entry.token_count,
+            priority=0, min_tokens=entry.token_count // 2
+        ),
+        search
+    ], entry.token_count + search.tokens // 2)
+
+    assert packed.truncated == ["search_context"]
+    assert packed["guideline_context"] == entry.text
+
+
+def _pdf_report_data(services):
+    def assessment(score):
+        result = {
+            dimension: {
+                "score": score,
+                "risk_level": "중간",
+                "findings": ["발견사항"],
+                "recommendations": ["권고"]
+            }
+            for dimension in ETHICS_DIMENSIONS
+        }
+        result.update({"overall_score": score, "overall_risk_level": "중간"})
+        return result
+
+    return {
+        "service_analyses": {s: {"description": f"{s} 설명"} for s in services},
+        "risk_assessments": {s: assessment(3 + i) for i, s in enumerate(services)},
+        "improvement_suggestions": {s: [{"title": "개선안", "priority": "높음"}] for s in services},
+    }
+
+
+def _pdf_pages(path):
+    """페이지별 텍스트 (표지의 생성 시각은 두 렌더링 간에 다를 수 있어 제거)"""
+    pypdf = pytest.importorskip("pypdf")
+    timestamp = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+    return [timestamp.sub("", page.extract_text()) for page in pypdf.PdfReader(path).pages]
+
+
+def test_pdf_section_rendering_matches_single_build(tmp_path):
+    """섹션 병렬 렌더링(workers>1)과 단일 빌드(workers=1)의 페이지 수/텍스트 비교 테스트"""
+    pytest.importorskip("pypdf")
+    services = ["ChatGPT", "Claude"]
+    data = _pdf_report_data(services)
+    generator = EnhancedPDFReportGenerator()
+
+    single = str(tmp_path / "single.pdf")
+    parallel = str(tmp_path / "parallel.pdf")
+    generator.generate_report(single, services, data, section_workers=1)
+    generator.generate_report(parallel, services, data, section_workers=2)
+
+    single_pages = _pdf_pages(single)
+    assert len(single_pages) >= len(generator._section_specs(services, data))  # 섹션마다 새 페이지
+    assert _pdf_pages(parallel) == single_pages
+
+
+def test_pdf_cache_renders_same_content_once(tmp_path):
+    """같은 내용의 동시 요청은 한 번만 렌더링하고 내용이 다르면 새로 렌더링하는지 테스트"""
+    cache = PDFArtifactCache(cache_dir=str(tmp_path), max_entries=10)
+    rendered = []
+    data = {"risk_assessments": {"ChatGPT": {"overall_score": 3.5}}}
+
+    def render(output_path):
+        rendered.append(output_path)
+        time.sleep(0.05)
+        with open(output_path, "wb") as f:
+            f.write(b"%PDF-1.4")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(executor.map(
+            lambda _: cache.get_or_render(["ChatGPT"], data, "# 보고서", render), range(4)
+        ))
+
+    assert len(set(paths)) == 1 and len(rendered) == 1
+    assert os.path.basename(paths[0]) == PDFArtifactCache.make_key(["ChatGPT"], data, "# 보고서") + ".pdf"
+
+    other = cache.get_or_render(["ChatGPT"], data, "# 수정된 보고서", render)
+    assert other != paths[0] and len(rendered) == 2
+
+
+def test_pdf_cache_evicts_least_recently_used(tmp_path):
+    """최근 사용 시각 기준 개수 제한 테스트"""
+    cache = PDFArtifactCache(cache_dir=str(tmp_path), max_entries=2)
+
+    def render(output_path):
+        with open(output_path, "wb") as f:
+            f.write(b"%PDF-1.4")
+
+    first = cache.get_or_render(["A"], {}, "", render)
+    second = cache.get_or_render(["B"], {}, "", render)
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+    cache.get_or_render(["A"], {}, "", render)  # 적중 시 mtime 갱신
+    cache.get_or_render(["C"], {}, "", render)
+
+    assert os.path.exists(first)
+    assert not os.path.exists(second)
+
+
+def test_pdf_cache_failed_render_leaves_no_entry(tmp_path):
+    """렌더링 실패 시 임시 파일/캐시 항목이 남지 않는지 테스트"""
+    cache = PDFArtifactCache(cache_dir=str(tmp_path), max_entries=2)
+
+    def render(output_path):
+        with open(output_path, "wb") as f:
+            f.write(b"%PDF")
+        raise RuntimeError("폰트 없음")
+
+    with pytest.raises(RuntimeError, match="폰트 없음"):
+        cache.get_or_render(["A"], {}, "", render)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_style_sheet_is_built_once_and_copied():
+    """스타일 시트는 한 번만 생성하고, 한 생성기의 스타일 수정이 다른 생성기에 전파되지 않는지 테스트"""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"title": ParagraphStyle("Title", fontName="Helvetica", fontSize=28)}
+
+    first = get_style_sheet("test-copy", "Helvetica", factory)
+    second = get_style_sheet("test-copy", "Helvetica", factory)
+    first["title"].fontSize = 10
+
+    assert len(calls) == 1
+    assert second["title"].fontSize == 28
+    assert get_style_sheet("test-copy", "Helvetica", factory)["title"].fontSize == 28
+    with pytest.raises(TypeError):
+        first["title"] = None
+
+
+def test_task_graph_runs_independent_tasks_concurrently():
+    """선행 작업이 없는 작업 동시 실행 및 선행 결과 전달 테스트"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def independent(value):
+        barrier.wait()  # 두 작업이 동시에 실행되어야 통과
+        return value
+
+    results = run_task_graph({
+        "summary": (lambda: independent("요약"), []),
+        "main_report": (lambda: independent("본문"), []),
+        "markdown": (lambda summary, main_report: f"{summary}\n{main_report}", ["summary", "main_report"])
+    }, max_workers=2)
+
+    assert results == {"summary": "요약", "main_report": "본문", "markdown": "요약\n본문"}
+
+
+def test_task_graph_failure_skips_dependents():
+    """작업 실패 시 예외를 전달하고 후속 작업은 실행하지 않는지 테스트"""
+    ran = []
+
+    def fail():
+        raise RuntimeError("요약 실패")
+
+    with pytest.raises(RuntimeError, match="요약 실패"):
+        run_task_graph({
+            "summary": (fail, []),
+            "markdown": (lambda summary: ran.append("markdown"), ["summary"])
+        }, max_workers=2)
+
+    assert ran == []
+
+
+@pytest.mark.parametrize("tasks", [
+    {"a": (lambda b: b, ["b"]), "b": (lambda a: a, ["a"])},
+    {"a": (lambda missing: missing, ["missing"])}
+])
+def test_task_graph_rejects_invalid_dependencies(tasks):
+    """순환 의존성 및 알 수 없는 선행 작업 오류 테스트"""
+    with pytest.raises(ValueError):
+        run_task_graph(tasks)
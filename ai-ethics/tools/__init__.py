@@ -1,3 +1,5 @@
 from .evaluation_tools import EvaluationTools
 from .rag_tools import RAGTools
 from .search_tools import SearchTools
+from .search_cache import SearchCache
+from .search_planner import SearchPlan
@@ -0,0 +1,178 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from config.settings import COMPARISON_PERCENTILES
+from tools.evaluation_tools import EvaluationTools
+from utils.helpers import load_json
+
+
+def _to_python(value: float):
+    """NumPy 실수를 JSON 직렬화 가능한 값으로 변환 (정수 점수는 int 유지)"""
+    value = float(value)
+    return int(value) if value.is_integer() else round(value, 2)
+
+
+@dataclass
+class ScoreMatrix:
+    """서비스 × 차원 점수 행렬 (평가가 없는 칸은 NaN)"""
+
+    services: List[str]
+    dimensions: List[str]
+    scores: np.ndarray  # shape: (서비스 수, 차원 수)
+    overall: np.ndarray  # shape: (서비스 수,)
+
+    @classmethod
+    def from_assessments(
+        cls,
+        assessments: Dict[str, Dict],
+        dimensions: Sequence[str]
+    ) -> "ScoreMatrix":
+        services = list(assessments)
+        scores = np.full((len(services), len(dimensions)), np.nan)
+        overall = np.zeros(len(services))
+
+        for i, service in enumerate(services):
+            assessment = assessments[service]
+            overall[i] = assessment.get("overall_score", 0)
+            for j, dimension in enumerate(dimensions):
+                if dimension in assessment:
+                    scores[i, j] = assessment[dimension].get("score", 0)
+
+        return cls(services, list(dimensions), scores, overall)
+
+
+class ComparisonEngine:
+    """
+    NumPy 기반 다중 서비스 비교 엔진
+
+    서비스 수에 제한 없이 순위, 차원별 최고/최저/평균/백분위수, z-score를
+    행렬 연산으로 계산한다. 결과는 EvaluationTools.compare_services와 같은 구조에
+    percentiles, std, z_scores와 statistics 항목이 추가된 형태다.
+    """
+
+    def __init__(self, percentiles: Sequence[int] = COMPARISON_PERCENTILES):
+        self.percentiles = list(percentiles)
+
+    def compare(self, assessments: Dict[str, Dict], dimensions: Sequence[str]) -> Dict:
+        comparison = {
+            "service_rankings": [],
+            "dimension_comparison": {},
+            "statistics": {}
+        }
+        if not assessments:
+            return comparison
+
+        matrix = ScoreMatrix.from_assessments(assessments, dimensions)
+        services = matrix.services
+
+        # 전체 점수로 순위 매기기 (동점은 입력 순서 유지)
+        order = np.argsort(-matrix.overall, kind="stable")
+        comparison["service_rankings"] = [
+            {
+                "service": services[i],
+                "overall_score": _to_python(matrix.overall[i]),
+                "risk_level": EvaluationTools.get_risk_level(matrix.overall[i])
+            }
+            for i in order
+        ]
+
+        # 차원별 비교 - 평가된 서비스가 하나도 없는 차원은 제외
+        scores = matrix.scores
+        valid = ~np.isnan(scores)
+        has_scores = valid.any(axis=0)
+        if has_scores.any():
+            scored = scores[:, has_scores]
+            # nanargmax/nanargmin은 동점일 때 먼저 나온 서비스를 반환
+            best = np.nanargmax(scored, axis=0)
+            worst = np.nanargmin(scored, axis=0)
+            mean = np.nanmean(scored, axis=0)
+            std = np.nanstd(scored, axis=0)
+            pct = np.nanpercentile(scored, self.percentiles, axis=0) if self.percentiles else None
+            safe_std = np.where(std > 0, std, 1.0)
+            z_scores = np.where(std > 0, (scored - mean) / safe_std, 0.0)
+
+            scored_dims = [d for d, ok in zip(matrix.dimensions, has_scores) if ok]
+            scored_valid = valid[:, has_scores]
+            for j, dimension in enumerate(scored_dims):
+                rows = np.flatnonzero(scored_valid[:, j])
+                comparison["dimension_comparison"][dimension] = {
+                    "scores": {services[i]: _to_python(scored[i, j]) for i in rows},
+                    "best": {
+                        "service": services[best[j]],
+                        "score": _to_python(scored[best[j], j])
+                    },
+                    "worst": {
+                        "service": services[worst[j]],
+                        "score": _to_python(scored[worst[j], j])
+                    },
+                    "average": round(float(mean[j]), 2),
+                    "std": round(float(std[j]), 2),
+                    "percentiles": {
+                        f"p{p}": round(float(pct[k, j]), 2)
+                        for k, p in enumerate(self.percentiles)
+                    } if pct is not None else {},
+                    "z_scores": {services[i]: round(float(z_scores[i, j]), 2) for i in rows}
+                }
+
+        overall_pct = np.percentile(matrix.overall, self.percentiles) if self.percentiles else []
+        comparison["statistics"] = {
+            "service_count": len(services),
+            "overall_average": round(float(matrix.overall.mean()), 2),
+            "overall_std": round(float(matrix.overall.std()), 2),
+            "overall_percentiles": {
+                f"p{p}": round(float(v), 2) for p, v in zip(self.percentiles, overall_pct)
+            }
+        }
+
+        return comparison
+
+
+def summarize_comparison(comparison: Dict, top_n: int = 5) -> Dict:
+    """
+    LLM 프롬프트용 요약 비교 데이터
+
+    서비스가 많을 때 전체 평가 결과 대신 상/하위 순위와 차원별 통계만 전달한다.
+    """
+    rankings = comparison.get("service_rankings", [])
+    return {
+        "statistics": comparison.get("statistics", {}),
+        "top_services": rankings[:top_n],
+        "bottom_services": rankings[-top_n:] if len(rankings) > top_n else [],
+        "dimension_comparison": {
+            dimension: {
+                key: data[key]
+                for key in ("best", "worst", "average", "std", "percentiles")
+                if key in data
+            }
+            for dimension, data in comparison.get("dimension_comparison", {}).items()
+        }
+    }
+
+
+def load_saved_assessments(data_paths: Iterable[str]) -> Dict[str, Dict]:
+    """
+    저장된 상세 데이터(*_data.json)에서 서비스별 리스크 평가 수집
+
+    같은 서비스가 여러 번 평가된 경우 "서비스명 (파일명)" 형태로 구분한다.
+    """
+    assessments: Dict[str, Dict] = {}
+    for path in data_paths:
+        data = load_json(path)
+        label = os.path.splitext(os.path.basename(path))[0]
+        for service, assessment in data.get("risk_assessments", {}).items():
+            key = service if service not in assessments else f"{service} ({label})"
+            assessments[key] = assessment
+    return assessments
+
+
+_default_engine: Optional[ComparisonEngine] = None
+
+
+def get_comparison_engine() -> ComparisonEngine:
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = ComparisonEngine()
+    return _default_engine
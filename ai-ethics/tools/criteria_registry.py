@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from config.settings import ETHICS_CRITERIA_PATH, ETHICS_DIMENSIONS
+
+
+@dataclass(frozen=True)
+class CompiledCriteria:
+    """검증을 마친 읽기 전용 평가 기준"""
+
+    dimensions: Tuple[str, ...]  # 평가 차원 (설정 파일 순서)
+    index: Mapping[str, int]  # 차원 → 위치
+    weights: Tuple[float, ...]  # dimensions 순서의 가중치 벡터
+    weight_of: Mapping[str, float]  # 차원 → 가중치
+    criteria: Mapping[str, Mapping]  # 차원 → {name, description, weight, evaluation_points}
+    evaluation_scale: Mapping[str, str]
+    source: str
+    mtime: float
+
+
+def compile_criteria(raw: Dict, source: str = "", mtime: float = 0.0) -> CompiledCriteria:
+    """
+    ethics_criteria.json 형식의 dict를 검증하고 컴파일
+
+    형식이 잘못된 경우 ValueError 발생
+    """
+    dimensions_raw = raw.get("risk_dimensions")
+    if not isinstance(dimensions_raw, dict) or not dimensions_raw:
+        raise ValueError("risk_dimensions가 비어 있거나 dict가 아닙니다")
+
+    criteria = {}
+    for dimension, config in dimensions_raw.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"[{dimension}] 설정이 dict가 아닙니다")
+
+        for field in ("name", "description"):
+            if not isinstance(config.get(field), str) or not config[field]:
+                raise ValueError(f"[{dimension}] 필수 필드 누락: {field}")
+
+        weight = config.get("weight", 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"[{dimension}] 유효하지 않은 가중치: {weight}")
+
+        points = config.get("evaluation_points", [])
+        if not isinstance(points, list) or not all(isinstance(p, str) for p in points):
+            raise ValueError(f"[{dimension}] evaluation_points는 문자열 목록이어야 합니다")
+
+        criteria[dimension] = MappingProxyType({
+            "name": config["name"],
+            "description": config["description"],
+            "weight": float(weight),
+            "evaluation_points": tuple(points)
+        })
+
+    if sum(c["weight"] for c in criteria.values()) <= 0:
+        raise ValueError("가중치 합계가 0입니다")
+
+    dimensions = tuple(criteria)
+    weights = tuple(criteria[d]["weight"] for d in dimensions)
+
+    return CompiledCriteria(
+        dimensions=dimensions,
+        index=MappingProxyType({d: i for i, d in enumerate(dimensions)}),
+        weights=weights,
+        weight_of=MappingProxyType(dict(zip(dimensions, weights))),
+        criteria=MappingProxyType(criteria),
+        evaluation_scale=MappingProxyType(dict(raw.get("evaluation_scale", {}))),
+        source=source,
+        mtime=mtime
+    )
+
+
+class CriteriaRegistry:
+    """
+    윤리 평가 기준 레지스트리
+
+    설정 파일을 한 번만 읽어 컴파일해 두고, 파일 수정 시각이 바뀌면 다시 로드한다.
+    파일이 없으면 settings.ETHICS_DIMENSIONS를 사용하고, 수정된 파일이 잘못된 경우
+    마지막으로 성공한 기준을 유지한다.
+    """
+
+    def __init__(self, path: str = ETHICS_CRITERIA_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._compiled: Optional[CompiledCriteria] = None
+
+    def get(self) -> CompiledCriteria:
+        """현재 평가 기준 반환 (파일 변경 시 재로드)"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            mtime = None
+
+        compiled = self._compiled
+        if compiled is not None and compiled.mtime == (mtime or 0.0):
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled
+            if compiled is not None and compiled.mtime == (mtime or 0.0):
+                return compiled
+
+            self._compiled = self._load(mtime, compiled)
+            return self._compiled
+
+    def _load(self, mtime: Optional[float], previous: Optional[CompiledCriteria]) -> CompiledCriteria:
+        if mtime is None:
+            if previous is None:
+                print(f"  ⚠️  평가 기준 파일 없음 ({self.path}). 기본 기준 사용")
+            return compile_criteria({"risk_dimensions": ETHICS_DIMENSIONS}, source="settings")
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                compiled = compile_criteria(json.load(f), source=self.path, mtime=mtime)
+        except (OSError, ValueError) as e:
+            if previous is None:
+                raise ValueError(f"평가 기준 로드 실패 ({self.path}): {e}") from e
+            print(f"  ⚠️  평가 기준 재로드 실패, 기존 기준 유지: {e}")
+            # 같은 mtime으로 다시 시도하지 않도록 기존 기준에 mtime만 갱신
+            return CompiledCriteria(**{**previous.__dict__, "mtime": mtime})
+
+        if previous is not None:
+            print(f"  🔄 평가 기준 재로드: {self.path}")
+        return compiled
+
+
+_default_registry: Optional[CriteriaRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_criteria_registry() -> CriteriaRegistry:
+    """프로세스 공용 평가 기준 레지스트리"""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = CriteriaRegistry()
+        return _default_registry
+
+
+def get_criteria() -> CompiledCriteria:
+    """프로세스 공용 레지스트리의 현재 평가 기준"""
+    return get_criteria_registry().get()
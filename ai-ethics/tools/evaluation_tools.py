@@ -1,45 +1,15 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Mapping, Optional
 import json
+from tools.criteria_registry import get_criteria
+from tools.keyword_matcher import KeywordAutomaton
 
 class EvaluationTools:
     """평가 관련 도구 모음"""
     
     @staticmethod
-    def load_ethics_criteria() -> Dict:
-        """윤리 평가 기준 로드"""
-        # 실제로는 config/ethics_criteria.json에서 로드
-        return {
-            "fairness": {
-                "name": "공정성 및 편향성",
-                "description": "AI 시스템이 다양한 사용자 그룹에 대해 공정하게 작동하는지 평가",
-                "weight": 1.0,
-                "evaluation_points": [
-                    "편향성 테스트 수행 및 결과 공개",
-                    "다양한 인구 집단에 대한 동등한 성능",
-                    "편향 완화 메커니즘 구현"
-                ]
-            },
-            "privacy": {
-                "name": "프라이버시 보호",
-                "description": "개인정보 보호 및 데이터 관리의 적절성 평가",
-                "weight": 1.0
-            },
-            "transparency": {
-                "name": "투명성 및 설명가능성",
-                "description": "AI 시스템의 작동 방식과 의사결정 과정의 투명성 평가",
-                "weight": 1.0
-            },
-            "accountability": {
-                "name": "책임성 및 거버넌스",
-                "description": "AI 시스템의 책임 소재와 관리 체계 평가",
-                "weight": 1.0
-            },
-            "safety": {
-                "name": "안전성 및 보안",
-                "description": "AI 시스템의 안전성과 보안 수준 평가",
-                "weight": 1.0
-            }
-        }
+    def load_ethics_criteria() -> Mapping[str, Mapping]:
+        """윤리 평가 기준 로드 (config/ethics_criteria.json, 읽기 전용)"""
+        return get_criteria().criteria
     
     @staticmethod
     def get_risk_level(score: float) -> str:
@@ -61,13 +31,13 @@ class EvaluationTools:
         if not dimension_scores:
             return 0.0
         
-        criteria = EvaluationTools.load_ethics_criteria()
+        weight_of = get_criteria().weight_of
         
         total_weight = 0
         weighted_sum = 0
         
         for dimension, score in dimension_scores.items():
-            weight = criteria.get(dimension, {}).get("weight", 1.0)
+            weight = weight_of.get(dimension, 1.0)
             weighted_sum += score * weight
             total_weight += weight
         
@@ -108,105 +78,63 @@ class EvaluationTools:
     
     @staticmethod
     def compare_services(assessments: Dict[str, Dict]) -> Dict:
-        """여러 서비스 비교"""
-        comparison = {
-            "service_rankings": [],
-            "dimension_comparison": {},
-            "statistics": {}
-        }
-        
-        criteria = EvaluationTools.load_ethics_criteria()
+        """여러 서비스 비교 (서비스 수 제한 없음, NumPy 행렬 연산)"""
+        from tools.comparison_engine import get_comparison_engine
         
-        # 전체 점수로 순위 매기기
-        rankings = []
-        for service_name, assessment in assessments.items():
-            overall = assessment.get("overall_score", 0)
-            rankings.append({
-                "service": service_name,
-                "overall_score": overall,
-                "risk_level": EvaluationTools.get_risk_level(overall)
-            })
-        
-        rankings.sort(key=lambda x: x["overall_score"], reverse=True)
-        comparison["service_rankings"] = rankings
-        
-        # 차원별 비교
-        for dimension in criteria.keys():
-            dim_scores = {}
-            for service_name, assessment in assessments.items():
-                if dimension in assessment:
-                    dim_scores[service_name] = assessment[dimension].get("score", 0)
-            
-            if dim_scores:
-                best_service = max(dim_scores, key=dim_scores.get)
-                worst_service = min(dim_scores, key=dim_scores.get)
-                avg_score = sum(dim_scores.values()) / len(dim_scores)
-                
-                comparison["dimension_comparison"][dimension] = {
-                    "scores": dim_scores,
-                    "best": {
-                        "service": best_service,
-                        "score": dim_scores[best_service]
-                    },
-                    "worst": {
-                        "service": worst_service,
-                        "score": dim_scores[worst_service]
-                    },
-                    "average": round(avg_score, 2)
-                }
-        
-        return comparison
+        return get_comparison_engine().compare(assessments, get_criteria().dimensions)
     
     @staticmethod
     def automated_checklist_evaluation(
         service_analysis: Dict, 
         dimension: str
     ) -> Dict:
-        """자동화된 체크리스트 평가"""
-        
-        # 서비스 분석 내용을 텍스트로 변환
-        service_text = json.dumps(service_analysis, ensure_ascii=False).lower()
+        """자동화된 체크리스트 평가 (단일 차원)"""
+        return EvaluationTools.evaluate_all_checklists(service_analysis).get(
+            dimension, EvaluationTools._checklist_result([], 0)
+        )
+    
+    @staticmethod
+    def evaluate_all_checklists(service_analysis: Dict) -> Dict[str, Dict]:
+        """모든 차원의 체크리스트를 한 번의 텍스트 스캔으로 평가"""
         
-        checklist = {
-            "privacy": [
-                ("개인정보처리방침", lambda x: "privacy policy" in x or "개인정보" in x or "프라이버시" in x),
-                ("GDPR/법규 준수", lambda x: "gdpr" in x or "개인정보보호법" in x or "규정" in x),
-                ("암호화", lambda x: "encrypt" in x or "암호화" in x),
-                ("데이터 삭제", lambda x: "삭제" in x or "delete" in x or "제거" in x),
-                ("동의 획득", lambda x: "동의" in x or "consent" in x),
-            ],
-            "transparency": [
-                ("AI 사용 명시", lambda x: "ai" in x or "인공지능" in x or "artificial intelligence" in x),
-                ("설명가능성", lambda x: "explain" in x or "설명" in x or "interpretable" in x),
-                ("알고리즘 공개", lambda x: "algorithm" in x or "알고리즘" in x or "model" in x),
-                ("데이터 출처", lambda x: "data source" in x or "데이터 출처" in x or "학습 데이터" in x),
-            ],
-            "fairness": [
-                ("편향성 테스트", lambda x: "bias" in x or "편향" in x or "fairness test" in x),
-                ("공정성 평가", lambda x: "fair" in x or "공정" in x or "평등" in x),
-                ("다양성 고려", lambda x: "diversity" in x or "다양성" in x or "inclusive" in x),
-            ],
-            "accountability": [
-                ("책임자 명시", lambda x: "책임" in x or "responsible" in x or "accountability" in x),
-                ("감사 체계", lambda x: "audit" in x or "감사" in x or "monitoring" in x),
-                ("거버넌스", lambda x: "governance" in x or "거버넌스" in x or "oversight" in x),
-            ],
-            "safety": [
-                ("보안 조치", lambda x: "security" in x or "보안" in x or "안전" in x),
-                ("리스크 평가", lambda x: "risk assessment" in x or "위험 평가" in x),
-                ("안전장치", lambda x: "safety" in x or "safeguard" in x or "보호장치" in x),
+        # 서비스 분석 내용을 텍스트로 변환 (1회)
+        service_text = json.dumps(service_analysis, ensure_ascii=False)
+        return EvaluationTools.scan_checklists([service_text])
+    
+    @staticmethod
+    def evaluate_search_results(search_results: List[Dict]) -> Dict[str, Dict]:
+        """웹 검색 결과 원문(title/content) 일괄 체크리스트 평가"""
+        texts = [
+            f"{result.get('title', '')} {result.get('content', '')}"
+            for result in search_results
+        ]
+        return EvaluationTools.scan_checklists(texts)
+    
+    @staticmethod
+    def scan_checklists(texts: Iterable[str]) -> Dict[str, Dict]:
+        """
+        텍스트 목록을 사전 컴파일된 키워드 오토마톤으로 스캔하여 차원별 체크리스트 결과 반환
+        (여러 텍스트 중 하나라도 키워드를 포함하면 해당 항목 통과)
+        """
+        automaton = _get_checklist_automaton()
+        
+        matched = set()
+        for text in texts:
+            matched |= automaton.find_all(text.lower())
+        
+        results = {}
+        for dimension, items in CHECKLIST_ITEMS.items():
+            passed_items = [
+                name for name, keywords in items
+                if any(keyword in matched for keyword in keywords)
             ]
-        }
+            results[dimension] = EvaluationTools._checklist_result(passed_items, len(items))
         
-        checks = checklist.get(dimension, [])
-        passed_checks = []
-        
-        for name, check_fn in checks:
-            if check_fn(service_text):
-                passed_checks.append(name)
-        
-        passed = len(passed_checks)
-        total = len(checks)
+        return results
+    
+    @staticmethod
+    def _checklist_result(passed_items: List[str], total: int) -> Dict:
+        passed = len(passed_items)
         
         # 체크리스트 점수 (참고용)
         checklist_score = (passed / total) * 5 if total > 0 else 0
@@ -215,5 +143,53 @@ class EvaluationTools:
             "checklist_score": round(checklist_score, 1),
             "passed_checks": passed,
             "total_checks": total,
-            "passed_items": passed_checks
+            "passed_items": passed_items
         }
+
+
+# 차원별 체크리스트: (항목명, 키워드 목록) - 키워드 중 하나라도 포함되면 통과
+CHECKLIST_ITEMS = {
+    "privacy": [
+        ("개인정보처리방침", ["privacy policy", "개인정보", "프라이버시"]),
+        ("GDPR/법규 준수", ["gdpr", "개인정보보호법", "규정"]),
+        ("암호화", ["encrypt", "암호화"]),
+        ("데이터 삭제", ["삭제", "delete", "제거"]),
+        ("동의 획득", ["동의", "consent"]),
+    ],
+    "transparency": [
+        ("AI 사용 명시", ["ai", "인공지능", "artificial intelligence"]),
+        ("설명가능성", ["explain", "설명", "interpretable"]),
+        ("알고리즘 공개", ["algorithm", "알고리즘", "model"]),
+        ("데이터 출처", ["data source", "데이터 출처", "학습 데이터"]),
+    ],
+    "fairness": [
+        ("편향성 테스트", ["bias", "편향", "fairness test"]),
+        ("공정성 평가", ["fair", "공정", "평등"]),
+        ("다양성 고려", ["diversity", "다양성", "inclusive"]),
+    ],
+    "accountability": [
+        ("책임자 명시", ["책임", "responsible", "accountability"]),
+        ("감사 체계", ["audit", "감사", "monitoring"]),
+        ("거버넌스", ["governance", "거버넌스", "oversight"]),
+    ],
+    "safety": [
+        ("보안 조치", ["security", "보안", "안전"]),
+        ("리스크 평가", ["risk assessment", "위험 평가"]),
+        ("안전장치", ["safety", "safeguard", "보호장치"]),
+    ]
+}
+
+_checklist_automaton: Optional[KeywordAutomaton] = None
+
+
+def _get_checklist_automaton() -> KeywordAutomaton:
+    """모든 차원의 체크리스트 키워드를 담은 오토마톤 (최초 1회 컴파일)"""
+    global _checklist_automaton
+    if _checklist_automaton is None:
+        _checklist_automaton = KeywordAutomaton(
+            keyword
+            for items in CHECKLIST_ITEMS.values()
+            for _, keywords in items
+            for keyword in keywords
+        )
+    return _checklist_automaton
@@ -0,0 +1,173 @@
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional
+
+from config.settings import BM25_B, BM25_K1
+
+INDEX_VERSION = 1
+
+_LATIN_RE = re.compile(r"[a-z0-9]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25용 토큰화
+
+    영문/숫자는 단어 단위, 한글은 음절 bigram 단위로 분리한다
+    (형태소 분석기 없이 조사가 붙은 어절도 부분 일치하도록).
+    """
+    text = text.lower()
+    tokens = _LATIN_RE.findall(text)
+    for word in _HANGUL_RE.findall(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+@dataclass
+class GuidelineChunk:
+    """검색 단위 문서 조각"""
+
+    chunk_id: str
+    dimension: str
+    guideline: str
+    content: str
+    source: str  # guidelines_db / ethics_criteria
+
+
+class GuidelineIndex:
+    """
+    가이드라인 BM25 역색인 (메모리 상주, JSON 파일로 저장/로드)
+
+    문서 길이 정규화 값과 IDF를 미리 계산해 두므로 검색은 질의 토큰의
+    posting list만 순회한다.
+    """
+
+    def __init__(self, chunks: List[GuidelineChunk], k1: float = BM25_K1, b: float = BM25_B):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self.fingerprint = self.compute_fingerprint(chunks, k1, b)
+
+        self._postings: Dict[str, List[List[int]]] = {}
+        doc_lengths = []
+        for doc_id, chunk in enumerate(chunks):
+            counts = Counter(tokenize(chunk.content))
+            doc_lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self._postings.setdefault(term, []).append([doc_id, tf])
+
+        self._prepare(doc_lengths)
+
+    def _prepare(self, doc_lengths: List[int]):
+        """IDF와 문서별 길이 정규화 값 계산"""
+        n = len(doc_lengths)
+        avgdl = (sum(doc_lengths) / n) if n else 1.0
+        self._doc_lengths = doc_lengths
+        self._norm = [
+            self.k1 * (1 - self.b + self.b * length / avgdl) for length in doc_lengths
+        ]
+        self._idf = {
+            term: math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+
+    @staticmethod
+    def compute_fingerprint(chunks: Iterable[GuidelineChunk], k1: float, b: float) -> str:
+        payload = json.dumps(
+            [INDEX_VERSION, k1, b, [asdict(c) for c in chunks]],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 3,
+        dimension: Optional[str] = None
+    ) -> List[Dict]:
+        """BM25 점수 상위 top_k개 조각 반환"""
+        scores: Dict[int, float] = {}
+        k1 = self.k1
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for doc_id, tf in postings:
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + self._norm[doc_id])
+
+        if dimension:
+            scores = {d: s for d, s in scores.items() if self.chunks[d].dimension == dimension}
+
+        top = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [
+            {**asdict(self.chunks[doc_id]), "score": round(score, 4)}
+            for doc_id, score in top
+        ]
+
+    def save(self, path: str):
+        """인덱스를 JSON 파일로 저장 (임시 파일 작성 후 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        payload = {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "k1": self.k1,
+            "b": self.b,
+            "chunks": [asdict(c) for c in self.chunks],
+            "doc_lengths": self._doc_lengths,
+            "postings": self._postings
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, fingerprint: str) -> Optional["GuidelineIndex"]:
+        """저장된 인덱스 로드 (원본 문서나 설정이 바뀌어 fingerprint가 다르면 None)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if payload.get("version") != INDEX_VERSION or payload.get("fingerprint") != fingerprint:
+            return None
+
+        index = cls.__new__(cls)
+        index.chunks = [GuidelineChunk(**c) for c in payload["chunks"]]
+        index.k1 = payload["k1"]
+        index.b = payload["b"]
+        index.fingerprint = payload["fingerprint"]
+        index._postings = payload["postings"]
+        index._prepare(payload["doc_lengths"])
+        return index
+
+    @classmethod
+    def load_or_build(cls, path: str, chunks: List[GuidelineChunk]) -> "GuidelineIndex":
+        """저장된 인덱스가 유효하면 로드, 아니면 새로 만들어 저장"""
+        index = cls.load(path, cls.compute_fingerprint(chunks, BM25_K1, BM25_B))
+        if index is not None:
+            return index
+
+        index = cls(chunks)
+        try:
+            index.save(path)
+        except OSError as e:
+            print(f"  ⚠️  가이드라인 인덱스 저장 실패: {e}")
+        return index
@@ -0,0 +1,66 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick 다중 키워드 매처
+
+    모든 키워드를 하나의 오토마톤으로 미리 컴파일해 두고, 텍스트를 한 번만 훑어서
+    포함된 키워드 전체를 찾는다 (부분 문자열 일치, `keyword in text`와 동일한 의미).
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[int]] = [set()]
+
+        for index, keyword in enumerate(self.keywords):
+            self._insert(index, keyword)
+        self._build_failure_links()
+
+    def _insert(self, index: int, keyword: str):
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            state = next_state
+        self._out[state].add(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] |= self._out[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """텍스트에 포함된 키워드 집합 반환 (단일 패스)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        state = 0
+
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+                if len(found) == len(self.keywords):
+                    break
+
+        return {self.keywords[i] for i in found}
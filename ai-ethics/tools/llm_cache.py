@@ -0,0 +1,437 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+
+from config.settings import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_DIR,
+    LLM_CACHE_MEMORY_ENTRIES,
+    LLM_CACHE_DISK_MAX_ENTRIES,
+    LLM_CACHE_TTL
+)
+
+# 응답에 영향을 주는 모델 설정 (캐시 키에 포함)
+CACHE_KEY_PARAMS = (
+    "max_tokens", "top_p", "frequency_penalty", "presence_penalty",
+    "stop", "n", "seed", "model_kwargs"
+)
+
+
+def strip_code_fence(content: str) -> str:
+    """```json ... ``` 코드 블록 표시 제거"""
+    content = content.strip()
+    if content.startswith("```json"):
+        content = content[7:]
+    if content.startswith("```"):
+        content = content[3:]
+    if content.endswith("```"):
+        content = content[:-3]
+    return content.strip()
+
+
+def is_json_reply(content: str) -> bool:
+    """JSON 응답 검증 (캐시 저장 여부 판단용 validate 콜백)"""
+    try:
+        json.loads(strip_code_fence(content))
+        return True
+    except ValueError:
+        return False
+
+
+class MemoryLRUBackend:
+    """인메모리 LRU 캐시 백엔드"""
+
+    def __init__(self, max_entries: int = LLM_CACHE_MEMORY_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class DiskBackend:
+    """
+    디스크 캐시 백엔드 (키 앞 2자리로 샤딩된 JSON 파일, TTL + LRU 제거)
+
+    파일 mtime을 마지막 사용 시각으로 쓰며, 조회 시 갱신한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = LLM_CACHE_DIR,
+        max_entries: int = LLM_CACHE_DISK_MAX_ENTRIES,
+        ttl: float = LLM_CACHE_TTL
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._count: Optional[int] = None  # 첫 저장 시 디렉토리를 스캔해 초기화
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                self._remove(path)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                content = json.load(f)["content"]
+            os.utime(path)
+            return content
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, value: str):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new = not os.path.exists(path)
+
+        # 임시 파일에 쓴 뒤 교체하여 동시 쓰기 시에도 파일이 깨지지 않도록 함
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"content": value}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._entries())
+            elif is_new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _entries(self) -> List[tuple]:
+        """(mtime, 경로) 목록"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        return entries
+
+    def _evict(self):
+        """만료 항목 및 LRU 초과분 제거 (lock 보유 상태에서 호출)"""
+        now = time.time()
+        entries = sorted(self._entries())
+        live = []
+        for mtime, path in entries:
+            if now - mtime > self.ttl:
+                self._remove(path)
+            else:
+                live.append(path)
+
+        overflow = len(live) - self.max_entries
+        for path in live[:max(overflow, 0)]:
+            self._remove(path)
+        self._count = len(live) - max(overflow, 0)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            for _, path in self._entries():
+                self._remove(path)
+            self._count = 0
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시
+
+    모델명, temperature, max_tokens 등 응답에 영향을 주는 설정과 메시지 해시를 키로 사용한다.
+    백엔드는 앞에서부터 조회하며, 뒤쪽 백엔드에서 찾은 값은 앞쪽 백엔드로 승격된다.
+    """
+
+    def __init__(self, backends: List):
+        self.backends = backends
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        messages: List[BaseMessage],
+        params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "params": {k: v for k, v in (params or {}).items() if v is not None},
+                "messages": [[m.type, m.content] for m in messages]
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        for i, backend in enumerate(self.backends):
+            value = backend.get(key)
+            if value is not None:
+                for upper in self.backends[:i]:
+                    upper.set(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: str):
+        for backend in self.backends:
+            backend.set(key, value)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+
+def extract_token_usage(message) -> Dict[str, int]:
+    """
+    응답 메시지에서 토큰 사용량 추출
+
+    usage_metadata(langchain-core 0.2+)를 우선 사용하고, 없으면 OpenAI
+    response_metadata의 token_usage를 사용한다. cached 값은 제공자 프롬프트 캐시에서
+    처리된 입력 토큰 수다.
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    if usage:
+        details = usage.get("input_token_details") or {}
+        return {
+            "prompt_tokens": usage.get("input_tokens", 0) or 0,
+            "completion_tokens": usage.get("output_tokens", 0) or 0,
+            "cached_tokens": details.get("cache_read", 0) or 0
+        }
+
+    token_usage = (getattr(message, "response_metadata", None) or {}).get("token_usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return {
+        "prompt_tokens": token_usage.get("prompt_tokens", 0) or 0,
+        "completion_tokens": token_usage.get("completion_tokens", 0) or 0,
+        "cached_tokens": details.get("cached_tokens", 0) or 0
+    }
+
+
+class LLMUsageTracker:
+    """실제 LLM 호출(응답 캐시 미적중)의 토큰 사용량 및 지연 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.completion_tokens = 0
+            self.latency = 0.0
+
+    def record(self, usage: Dict[str, int], latency: float):
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += usage.get("prompt_tokens", 0)
+            self.cached_tokens += usage.get("cached_tokens", 0)
+            self.completion_tokens += usage.get("completion_tokens", 0)
+            self.latency += latency
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_tokens,
+                "cached_ratio": round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0,
+                "completion_tokens": self.completion_tokens,
+                "total_latency_sec": round(self.latency, 3),
+                "avg_latency_sec": round(self.latency / self.calls, 2) if self.calls else 0.0
+            }
+
+    @staticmethod
+    def diff(before: Dict, after: Dict) -> Dict:
+        """두 stats() 스냅샷 사이의 사용량 (실행 단위 집계용)"""
+        calls = after["calls"] - before["calls"]
+        prompt = after["prompt_tokens"] - before["prompt_tokens"]
+        cached = after["cached_prompt_tokens"] - before["cached_prompt_tokens"]
+        total_latency = after["total_latency_sec"] - before["total_latency_sec"]
+        return {
+            "calls": calls,
+            "prompt_tokens": prompt,
+            "cached_prompt_tokens": cached,
+            "cached_ratio": round(cached / prompt, 3) if prompt else 0.0,
+            "completion_tokens": after["completion_tokens"] - before["completion_tokens"],
+            "total_latency_sec": round(total_latency, 3),
+            "avg_latency_sec": round(total_latency / calls, 2) if calls else 0.0
+        }
+
+
+class CachedChatModel:
+    """
+    ChatModel 래퍼 - invoke/stream 결과를 LLMResponseCache에 저장/재생
+
+    호출부에서 use_cache=False로 캐시를 건너뛸 수 있다. validate 콜백을 넘기면 이를 통과한
+    응답만 저장하고, 캐시에 남아 있던 응답도 통과하지 못하면 다시 요청한다.
+    그 외 속성/메서드는 원본 모델로 위임된다. 실제 호출의 토큰 사용량은 usage_tracker에 기록된다.
+    """
+
+    def __init__(
+        self,
+        llm,
+        cache: Optional[LLMResponseCache] = None,
+        usage_tracker: Optional[LLMUsageTracker] = None
+    ):
+        self.llm = llm
+        self.cache = cache
+        self.usage_tracker = usage_tracker or get_usage_tracker()
+
+    def __getattr__(self, name):
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _cache_key(self, messages: List[BaseMessage], call_kwargs: Dict) -> str:
+        model = getattr(self.llm, "model_name", None) or getattr(self.llm, "model", "")
+        temperature = getattr(self.llm, "temperature", None)
+        params = {name: getattr(self.llm, name, None) for name in CACHE_KEY_PARAMS}
+        params["bound"] = getattr(self.llm, "kwargs", None)  # llm.bind(...)로 고정된 인자
+        params["call"] = call_kwargs or None
+        return LLMResponseCache.make_key(model, temperature, messages, params)
+
+    @staticmethod
+    def _cacheable(content: str, validate: Optional[Callable[[str], bool]]) -> bool:
+        return bool(content) and (validate is None or validate(content))
+
+    def _invoke_llm(self, messages: List[BaseMessage], **kwargs):
+        started = time.perf_counter()
+        response = self.llm.invoke(messages, **kwargs)
+        self.usage_tracker.record(extract_token_usage(response), time.perf_counter() - started)
+        return response
+
+    def _stream_llm(self, messages: List[BaseMessage], **kwargs):
+        """스트리밍 호출 (사용량은 usage_metadata를 포함한 청크가 있을 때만 집계됨)"""
+        started = time.perf_counter()
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
+        for chunk in self.llm.stream(messages, **kwargs):
+            for name, value in extract_token_usage(chunk).items():
+                usage[name] += value
+            yield chunk
+        self.usage_tracker.record(usage, time.perf_counter() - started)
+
+    def invoke(
+        self,
+        messages: List[BaseMessage],
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], bool]] = None,
+        **kwargs
+    ):
+        if not use_cache or self.cache is None:
+            return self._invoke_llm(messages, **kwargs)
+
+        key = self._cache_key(messages, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None and self._cacheable(cached, validate):
+            return AIMessage(content=cached, response_metadata={"cache_hit": True})
+
+        response = self._invoke_llm(messages, **kwargs)
+        if self._cacheable(response.content, validate):
+            self.cache.set(key, response.content)
+        return response
+
+    def stream(
+        self,
+        messages: List[BaseMessage],
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], bool]] = None,
+        **kwargs
+    ):
+        """토큰 스트리밍 (캐시 적중 시 전체 응답을 단일 청크로 반환)"""
+        if not use_cache or self.cache is None:
+            yield from self._stream_llm(messages, **kwargs)
+            return
+
+        key = self._cache_key(messages, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None and self._cacheable(cached, validate):
+            yield AIMessageChunk(content=cached, response_metadata={"cache_hit": True})
+            return
+
+        parts = []
+        for chunk in self._stream_llm(messages, **kwargs):
+            parts.append(chunk.content)
+            yield chunk
+
+        content = "".join(parts)
+        if self._cacheable(content, validate):
+            self.cache.set(key, content)
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+_usage_tracker = LLMUsageTracker()
+
+
+def get_usage_tracker() -> LLMUsageTracker:
+    """프로세스 전역 LLM 사용량 집계기"""
+    return _usage_tracker
+
+
+def get_default_llm_cache() -> Optional[LLMResponseCache]:
+    """프로세스 전역 기본 캐시 (메모리 LRU → 디스크), 비활성화 시 None"""
+    global _default_cache
+
+    if not LLM_CACHE_ENABLED:
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = LLMResponseCache([MemoryLRUBackend(), DiskBackend()])
+        return _default_cache
+
+
+def create_cached_llm(llm, cache: Optional[LLMResponseCache] = None) -> CachedChatModel:
+    """에이전트용 캐시 적용 LLM 생성 (cache 미지정 시 기본 캐시 사용)"""
+    return CachedChatModel(llm, cache or get_default_llm_cache())
@@ -0,0 +1,88 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, List
+
+from config.settings import PDF_CACHE_DIR, PDF_CACHE_MAX_ENTRIES
+
+
+class PDFArtifactCache:
+    """
+    PDF 산출물 캐시
+
+    services, detailed_data, report 내용의 해시를 키로 디스크에 PDF를 보관하고,
+    최근 사용 시각(mtime) 기준 LRU로 개수를 제한한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = PDF_CACHE_DIR,
+        max_entries: int = PDF_CACHE_MAX_ENTRIES
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(services: List[str], detailed_data: Dict, report_text: str) -> str:
+        payload = json.dumps(
+            {"services": services, "detailed_data": detailed_data, "report": report_text},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_or_render(
+        self,
+        services: List[str],
+        detailed_data: Dict,
+        report_text: str,
+        render: Callable[[str], None]
+    ) -> str:
+        """
+        캐시된 PDF 경로 반환 (없으면 render(output_path)로 생성)
+
+        같은 키에 대한 동시 요청은 한 번만 렌더링한다.
+        """
+        key = self.make_key(services, detailed_data, report_text)
+        path = os.path.join(self.cache_dir, f"{key}.pdf")
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if os.path.exists(path):
+                os.utime(path)  # LRU 갱신
+                return path
+
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                render(tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+            self._evict()
+
+        return path
+
+    def _evict(self):
+        """최근 사용 순으로 max_entries개만 유지 (lock 보유 상태에서 호출)"""
+        files = glob.glob(os.path.join(self.cache_dir, "*.pdf"))
+        if len(files) <= self.max_entries:
+            return
+
+        files.sort(key=os.path.getmtime)
+        for old in files[:len(files) - self.max_entries]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
@@ -0,0 +1,60 @@
+import copy
+import os
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Sequence, Tuple
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+# PDF 생성기 간에 공유되는 폰트/스타일 레지스트리.
+# TTF 파싱과 스타일 생성은 프로세스당 한 번만 수행하고, 스타일은 인스턴스마다 복사본을 준다.
+DEFAULT_FONT = 'Helvetica'
+
+_lock = threading.Lock()
+_fonts: Dict[str, str] = {}
+_style_sheets: Dict[Tuple[str, str], Mapping] = {}
+
+
+def register_font(alias: str, candidate_paths: Sequence[str]) -> str:
+    """
+    후보 경로 중 처음 발견된 TTF를 alias로 등록하고 사용할 폰트명 반환
+
+    이미 등록된 alias는 다시 파싱하지 않으며, 사용 가능한 폰트가 없으면 기본 폰트를 사용한다.
+    """
+    with _lock:
+        if alias in _fonts:
+            return _fonts[alias]
+
+        font_name = DEFAULT_FONT
+        for path in candidate_paths:
+            if not os.path.exists(path):
+                continue
+            try:
+                pdfmetrics.registerFont(TTFont(alias, path))
+                font_name = alias
+                print(f"  ✅ 한국어 폰트 로드 성공: {path}")
+                break
+            except Exception as e:
+                print(f"  ⚠️  폰트 로드 실패 ({path}): {e}")
+
+        if font_name == DEFAULT_FONT:
+            print("  ⚠️  한국어 폰트를 찾을 수 없습니다. 기본 폰트 사용")
+
+        _fonts[alias] = font_name
+        return font_name
+
+
+def get_style_sheet(name: str, font_name: str, factory: Callable[[], Dict]) -> Mapping:
+    """
+    (이름, 폰트)별로 한 번만 생성한 스타일 시트의 복사본 반환
+
+    매핑은 읽기 전용이고 ParagraphStyle은 호출마다 얕은 복사본이므로,
+    한 생성기가 styles['x'].fontSize 등을 바꿔도 다른 생성기에는 영향이 없다.
+    """
+    key = (name, font_name)
+    with _lock:
+        if key not in _style_sheets:
+            _style_sheets[key] = MappingProxyType(factory())
+        shared = _style_sheets[key]
+    return MappingProxyType({style_name: copy.copy(style) for style_name, style in shared.items()})
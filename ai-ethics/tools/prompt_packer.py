@@ -0,0 +1,152 @@
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from config.settings import PROMPT_DROP_FIELDS, PROMPT_PREFIX_CACHING
+from utils.tokens import count_tokens, truncate_to_tokens
+
+TRUNCATION_MARKER = "\n...(토큰 예산 초과로 이하 생략)"
+
+
+def strip_fields(data: Any, drop: Iterable[str] = PROMPT_DROP_FIELDS) -> Any:
+    """프롬프트에 불필요한 대용량 필드(검색 원문 references 등)를 재귀적으로 제거"""
+    drop = set(drop)
+
+    def strip(value):
+        if isinstance(value, dict):
+            return {k: strip(v) for k, v in value.items() if k not in drop}
+        if isinstance(value, list):
+            return [strip(v) for v in value]
+        return value
+
+    return strip(data)
+
+
+def compact_json(data: Any) -> str:
+    """공백 없는 JSON 직렬화 (indent=2 대비 토큰 수 절감)"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+@dataclass
+class PromptSection:
+    """
+    프롬프트 구성 요소
+
+    priority가 작을수록 중요하며, 예산을 초과하면 priority가 큰 섹션부터
+    min_tokens까지 잘라낸다. content가 dict/list이면 불필요 필드 제거 후 compact JSON으로 직렬화한다.
+    """
+
+    name: str
+    content: Any
+    priority: int = 0
+    min_tokens: int = 0
+    text: str = field(init=False)
+    tokens: int = field(init=False)
+
+    def __post_init__(self):
+        if isinstance(self.content, str):
+            self.text = self.content
+        else:
+            self.text = compact_json(strip_fields(self.content))
+        self.tokens = count_tokens(self.text)
+
+    @classmethod
+    def precounted(cls, name: str, text: str, tokens: int, priority: int = 0, min_tokens: int = 0):
+        """토큰 수를 이미 알고 있는 텍스트 섹션 (가이드라인 컨텍스트 테이블 등)"""
+        section = cls.__new__(cls)
+        section.name = name
+        section.content = text
+        section.priority = priority
+        section.min_tokens = min_tokens
+        section.text = text
+        section.tokens = tokens
+        return section
+
+
+@dataclass
+class PackedPrompt:
+    """예산에 맞춰 패킹된 섹션 텍스트"""
+
+    sections: Dict[str, str]
+    total_tokens: int
+    original_tokens: int
+    truncated: List[str]
+
+    def __getitem__(self, name: str) -> str:
+        return self.sections[name]
+
+
+def pack_sections(sections: List[PromptSection], budget: Optional[int]) -> PackedPrompt:
+    """
+    섹션들의 총 토큰 수가 budget 이하가 되도록 우선순위 기반으로 잘라냄
+
+    budget이 None이면 자르지 않는다. 가장 덜 중요한 섹션부터 min_tokens까지 줄이며,
+    줄인 섹션 끝에는 생략 표시를 붙인다.
+    """
+    allowance = {s.name: s.tokens for s in sections}
+    original = sum(allowance.values())
+    overflow = original - budget if budget is not None else 0
+
+    truncated = []
+    for section in sorted(sections, key=lambda s: s.priority, reverse=True):
+        if overflow <= 0:
+            break
+        reducible = max(0, section.tokens - section.min_tokens)
+        cut = min(reducible, overflow)
+        if cut > 0:
+            allowance[section.name] = section.tokens - cut
+            overflow -= cut
+            truncated.append(section.name)
+
+    marker_tokens = count_tokens(TRUNCATION_MARKER) if truncated else 0
+    packed = {}
+    for section in sections:
+        if section.name in truncated:
+            keep = max(0, allowance[section.name] - marker_tokens)
+            packed[section.name] = truncate_to_tokens(section.text, keep) + TRUNCATION_MARKER
+        else:
+            packed[section.name] = section.text
+
+    return PackedPrompt(
+        sections=packed,
+        total_tokens=sum(allowance.values()),
+        original_tokens=original,
+        truncated=truncated
+    )
+
+
+# ============================================
+# 프롬프트 조립 (프롬프트 캐싱을 위한 정적/동적 섹션 순서 조정)
+# ============================================
+
+_SECTION_RE = re.compile(r"(?m)^(?=## )")
+
+
+@lru_cache(maxsize=64)
+def _reorder_template(template: str, dynamic_fields: Tuple[str, ...]) -> str:
+    """'## ' 섹션 중 동적 필드를 포함한 섹션을 템플릿 끝으로 이동 (섹션 간 상대 순서는 유지)"""
+    static, dynamic = [], []
+    for section in _SECTION_RE.split(template):
+        section = section.strip()
+        if not section:
+            continue
+        if any("{" + name + "}" in section for name in dynamic_fields):
+            dynamic.append(section)
+        else:
+            static.append(section)
+    return "\n\n".join(static + dynamic) + "\n"
+
+
+def render_prompt(template: str, dynamic_fields: Iterable[str], **values) -> str:
+    """
+    프롬프트 템플릿 렌더링
+
+    PROMPT_PREFIX_CACHING이 켜져 있으면 서비스별로 달라지는 필드(dynamic_fields)가 들어간
+    섹션을 뒤로 보내, 지시문/평가 기준/가이드라인/응답 형식 같은 정적 내용이 호출 간
+    동일한 접두부가 되도록 한다 (제공자 측 프롬프트 캐시 적중).
+    """
+    if PROMPT_PREFIX_CACHING:
+        template = _reorder_template(template, tuple(sorted(dynamic_fields)))
+    return template.format(**values)
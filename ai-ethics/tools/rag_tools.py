@@ -1,12 +1,43 @@
-from typing import List, Dict
+import textwrap
+import threading
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Sequence, Tuple
+
+from config.settings import GUIDELINE_INDEX_PATH
+from tools.criteria_registry import get_criteria
+from tools.guideline_index import GuidelineChunk, GuidelineIndex
+from utils.tokens import count_tokens
+
+# 설정에서 사용하는 가이드라인 이름 → guidelines_db 키
+GUIDELINE_ALIASES = {
+    "EU AI Act": "EU AI Act",
+    "UNESCO AI Ethics": "UNESCO",
+    "UNESCO Recommendation on the Ethics of AI": "UNESCO",
+    "OECD AI Principles": "OECD"
+}
+
+NO_CONTEXT = "관련 가이드라인 컨텍스트 없음"
+
+
+@dataclass(frozen=True)
+class GuidelineContext:
+    """차원별 가이드라인 컨텍스트 (프롬프트 조립용으로 미리 만들어 둔 텍스트)"""
+    
+    dimension: str
+    text: str
+    token_count: int
+    guidelines: Tuple[str, ...]  # 실제로 포함된 가이드라인 (guidelines_db 키)
 
 class RAGTools:
-    """RAG 기반 가이드라인 검색 도구"""
+    """RAG 기반 가이드라인 검색 도구 (가이드라인 + 평가 기준 BM25 검색)"""
     
-    def __init__(self):
-        # 실제 구현에서는 벡터 DB (Chroma, FAISS 등) 연결
-        # 여기서는 간단한 더미 구현
+    def __init__(self, index_path: str = GUIDELINE_INDEX_PATH):
         self.guidelines_db = self._init_guidelines()
+        self.index_path = index_path
+        self.index: Optional[GuidelineIndex] = None
+        self._index_lock = threading.Lock()
+        self._context_tables: Dict[Tuple[str, ...], Dict[str, GuidelineContext]] = {}
+        self._context_lock = threading.Lock()
     
     def _init_guidelines(self) -> Dict:
         """가이드라인 데이터베이스 초기화"""
@@ -119,30 +150,142 @@ class RAGTools:
             }
         }
     
+    def normalize_guideline_name(self, name: str) -> Optional[str]:
+        """가이드라인 이름을 guidelines_db 키로 변환 (예: "UNESCO AI Ethics" → "UNESCO")"""
+        if name in GUIDELINE_ALIASES:
+            return GUIDELINE_ALIASES[name]
+        
+        known = {key for guidelines in self.guidelines_db.values() for key in guidelines}
+        if name in known:
+            return name
+        
+        # 별칭에 없는 이름은 DB 키로 시작하는지 확인 ("OECD ..." → "OECD")
+        for key in sorted(known, key=len, reverse=True):
+            if name.lower().startswith(key.lower()):
+                return key
+        
+        return None
+    
+    def build_context_table(self, guidelines: Sequence[str]) -> Dict[str, GuidelineContext]:
+        """
+        가이드라인 목록에 대한 차원별 컨텍스트 테이블 (목록별로 한 번만 생성 후 공유)
+        
+        컨텍스트는 서비스와 무관하므로 모든 서비스/평가가 같은 테이블을 사용한다.
+        """
+        key = tuple(guidelines)
+        table = self._context_tables.get(key)
+        if table is not None:
+            return table
+        
+        with self._context_lock:
+            table = self._context_tables.get(key)
+            if table is not None:
+                return table
+            
+            names = []
+            for guideline in guidelines:
+                normalized = self.normalize_guideline_name(guideline)
+                if normalized is None:
+                    print(f"  ⚠️  알 수 없는 가이드라인: {guideline}")
+                elif normalized not in names:
+                    names.append(normalized)
+            
+            table = {}
+            for dimension, dimension_guidelines in self.guidelines_db.items():
+                included = [name for name in names if name in dimension_guidelines]
+                text = "\n\n".join(
+                    f"### {name}\n{textwrap.dedent(dimension_guidelines[name]).strip()}"
+                    for name in included
+                ) or NO_CONTEXT
+                table[dimension] = GuidelineContext(
+                    dimension=dimension,
+                    text=text,
+                    token_count=count_tokens(text),
+                    guidelines=tuple(included)
+                )
+            
+            self._context_tables[key] = table
+            return table
+    
+    def get_context_entry(self, dimension: str, guidelines: Sequence[str]) -> GuidelineContext:
+        """특정 차원의 컨텍스트 (토큰 수 포함)"""
+        entry = self.build_context_table(guidelines).get(dimension)
+        if entry is None:
+            return GuidelineContext(dimension, NO_CONTEXT, count_tokens(NO_CONTEXT), ())
+        return entry
+    
     def get_guideline_context(
         self, 
         dimension: str, 
         guidelines: List[str]
     ) -> str:
-        """특정 차원에 대한 가이드라인 컨텍스트 반환"""
+        """특정 차원에 대한 가이드라인 컨텍스트 반환 (사전 생성된 테이블 조회)"""
+        return self.get_context_entry(dimension, guidelines).text
+    
+    def load_guidelines(self, force_rebuild: bool = False) -> bool:
+        """
+        가이드라인 검색 인덱스 준비 (저장된 인덱스가 최신이면 로드, 아니면 생성 후 저장)
         
-        dimension_guidelines = self.guidelines_db.get(dimension, {})
+        Returns:
+            인덱스 준비 성공 여부
+        """
+        with self._index_lock:
+            if self.index is not None and not force_rebuild:
+                return True
+            
+            try:
+                chunks = self._collect_chunks()
+                if force_rebuild:
+                    self.index = GuidelineIndex(chunks)
+                    self.index.save(self.index_path)
+                else:
+                    self.index = GuidelineIndex.load_or_build(self.index_path, chunks)
+            except Exception as e:
+                print(f"  ⚠️  가이드라인 인덱스 준비 실패: {e}")
+                return False
         
-        context_parts = []
-        for guideline in guidelines:
-            if guideline in dimension_guidelines:
-                context_parts.append(
-                    f"### {guideline}\n{dimension_guidelines[guideline]}"
-                )
+        print(f"  📚 가이드라인 인덱스 준비 완료 ({len(self.index.chunks)}개 문서)")
+        return True
+    
+    def _collect_chunks(self) -> List[GuidelineChunk]:
+        """인덱싱 대상 문서: 차원별 가이드라인 텍스트 + 평가 기준(ethics_criteria.json)"""
+        chunks = []
+        
+        for dimension, guidelines in self.guidelines_db.items():
+            for guideline, text in guidelines.items():
+                chunks.append(GuidelineChunk(
+                    chunk_id=f"{dimension}:{guideline}",
+                    dimension=dimension,
+                    guideline=guideline,
+                    content=textwrap.dedent(text).strip(),
+                    source="guidelines_db"
+                ))
+        
+        for dimension, config in get_criteria().criteria.items():
+            lines = [config["name"], config["description"], *config["evaluation_points"]]
+            chunks.append(GuidelineChunk(
+                chunk_id=f"{dimension}:criteria",
+                dimension=dimension,
+                guideline="평가 기준",
+                content="\n".join(lines),
+                source="ethics_criteria"
+            ))
         
-        return "\n\n".join(context_parts) if context_parts else "관련 가이드라인 컨텍스트 없음"
+        return chunks
     
     def search_similar_documents(
         self,
         query: str,
-        top_k: int = 3
+        top_k: int = 3,
+        dimension: Optional[str] = None
     ) -> List[Dict]:
-        """유사 문서 검색 (실제 구현에서는 벡터 검색)"""
-        # 실제로는 벡터 DB에서 유사도 검색
-        # 여기서는 더미 구현
-        return []
\ No newline at end of file
+        """
+        유사 문서 검색 (BM25, 네트워크 호출 없음)
+        
+        Returns:
+            점수 순 문서 조각 목록 [{chunk_id, dimension, guideline, content, source, score}]
+        """
+        if self.index is None and not self.load_guidelines():
+            return []
+        
+        return self.index.search(query, top_k=top_k, dimension=dimension)
\ No newline at end of file
@@ -6,55 +6,33 @@ from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
     PageBreak, KeepTogether
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
 from typing import Dict, List
-import os
+from tools.pdf_styles import register_font, get_style_sheet
 
 
 class PDFReportGenerator:
     """한국어 PDF 리포트 생성기"""
     
-    def __init__(self):
-        # 한국어 폰트 등록
-        font_path = self._get_korean_font()
-        if font_path:
-            try:
-                pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-                self.korean_font = 'NanumGothic'
-                print(f"  ✅ 한국어 폰트 로드 성공: {font_path}")
-            except Exception as e:
-                print(f"  ⚠️  폰트 로드 실패, 기본 폰트 사용: {e}")
-                self.korean_font = 'Helvetica'
-        else:
-            print("  ⚠️  한국어 폰트를 찾을 수 없습니다. 기본 폰트 사용")
-            self.korean_font = 'Helvetica'
-        
-        self.styles = self._create_styles()
+    FONT_PATHS = [
+        # Linux
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+        '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+        # Windows
+        'C:\\Windows\\Fonts\\malgun.ttf',
+        'C:\\Windows\\Fonts\\gulim.ttc',
+        # macOS
+        '/System/Library/Fonts/AppleGothic.ttf',
+        '/Library/Fonts/NanumGothic.ttf',
+        # 프로젝트 내
+        'fonts/NanumGothic.ttf',
+        '../fonts/NanumGothic.ttf',
+    ]
     
-    def _get_korean_font(self) -> str:
-        """한국어 폰트 경로 찾기"""
-        possible_paths = [
-            # Linux
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-            '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
-            # Windows
-            'C:\\Windows\\Fonts\\malgun.ttf',
-            'C:\\Windows\\Fonts\\gulim.ttc',
-            # macOS
-            '/System/Library/Fonts/AppleGothic.ttf',
-            '/Library/Fonts/NanumGothic.ttf',
-            # 프로젝트 내
-            'fonts/NanumGothic.ttf',
-            '../fonts/NanumGothic.ttf',
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
-        
-        return None
+    def __init__(self):
+        # 한국어 폰트 등록 및 스타일 생성 (프로세스당 1회, 인스턴스 간 공유)
+        self.korean_font = register_font('NanumGothic', self.FONT_PATHS)
+        self.styles = get_style_sheet('basic', self.korean_font, self._create_styles)
     
     def _create_styles(self) -> Dict:
         """PDF 스타일 정의"""
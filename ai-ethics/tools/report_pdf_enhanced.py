@@ -8,39 +8,36 @@ from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
     PageBreak, KeepTogether, Image
 )
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import os
+import tempfile
+from config.settings import PDF_SECTION_WORKERS
+from tools.pdf_styles import register_font, get_style_sheet
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
 
 
 class EnhancedPDFReportGenerator:
     """상세한 한국어 PDF 리포트 생성기"""
     
+    FONT_PATHS = [
+        '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+        'C:\\Windows\\Fonts\\malgun.ttf',
+        '/System/Library/Fonts/AppleGothic.ttf',
+    ]
+    
     def __init__(self):
-        self.korean_font = self._setup_korean_font()
-        self.styles = self._create_styles()
+        # 폰트 등록과 스타일 생성은 프로세스당 1회만 수행하고 인스턴스 간 공유
+        self.korean_font = register_font('MainFont', self.FONT_PATHS)
+        self.styles = get_style_sheet('enhanced', self.korean_font, self._create_styles)
         self.page_width, self.page_height = A4
     
-    def _setup_korean_font(self) -> str:
-        """한국어 폰트 설정"""
-        font_paths = [
-            '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
-            'C:\\Windows\\Fonts\\malgun.ttf',
-            '/System/Library/Fonts/AppleGothic.ttf',
-        ]
-        
-        for path in font_paths:
-            if os.path.exists(path):
-                try:
-                    pdfmetrics.registerFont(TTFont('MainFont', path))
-                    return 'MainFont'
-                except:
-                    pass
-        return 'Helvetica'
-    
     def _create_styles(self) -> Dict:
         """PDF 스타일 정의"""
         return {
@@ -137,61 +134,109 @@ class EnhancedPDFReportGenerator:
         output_path: str,
         services: List[str],
         detailed_data: Dict,
-        report_text: str = None
+        report_text: str = None,
+        section_workers: Optional[int] = None
     ):
-        """PDF 리포트 생성"""
-        
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm
-        )
+        """
+        PDF 리포트 생성
         
-        story = []
+        section_workers(기본값: PDF_SECTION_WORKERS)가 2 이상이고 pypdf가 설치되어 있으면
+        섹션별로 워커 프로세스에서 개별 PDF를 렌더링한 뒤 순서대로 병합한다 (병렬 렌더링 모드).
+        각 섹션은 별도 문서로 빌드되므로 페이지 번호, 내부 링크, 북마크처럼 문서 전체에
+        걸친 상태는 섹션 간에 이어지지 않는다. 현재 보고서는 이를 사용하지 않으며
+        섹션마다 새 페이지에서 시작하므로 페이지 구성과 본문 텍스트는 단일 빌드와 같다.
         
-        # 1. 표지
-        story.extend(self._create_cover_page(services))
-        story.append(PageBreak())
+        페이지 단위 스트리밍 출력은 아니다. 단일 빌드는 전체 플로어블 목록을,
+        병렬 모드는 병합된 전체 페이지를 메모리에 둔 뒤 파일로 기록한다.
+        """
         
-        # 2. 목차
-        story.extend(self._create_table_of_contents())
-        story.append(PageBreak())
+        sections = self._section_specs(services, detailed_data)
+        workers = PDF_SECTION_WORKERS if section_workers is None else section_workers
         
-        # 3. Executive Summary
-        story.extend(self._create_executive_summary(services, detailed_data))
-        story.append(PageBreak())
+        if workers > 1 and PdfWriter is not None:
+            self._generate_by_sections(output_path, sections, workers)
+        else:
+            story = []
+            for i, (builder, args) in enumerate(sections):
+                if i > 0:
+                    story.append(PageBreak())
+                story.extend(getattr(self, builder)(*args))
+            
+            self._build_document(output_path, story)
         
-        # 4. 평가 방법론
-        story.extend(self._create_methodology())
-        story.append(PageBreak())
+        print(f"✅ 상세 PDF 생성 완료: {output_path}")
+    
+    def _section_specs(self, services: List[str], detailed_data: Dict) -> List[Tuple[str, tuple]]:
+        """보고서 섹션 목록 (빌더 메서드명, 인자) - 섹션 사이에는 페이지 나눔"""
+        sections = [
+            # 1. 표지
+            ('_create_cover_page', (services,)),
+            # 2. 목차
+            ('_create_table_of_contents', ()),
+            # 3. Executive Summary
+            ('_create_executive_summary', (services, detailed_data)),
+            # 4. 평가 방법론
+            ('_create_methodology', ()),
+        ]
         
         # 5. 서비스별 상세 분석
         for service in services:
-            story.extend(self._create_detailed_service_analysis(service, detailed_data))
-            story.append(PageBreak())
+            sections.append(('_create_detailed_service_analysis', (service, detailed_data)))
         
         # 6. 비교 분석 (2개 이상)
         if len(services) >= 2:
-            story.extend(self._create_comparison_analysis(services, detailed_data))
-            story.append(PageBreak())
-        
-        # 7. 종합 권고사항
-        story.extend(self._create_recommendations(services, detailed_data))
-        story.append(PageBreak())
-        
-        # 8. 참고문헌
-        story.extend(self._create_references())
-        story.append(PageBreak())
-        
-        # 9. 부록
-        story.extend(self._create_appendix())
-        
-        # PDF 생성
+            sections.append(('_create_comparison_analysis', (services, detailed_data)))
+        
+        sections.extend([
+            # 7. 종합 권고사항
+            ('_create_recommendations', (services, detailed_data)),
+            # 8. 참고문헌
+            ('_create_references', ()),
+            # 9. 부록
+            ('_create_appendix', ()),
+        ])
+        
+        return sections
+    
+    def _build_document(self, output_path: str, story: List):
+        """플로어블 목록을 A4 문서로 빌드"""
+        doc = SimpleDocTemplate(
+            output_path,
+            pagesize=A4,
+            rightMargin=2*cm,
+            leftMargin=2*cm,
+            topMargin=2*cm,
+            bottomMargin=2*cm
+        )
         doc.build(story)
-        print(f"✅ 상세 PDF 생성 완료: {output_path}")
+    
+    def _generate_by_sections(
+        self,
+        output_path: str,
+        sections: List[Tuple[str, tuple]],
+        workers: int
+    ):
+        """
+        섹션별 병렬 렌더링 후 병합
+        
+        메인 프로세스는 플로어블 목록을 만들지 않지만, 병합된 페이지는 PdfWriter에
+        모두 올린 뒤 한 번에 기록한다.
+        """
+        with tempfile.TemporaryDirectory(prefix="ethics_pdf_") as tmp_dir:
+            jobs = [
+                (builder, args, os.path.join(tmp_dir, f"section_{i:03d}.pdf"))
+                for i, (builder, args) in enumerate(sections)
+            ]
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                section_paths = list(executor.map(_render_section, jobs))
+            
+            writer = PdfWriter()
+            for path in section_paths:
+                writer.append(path)
+            
+            with open(output_path, 'wb') as f:
+                writer.write(f)
     
     def _create_cover_page(self, services: List[str]) -> List:
         """표지 페이지"""
@@ -845,4 +890,12 @@ OECD AI Principles 등 국제 표준을 기준으로 5개 차원(공정성, 프
         elif score >= 2.0:
             return "D"
         else:
-            return "F"
\ No newline at end of file
+            return "F"
+
+
+def _render_section(job: Tuple[str, tuple, str]) -> str:
+    """워커 프로세스에서 섹션 하나를 독립된 PDF 파일로 렌더링"""
+    builder, args, output_path = job
+    generator = EnhancedPDFReportGenerator()
+    generator._build_document(output_path, getattr(generator, builder)(*args))
+    return output_path
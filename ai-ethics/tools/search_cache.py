@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config.settings import (
+    SEARCH_CACHE_PATH,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL
+)
+
+
+class SearchCache:
+    """웹 검색 결과 디스크 캐시 (SQLite, TTL + LRU 제거)"""
+
+    def __init__(
+        self,
+        db_path: str = SEARCH_CACHE_PATH,
+        max_entries: int = SEARCH_CACHE_MAX_ENTRIES,
+        ttl: Optional[Dict[str, int]] = None
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl = ttl or SEARCH_CACHE_TTL
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                query_type TEXT NOT NULL,
+                results TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_access ON search_cache (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, max_results: int, search_depth: str) -> str:
+        """정규화된 쿼리 + max_results + depth 기반 콘텐츠 주소 키"""
+        normalized = " ".join(query.lower().split())
+        payload = json.dumps(
+            [normalized, max_results, search_depth],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """캐시 조회 (만료된 항목은 삭제 후 미스 처리)"""
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, expires_at FROM search_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            results, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(results)
+
+    def set(self, key: str, query_type: str, results: List[Dict]):
+        """캐시 저장 (질의 유형별 TTL 적용, 용량 초과 시 LRU 제거)"""
+        now = time.time()
+        ttl = self.ttl.get(query_type, self.ttl.get("default", 86400))
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO search_cache
+                    (key, query_type, results, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, query_type, json.dumps(results, ensure_ascii=False), now, now + ttl, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float):
+        """만료 항목 및 LRU 초과분 제거 (lock 보유 상태에서 호출)"""
+        self._conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+
+        count = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                """
+                DELETE FROM search_cache WHERE key IN (
+                    SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?
+                )
+                """,
+                (overflow,)
+            )
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """캐시 통계 (hit/miss 카운터 포함)"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries
+        }
@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple
+
+from config.settings import SEARCH_PLAN_MAX_WORKERS
+from tools.search_tools import SearchTools
+
+
+class SearchPlan:
+    """
+    실행(run) 단위 검색 계획
+
+    에이전트들이 필요로 하는 (서비스, 질의 유형) 조합을 모아 고유 질의를 한 번씩만
+    동시에 실행하고, 같은 질의를 요청한 에이전트들에게 결과를 나누어 준다.
+    SearchTools.search_service_info와 같은 인터페이스를 제공하므로 에이전트에
+    그대로 전달할 수 있다.
+    """
+
+    def __init__(
+        self,
+        search_tools: SearchTools,
+        max_workers: int = SEARCH_PLAN_MAX_WORKERS
+    ):
+        self.search_tools = search_tools
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self.requested = 0
+
+    def __enter__(self) -> "SearchPlan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def prefetch(self, service_names: Iterable[str], query_types: Iterable[str]):
+        """계획된 모든 질의를 미리 동시 실행"""
+        query_types = list(dict.fromkeys(query_types))
+        for service_name in service_names:
+            for query_type in query_types:
+                self._submit(service_name, query_type)
+
+    def search_service_info(
+        self,
+        service_name: str,
+        query_type: str = "overview"
+    ) -> List[Dict]:
+        """계획된 검색 결과 반환 (계획에 없던 질의는 이 시점에 실행)"""
+        with self._lock:
+            self.requested += 1
+        future = self._submit(service_name, query_type)
+        return list(future.result())
+
+    def _submit(self, service_name: str, query_type: str) -> Future:
+        key = (service_name, query_type)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(
+                    self.search_tools.search_service_info,
+                    service_name=service_name,
+                    query_type=query_type
+                )
+                self._futures[key] = future
+        return future
+
+    def stats(self) -> Dict:
+        """요청 수 대비 실제 실행된 고유 질의 수"""
+        with self._lock:
+            return {
+                "requested": self.requested,
+                "unique_queries": len(self._futures)
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
@@ -1,12 +1,17 @@
 from tavily import TavilyClient
-from typing import List, Dict
-from config.settings import TAVILY_API_KEY
+from typing import List, Dict, Optional
+from config.settings import TAVILY_API_KEY, SEARCH_CACHE_ENABLED
+from tools.search_cache import SearchCache
 
 class SearchTools:
     """웹 검색 도구"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[SearchCache] = None):
         self.client = TavilyClient(api_key=TAVILY_API_KEY)
+        
+        if cache is None and SEARCH_CACHE_ENABLED:
+            cache = SearchCache()
+        self.cache = cache
     
     def search_service_info(
         self, 
@@ -27,14 +32,14 @@ class SearchTools:
         query = query_templates.get(query_type, f"{service_name} {query_type}")
         
         try:
-            results = self.client.search(
+            results = self._search(
                 query=query,
-                max_results=5,
-                search_depth="advanced"
+                query_type=query_type,
+                max_results=5
             )
             
             formatted_results = []
-            for result in results.get('results', []):
+            for result in results:
                 formatted_results.append({
                     "title": result.get('title', ''),
                     "url": result.get('url', ''),
@@ -59,14 +64,14 @@ class SearchTools:
         query = f"{guideline_name} AI {topic} requirements guidelines standards"
         
         try:
-            results = self.client.search(
+            results = self._search(
                 query=query,
-                max_results=3,
-                search_depth="advanced"
+                query_type="guideline",
+                max_results=3
             )
             
             formatted_results = []
-            for result in results.get('results', []):
+            for result in results:
                 formatted_results.append({
                     "title": result.get('title', ''),
                     "url": result.get('url', ''),
@@ -80,4 +85,31 @@ class SearchTools:
         except Exception as e:
             print(f"  ⚠️  가이드라인 검색 오류: {e}")
             return []
-
+    
+    def _search(
+        self,
+        query: str,
+        query_type: str,
+        max_results: int,
+        search_depth: str = "advanced"
+    ) -> List[Dict]:
+        """Tavily 검색 (캐시 우선 조회, 원본 결과 목록 반환)"""
+        
+        key = None
+        if self.cache:
+            key = self.cache.make_key(query, max_results, search_depth)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        response = self.client.search(
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth
+        )
+        results = response.get('results', [])
+        
+        if self.cache:
+            self.cache.set(key, query_type, results)
+        
+        return results
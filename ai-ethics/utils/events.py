@@ -0,0 +1,28 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class ProgressEvent:
+    """분석 진행 이벤트"""
+
+    # stage: 단계 시작 / service_done: 서비스 파이프라인 완료
+    # report_summary: 요약 완료 / report_token: 본문 토큰 스트림
+    type: str
+    message: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+EventCallback = Callable[[ProgressEvent], None]
+
+
+def emit(callback: Optional[EventCallback], type: str, message: str = "", **data):
+    """콜백이 지정된 경우에만 이벤트 전달 (콜백 오류는 분석을 중단시키지 않음)"""
+    if callback is None:
+        return
+    try:
+        callback(ProgressEvent(type=type, message=message, data=data))
+    except Exception as e:
+        print(f"  ⚠️  이벤트 콜백 오류: {e}")
@@ -1,69 +1,75 @@
 from langgraph.graph import StateGraph, END
-from typing import Dict, List
-from utils.state import EthicsAssessmentState
+from langgraph.types import Send
+from langchain_core.runnables import RunnableConfig
+from typing import Dict, List, Union
+
+from config.settings import ETHICS_GUIDELINES, SERVICE_PIPELINE_MAX_WORKERS
+from utils.state import EthicsAssessmentState, ServicePipelineState
 from agents.service_analyzer import ServiceAnalyzer
 from agents.risk_assessor import RiskAssessor
 from agents.improvement_advisor import ImprovementAdvisor
 from agents.report_writer import ReportWriter
 from tools.rag_tools import RAGTools
+from tools.search_tools import SearchTools
+from tools.search_planner import SearchPlan
 
 class EthicsAssessmentGraph:
-    """AI 윤리성 진단 워크플로우 그래프"""
+    """
+    AI 윤리성 진단 워크플로우 그래프
+    
+    initialize → (서비스별 Send 분기) service_pipeline × N → compare_services → generate_report
+    
+    각 서비스는 분석 → 평가 → 개선안 서브그래프를 독립적으로 실행하고,
+    결과는 상태의 merge_dicts 리듀서로 {서비스명: 결과} 형태로 병합된다.
+    """
     
     def __init__(self):
-        self.service_analyzer = ServiceAnalyzer()
         self.rag_tools = RAGTools()
-        self.risk_assessor = RiskAssessor(self.rag_tools)
+        self.search_tools = SearchTools()
+        self.service_analyzer = ServiceAnalyzer(self.search_tools)
+        self.risk_assessor = RiskAssessor(self.rag_tools, self.search_tools)
         self.improvement_advisor = ImprovementAdvisor()
         self.report_writer = ReportWriter()
         
         # 그래프 구성
+        self.service_graph = self._build_service_graph()
         self.graph = self._build_graph()
     
-    def _build_graph(self) -> StateGraph:
+    def _build_service_graph(self):
+        """단일 서비스 서브그래프: 서비스 분석 → 리스크 평가 → 개선안 제안"""
+        
+        workflow = StateGraph(ServicePipelineState)
+        
+        workflow.add_node("analyze_service", self.analyze_service_node)
+        workflow.add_node("assess_risks", self.assess_risks_node)
+        workflow.add_node("suggest_improvements", self.suggest_improvements_node)
+        
+        workflow.set_entry_point("analyze_service")
+        workflow.add_edge("analyze_service", "assess_risks")
+        workflow.add_edge("assess_risks", "suggest_improvements")
+        workflow.add_edge("suggest_improvements", END)
+        
+        return workflow.compile()
+    
+    def _build_graph(self):
         """LangGraph 구성"""
         
         workflow = StateGraph(EthicsAssessmentState)
         
         # 노드 추가
         workflow.add_node("initialize", self.initialize_node)
-        workflow.add_node("analyze_service", self.analyze_service_node)
-        workflow.add_node("assess_risks", self.assess_risks_node)
-        workflow.add_node("suggest_improvements", self.suggest_improvements_node)
+        workflow.add_node("service_pipeline", self.service_pipeline_node)
         workflow.add_node("compare_services", self.compare_services_node)
         workflow.add_node("generate_report", self.generate_report_node)
         
-        # 엣지 정의
+        # 엣지 정의 - 서비스 수만큼 service_pipeline으로 분기 후 compare_services에서 합류
         workflow.set_entry_point("initialize")
-        
-        workflow.add_edge("initialize", "analyze_service")
         workflow.add_conditional_edges(
-            "analyze_service",
-            self.should_continue_analysis,
-            {
-                "continue": "analyze_service",
-                "done": "assess_risks"
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "assess_risks",
-            self.should_continue_assessment,
-            {
-                "continue": "assess_risks",
-                "done": "suggest_improvements"
-            }
-        )
-        
-        workflow.add_conditional_edges(
-            "suggest_improvements",
-            self.should_continue_improvements,
-            {
-                "continue": "suggest_improvements",
-                "done": "compare_services"
-            }
+            "initialize",
+            self.fan_out_services,
+            ["service_pipeline", "compare_services"]
         )
-        
+        workflow.add_edge("service_pipeline", "compare_services")
         workflow.add_edge("compare_services", "generate_report")
         workflow.add_edge("generate_report", END)
         
@@ -71,106 +77,84 @@ class EthicsAssessmentGraph:
     
     # ========== 노드 함수들 ==========
     
-    def initialize_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def initialize_node(self, state: EthicsAssessmentState) -> Dict:
         """초기화 노드"""
         print("\n🚀 AI 윤리성 리스크 진단 시작\n")
         
         # RAG 초기화
         print("📚 윤리 가이드라인 문서 로딩 중...")
-        success = self.rag_tools.load_guidelines(state["guidelines"])
-        
-        if not success:
-            print("⚠️  일부 가이드라인 문서를 로드하지 못했습니다.")
-        
-        # 초기화
-        state["service_analysis"] = {}
-        state["risk_assessment"] = {}
-        state["improvement_suggestions"] = {}
-        state["references"] = []
-        
-        return state
+        if not self.rag_tools.load_guidelines():
+            print("⚠️  가이드라인 검색 인덱스를 준비하지 못했습니다.")
+        
+        guidelines = state.get("guidelines") or ETHICS_GUIDELINES
+        self.rag_tools.build_context_table(guidelines)
+        
+        return {
+            "guidelines": guidelines,
+            "service_analysis": {},
+            "risk_assessment": {},
+            "improvement_suggestions": {}
+        }
+    
+    def fan_out_services(self, state: EthicsAssessmentState) -> Union[str, List[Send]]:
+        """
+        서비스별 서브그래프 실행 분기 (같은 super-step에서 병렬 실행)
+        
+        서비스가 없으면 분기 없이 compare_services로 이동해 보고서 생성까지 진행한다.
+        """
+        if not state.get("service_names"):
+            print("  ⚠️  분석할 서비스가 없습니다.")
+            return "compare_services"
+        
+        print(f"  ⚡ {len(state['service_names'])}개 서비스 병렬 진행")
+        return [
+            Send("service_pipeline", {"service_name": service_name})
+            for service_name in state["service_names"]
+        ]
     
-    def analyze_service_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def service_pipeline_node(self, state: ServicePipelineState, config: RunnableConfig) -> Dict:
+        """서비스 서브그래프 실행 후 결과를 {서비스명: 결과} 업데이트로 변환"""
+        service_name = state["service_name"]
+        result = self.service_graph.invoke({"service_name": service_name}, config)
+        
+        print(f"  ✅ {service_name} 분석/평가/개선안 완료")
+        
+        return {
+            "service_analysis": {service_name: result["analysis"]},
+            "risk_assessment": {service_name: result["assessment"]},
+            "improvement_suggestions": {service_name: result["improvements"]}
+        }
+    
+    def analyze_service_node(self, state: ServicePipelineState, config: RunnableConfig) -> Dict:
         """서비스 분석 노드"""
-        # 현재 분석할 서비스 결정
-        analyzed = len(state.get("service_analysis", {}))
-        if analyzed >= len(state["service_names"]):
-            return state
-        
-        service_name = state["service_names"][analyzed]
-        state["current_service"] = service_name
-        
-        # 서비스 분석 수행
-        analysis = self.service_analyzer.analyze_service(service_name)
-        
-        # State 업데이트
-        if "service_analysis" not in state:
-            state["service_analysis"] = {}
-        
-        state["service_analysis"][service_name] = analysis
-        
-        return state
+        analysis = self.service_analyzer.analyze_service(
+            state["service_name"], self._search_plan(config)
+        )
+        return {"analysis": analysis}
     
-    def assess_risks_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def assess_risks_node(self, state: ServicePipelineState, config: RunnableConfig) -> Dict:
         """리스크 평가 노드"""
-        # 현재 평가할 서비스 결정
-        assessed = len(state.get("risk_assessment", {}))
-        if assessed >= len(state["service_names"]):
-            return state
-        
-        service_name = state["service_names"][assessed]
-        state["current_service"] = service_name
-        
-        service_analysis = state["service_analysis"][service_name]
-        
-        # 리스크 평가 수행
         assessment = self.risk_assessor.assess_risks(
-            service_name=service_name,
-            service_analysis=service_analysis,
-            guidelines=state["guidelines"]
+            service_name=state["service_name"],
+            service_analysis=state["analysis"],
+            search_plan=self._search_plan(config)
         )
-        
-        # State 업데이트
-        if "risk_assessment" not in state:
-            state["risk_assessment"] = {}
-        
-        state["risk_assessment"][service_name] = assessment
-        
-        return state
+        return {"assessment": assessment}
     
-    def suggest_improvements_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def suggest_improvements_node(self, state: ServicePipelineState) -> Dict:
         """개선안 제안 노드"""
-        # 현재 개선안 생성할 서비스 결정
-        improved = len(state.get("improvement_suggestions", {}))
-        if improved >= len(state["service_names"]):
-            return state
-        
-        service_name = state["service_names"][improved]
-        state["current_service"] = service_name
-        
-        risk_assessment = state["risk_assessment"][service_name]
-        
-        # 개선안 생성
         improvements = self.improvement_advisor.suggest_improvements(
-            service_name=service_name,
-            risk_assessment=risk_assessment
+            service_name=state["service_name"],
+            risk_assessment=state["assessment"]
         )
-        
-        # State 업데이트
-        if "improvement_suggestions" not in state:
-            state["improvement_suggestions"] = {}
-        
-        state["improvement_suggestions"][service_name] = improvements
-        
-        return state
+        return {"improvements": improvements}
     
-    def compare_services_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def compare_services_node(self, state: EthicsAssessmentState) -> Dict:
         """서비스 비교 노드"""
         if len(state["service_names"]) < 2:
-            state["comparison_analysis"] = ""
-            return state
+            return {"comparison_analysis": ""}
         
-        # 비교 분석 데이터 구성
+        # 비교 분석 데이터 구성 (입력 순서 유지)
         services_data = {}
         for service in state["service_names"]:
             services_data[service] = {
@@ -182,65 +166,44 @@ class EthicsAssessmentGraph:
         # 비교 분석 수행
         comparison = self.improvement_advisor.compare_services(services_data)
         
-        state["comparison_analysis"] = comparison
-        
-        return state
+        return {"comparison_analysis": comparison}
     
-    def generate_report_node(self, state: EthicsAssessmentState) -> EthicsAssessmentState:
+    def generate_report_node(self, state: EthicsAssessmentState) -> Dict:
         """보고서 생성 노드"""
+        services = state["service_names"]
+        
+        # 병렬 브랜치의 완료 순서와 무관하게 입력 순서로 정렬
+        def ordered(results: Dict) -> Dict:
+            return {name: results[name] for name in services if name in results}
         
         # 최종 보고서 생성
         final_report = self.report_writer.generate_report(
-            services=state["service_names"],
-            service_analyses=state["service_analysis"],
-            risk_assessments=state["risk_assessment"],
-            improvement_suggestions=state["improvement_suggestions"],
-            comparison_analysis=state.get("comparison_analysis", ""),
-            references=state.get("references", [])
+            services=services,
+            service_analyses=ordered(state["service_analysis"]),
+            risk_assessments=ordered(state["risk_assessment"]),
+            improvement_suggestions=ordered(state["improvement_suggestions"]),
+            comparison_analysis=state.get("comparison_analysis", "")
         )
         
-        state["final_report"] = final_report
-        
-        return state
-    
-    # ========== 조건 함수들 ==========
-    
-    def should_continue_analysis(self, state: EthicsAssessmentState) -> str:
-        """다음 서비스 분석 계속 여부"""
-        analyzed = len(state.get("service_analysis", {}))
-        total = len(state["service_names"])
-        
-        print(f"  📊 진행 상황: {analyzed}/{total} 서비스 분석 완료")
-        
-        if analyzed < total:
-            return "continue"
-        
-        return "done"
-    
-    def should_continue_assessment(self, state: EthicsAssessmentState) -> str:
-        """다음 서비스 평가 계속 여부"""
-        assessed = len(state.get("risk_assessment", {}))
-        total = len(state["service_names"])
-        
-        print(f"  📊 진행 상황: {assessed}/{total} 서비스 평가 완료")
-        
-        if assessed < total:
-            return "continue"
-        
-        return "done"
+        return {"final_report": final_report}
     
-    def should_continue_improvements(self, state: EthicsAssessmentState) -> str:
-        """다음 서비스 개선안 계속 여부"""
-        improved = len(state.get("improvement_suggestions", {}))
-        total = len(state["service_names"])
-        
-        print(f"  📊 진행 상황: {improved}/{total} 서비스 개선안 완료")
-        
-        if improved < total:
-            return "continue"
-        
-        return "done"
+    @staticmethod
+    def _search_plan(config: RunnableConfig):
+        """실행 단위 공유 검색 계획 (run()에서 configurable로 전달)"""
+        return (config or {}).get("configurable", {}).get("search_plan")
     
     def run(self, initial_state: Dict) -> Dict:
-        """그래프 실행"""
-        return self.graph.invoke(initial_state)
\ No newline at end of file
+        """그래프 실행 (서비스 브랜치는 최대 SERVICE_PIPELINE_MAX_WORKERS개 동시 실행)"""
+        service_names = initial_state["service_names"]
+        
+        with SearchPlan(self.search_tools) as search_plan:
+            query_types = self.service_analyzer.QUERY_TYPES + self.risk_assessor.query_types
+            search_plan.prefetch(service_names, query_types)
+            
+            return self.graph.invoke(
+                initial_state,
+                {
+                    "max_concurrency": SERVICE_PIPELINE_MAX_WORKERS,
+                    "configurable": {"search_plan": search_plan}
+                }
+            )
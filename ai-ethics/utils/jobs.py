@@ -0,0 +1,145 @@
+import os
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from config.settings import JOB_MAX_WORKERS, JOB_OUTPUT_DIR, JOB_REGISTRY_MAX
+from utils.events import ProgressEvent
+from utils.helpers import load_json
+
+
+@dataclass
+class AnalysisJob:
+    """백그라운드 분석 작업"""
+
+    run_id: str
+    services: List[str]
+    output_dir: str
+    status: str = "queued"  # queued / running / done / failed
+    events: List[ProgressEvent] = field(default_factory=list)
+    summary_text: str = ""
+    report_text: str = ""
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished_at: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def handle_event(self, event: ProgressEvent):
+        """분석 스레드에서 호출되는 이벤트 콜백"""
+        with self._lock:
+            if event.type == "report_token":
+                self.report_text += event.data.get("text", "")
+            elif event.type == "report_summary":
+                self.summary_text = event.data.get("text", "")
+            else:
+                self.events.append(event)
+
+    def snapshot(self) -> Dict:
+        """UI 폴링용 현재 상태 사본"""
+        with self._lock:
+            return {
+                "run_id": self.run_id,
+                "services": list(self.services),
+                "status": self.status,
+                "events": list(self.events),
+                "summary_text": self.summary_text,
+                "report_text": self.report_text,
+                "error": self.error
+            }
+
+
+class JobManager:
+    """
+    분석 작업 실행기
+
+    제한된 워커 풀에서 분석을 실행하고, 실행 ID(run_id)별 작업 레지스트리를 유지한다.
+    각 작업은 output_dir/run_id 하위에 결과를 저장하므로 동시에 실행되는 작업끼리
+    출력 파일이 섞이지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = JOB_MAX_WORKERS,
+        base_output_dir: str = JOB_OUTPUT_DIR,
+        max_jobs: int = JOB_REGISTRY_MAX
+    ):
+        self.base_output_dir = base_output_dir
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs: Dict[str, AnalysisJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, services: List[str], target: Callable[..., Dict]) -> str:
+        """
+        분석 작업 등록
+
+        target은 AIEthicsAssessmentSystem.analyze_services와 같은 시그니처
+        (service_names, output_dir, on_event)를 가져야 한다.
+        """
+        run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        job = AnalysisJob(
+            run_id=run_id,
+            services=list(services),
+            output_dir=os.path.join(self.base_output_dir, run_id)
+        )
+
+        with self._lock:
+            self._jobs[run_id] = job
+            self._prune()
+
+        self._executor.submit(self._run, job, target)
+        return run_id
+
+    def get(self, run_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            return self._jobs.get(run_id)
+
+    def active_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def _run(self, job: AnalysisJob, target: Callable[..., Dict]):
+        # 상태 변경은 snapshot()과 같은 lock으로 보호 (UI가 중간 상태를 읽지 않도록)
+        with job._lock:
+            job.status = "running"
+        try:
+            report = target(
+                service_names=job.services,
+                output_dir=job.output_dir,
+                on_event=job.handle_event
+            )
+            result = {
+                'services': job.services,
+                'report': report['markdown_report'],
+                'detailed_data': load_json(report['data_path']),
+                'pdf_path': report.get('pdf_path'),
+                'run_id': job.run_id,
+                'timestamp': datetime.now().isoformat()
+            }
+        except Exception as e:
+            with job._lock:
+                job.error = f"{e}\n\n{traceback.format_exc()}"
+                job.status = "failed"
+                job.finished_at = datetime.now().isoformat()
+            return
+
+        with job._lock:
+            job.result = result
+            job.status = "done"
+            job.finished_at = datetime.now().isoformat()
+
+    def _prune(self):
+        """레지스트리 크기 제한 - 오래된 완료 작업부터 제거 (lock 보유 상태에서 호출)"""
+        finished = [run_id for run_id, job in self._jobs.items() if job.finished]
+        overflow = len(self._jobs) - self.max_jobs
+        for run_id in finished[:max(0, overflow)]:
+            del self._jobs[run_id]
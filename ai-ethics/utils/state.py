@@ -1,6 +1,38 @@
-from typing import Dict, List, Any
+from typing import Annotated, Dict, List, Any, TypedDict
 from dataclasses import dataclass, field
 
+
+def merge_dicts(left: Dict, right: Dict) -> Dict:
+    """서비스별 결과 dict 병합 리듀서 (병렬 브랜치의 업데이트를 하나로 합침)"""
+    return {**(left or {}), **(right or {})}
+
+
+class EthicsAssessmentState(TypedDict, total=False):
+    """LangGraph 워크플로우 상태 (utils/graph.py)"""
+    
+    # 입력
+    service_names: List[str]
+    guidelines: List[str]
+    
+    # 서비스별 결과 - 병렬 서비스 브랜치가 {서비스명: 결과}를 반환하면 merge_dicts로 병합
+    service_analysis: Annotated[Dict[str, Dict], merge_dicts]
+    risk_assessment: Annotated[Dict[str, Dict], merge_dicts]
+    improvement_suggestions: Annotated[Dict[str, List[Dict]], merge_dicts]
+    
+    # 비교 분석 및 보고서
+    comparison_analysis: str
+    final_report: Dict[str, str]
+
+
+class ServicePipelineState(TypedDict, total=False):
+    """단일 서비스 서브그래프 상태 (분석 → 평가 → 개선안)"""
+    
+    service_name: str
+    analysis: Dict
+    assessment: Dict
+    improvements: List[Dict]
+
+
 @dataclass
 class AssessmentState:
     """평가 상태 관리"""
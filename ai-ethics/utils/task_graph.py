@@ -0,0 +1,49 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Tuple
+
+# 작업 이름 -> (실행 함수, 선행 작업 이름 목록)
+TaskSpec = Dict[str, Tuple[Callable[..., Any], List[str]]]
+
+
+def run_task_graph(tasks: TaskSpec, max_workers: int = 4) -> Dict[str, Any]:
+    """
+    의존성 그래프(DAG) 형태의 작업 실행
+
+    선행 작업이 모두 끝난 작업부터 스레드 풀에서 동시에 실행하며,
+    각 실행 함수는 선행 작업 결과를 이름별 키워드 인자로 전달받는다.
+    작업 중 하나라도 실패하면 남은 작업을 취소하고 예외를 그대로 전달한다.
+    """
+    for name, (_, deps) in tasks.items():
+        unknown = [dep for dep in deps if dep not in tasks]
+        if unknown:
+            raise ValueError(f"알 수 없는 선행 작업: {name} -> {unknown}")
+
+    results: Dict[str, Any] = {}
+    pending = dict(tasks)
+    running: Dict[Future, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            ready = [
+                name for name, (_, deps) in pending.items()
+                if all(dep in results for dep in deps)
+            ]
+            for name in ready:
+                fn, deps = pending.pop(name)
+                kwargs = {dep: results[dep] for dep in deps}
+                running[executor.submit(fn, **kwargs)] = name
+
+            if not running:
+                raise ValueError(f"순환 의존성 감지: {list(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    raise
+
+    return results
@@ -0,0 +1,49 @@
+from functools import lru_cache
+
+from config.settings import LLM_MODEL
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # 미설치 시 estimate_tokens 추정치 사용
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_tokens(text: str) -> int:
+    """tiktoken 없이 쓰는 토큰 수 추정 (ASCII 약 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ch.isascii())
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def count_tokens(text: str, model: str = LLM_MODEL) -> int:
+    """텍스트의 토큰 수"""
+    if not text:
+        return 0
+    if tiktoken is None:
+        return estimate_tokens(text)
+    return len(_get_encoding(model).encode(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = LLM_MODEL) -> str:
+    """텍스트를 max_tokens 이하로 자름 (앞부분 유지)"""
+    if max_tokens <= 0:
+        return ""
+    if tiktoken is not None:
+        encoding = _get_encoding(model)
+        tokens = encoding.encode(text)
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+    total = estimate_tokens(text)
+    if total <= max_tokens:
+        return text
+    cut = len(text) * max_tokens // total
+    while cut > 0 and estimate_tokens(text[:cut]) > max_tokens:
+        cut -= max(1, cut // 20)
+    return text[:max(cut, 0)]